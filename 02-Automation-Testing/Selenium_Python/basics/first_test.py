@@ -8,6 +8,8 @@ Author: Muhammad Yasin Asif
 Portfolio: QA Engineer Portfolio
 """
 
+import os
+import sys
 import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -15,7 +17,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+
+# Cached driver lookup lives at the repository root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from driver_resolver import resolve_driver_path
 
 
 # =============================================================================
@@ -36,7 +41,7 @@ def example_basic_operations():
     # Setup Chrome driver
     options = Options()
     options.add_argument('--start-maximized')
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_driver_path('chrome'))
     driver = webdriver.Chrome(service=service, options=options)
     
     try:
@@ -71,7 +76,7 @@ def example_finding_elements():
     
     options = Options()
     options.add_argument('--start-maximized')
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_driver_path('chrome'))
     driver = webdriver.Chrome(service=service, options=options)
     
     try:
@@ -117,7 +122,7 @@ def example_element_interactions():
     
     options = Options()
     options.add_argument('--start-maximized')
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_driver_path('chrome'))
     driver = webdriver.Chrome(service=service, options=options)
     
     try:
@@ -168,7 +173,7 @@ def example_explicit_waits():
     
     options = Options()
     options.add_argument('--start-maximized')
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_driver_path('chrome'))
     driver = webdriver.Chrome(service=service, options=options)
     
     try:
@@ -229,7 +234,7 @@ def test_login_valid_credentials():
     # Setup
     options = Options()
     options.add_argument('--start-maximized')
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_driver_path('chrome'))
     driver = webdriver.Chrome(service=service, options=options)
     wait = WebDriverWait(driver, 10)
     
@@ -305,7 +310,7 @@ def test_login_invalid_credentials():
     # Setup
     options = Options()
     options.add_argument('--start-maximized')
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_driver_path('chrome'))
     driver = webdriver.Chrome(service=service, options=options)
     wait = WebDriverWait(driver, 10)
     
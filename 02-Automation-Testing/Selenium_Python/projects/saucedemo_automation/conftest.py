@@ -8,63 +8,144 @@ Portfolio: QA Engineer Portfolio
 """
 
 import pytest
+import glob
 import os
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import sys
 
-from pages import LoginPage
+# Framework modules (driver_setup, browser_pool, ...) live at the repository root
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+CONFIG_PATH = os.path.join(REPO_ROOT, 'config.yaml')
+REPORTS_DIR = os.path.join(os.path.dirname(__file__), 'reports')
+
+from selenium.common.exceptions import WebDriverException
+
+from config_loader import get_config
+from driver_setup import DriverFactory
+from browser_pool import BrowserPool
+from driver_resolver import get_resolver
+from grid_connection import get_latency_stats
+from startup_timing import get_collector
+from pages import BasePage, CheckoutOverviewPage, LoginPage, WaitPolicy, get_cache_totals
+from plugins import artifacts, parallel, profiler
+from utils import AuthStateCache, CartState, NavigationPlanner
+
+
+POOL_STATS_KEY = pytest.StashKey()
+BLOCKER_KEY = pytest.StashKey()
+PREFETCH_STATS_KEY = pytest.StashKey()
+NAVIGATION_KEY = pytest.StashKey()
+NAVIGATION_COSTS = os.path.join(REPORTS_DIR, 'navigation_costs.json')
+RESOURCE_SIZES = os.path.join(REPORTS_DIR, 'resource_sizes.json')
 
 
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    """
+    Session-wide pool of warm browser sessions.
+    
+    Tests run one at a time per process (parallel workers are separate
+    processes), so the pool holds a single session. With browser.prefetch
+    a broken session's replacement starts in the background instead of
+    during teardown; no spare browser is kept running otherwise.
+    
+    Yields:
+        BrowserPool instance
+    """
+    factory = DriverFactory(CONFIG_PATH)
+    pool = BrowserPool(factory)
+    request.config.stash[POOL_STATS_KEY] = pool.stats
+    request.config.stash[BLOCKER_KEY] = factory.resource_blocker
+    # Sizes of blocked resources measured unblocked in earlier runs
+    factory.resource_blocker.load_json(RESOURCE_SIZES)
+    pool.start()
+    
+    yield pool
+    
+    pool.close()
+    if not parallel.get_worker_id() and factory.resource_blocker.enabled:
+        factory.resource_blocker.write_json(RESOURCE_SIZES)
+
+
 @pytest.fixture(scope="function")
-def driver():
+def driver(request, browser_pool):
     """
-    Fixture to create and quit WebDriver for each test.
+    Fixture to lease a WebDriver from the pool for each test.
+    
+    The session is reset (cookies, storage, tabs, window size)
+    when it is returned to the pool, also when the test killed it (the
+    pool then replaces it). Tests marked allow_resources run with network
+    resource blocking switched off.
     
     Yields:
         WebDriver instance
     """
-    # Setup Chrome options
-    options = Options()
-    options.add_argument('--start-maximized')
-    options.add_argument('--disable-extensions')
-    options.add_argument('--disable-popup-blocking')
-    options.add_argument('--disable-notifications')
+    driver = browser_pool.lease()
+    try:
+        cache_before = get_cache_totals()
+        blocker = browser_pool.factory.resource_blocker
+        allow_resources = request.node.get_closest_marker("allow_resources") is not None
+        if allow_resources:
+            blocker.apply(driver, enabled=False)
+        
+        yield driver
+        
+        # Teardown (the session may be dead if the test crashed it)
+        blocked = None
+        try:
+            blocked = blocker.collect(driver)
+            if allow_resources:
+                blocker.apply(driver, enabled=True)
+        except WebDriverException as e:
+            print(f"Resource blocking report unavailable: {e.msg}")
+        if blocker.enabled:
+            requests = blocked['requests'] if blocked else "unknown"
+            estimate = blocked['bytes'] if blocked and blocked['bytes'] is not None else "unknown"
+            request.node.user_properties.append(("blocked_requests", requests))
+            request.node.user_properties.append(("blocked_bytes_estimate", estimate))
+        cache_after = get_cache_totals()
+        for key in ("hits", "misses", "stale", "round_trips_saved"):
+            request.node.user_properties.append(
+                (f"element_cache_{key}", cache_after[key] - cache_before[key]))
+    finally:
+        browser_pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def headless_factory(request):
+    """
+    Session-wide DriverFactory for headless sessions.
     
-    # Create driver
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.implicitly_wait(10)
+    With browser.prefetch enabled the next headless browser starts in the
+    background while the current test runs.
     
-    yield driver
+    Yields:
+        DriverFactory instance
+    """
+    factory = DriverFactory(CONFIG_PATH)
+    request.config.stash[PREFETCH_STATS_KEY] = factory.prefetch_stats
+    if factory.config.browser.prefetch:
+        factory.enable_prefetch(browser_name='chrome', headless=True)
     
-    # Teardown
-    driver.quit()
+    yield factory
+    
+    factory.disable_prefetch()
 
 
 @pytest.fixture(scope="function")
-def driver_headless():
+def driver_headless(headless_factory):
     """
     Fixture for headless browser testing.
     
     Yields:
         WebDriver instance in headless mode
     """
-    options = Options()
-    options.add_argument('--headless=new')
-    options.add_argument('--start-maximized')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.implicitly_wait(10)
+    driver = headless_factory.create_driver(browser_name='chrome', headless=True)
     
     yield driver
     
@@ -87,57 +168,220 @@ def login_page(driver):
     yield page
 
 
+@pytest.fixture(scope="session")
+def auth_state():
+    """
+    Session-wide cache of authenticated state per user type.
+    
+    Each user from config.yaml test_users logs in through the UI once;
+    later logins inject the captured cookies and localStorage.
+    
+    Returns:
+        AuthStateCache instance
+    """
+    return AuthStateCache(get_config(CONFIG_PATH).test_users)
+
+
 @pytest.fixture(scope="function")
-def logged_in_user(driver):
+def login_as(driver, auth_state):
     """
-    Fixture to provide logged-in state.
+    Fixture to log in as any configured user type.
     
     Args:
         driver: WebDriver fixture
+        auth_state: AuthStateCache fixture
+        
+    Returns:
+        Function taking a user type and returning the landing page
+    """
+    def _login(user_type: str = 'standard_user'):
+        return auth_state.login(driver, user_type)
+    return _login
+
+
+@pytest.fixture(scope="function")
+def logged_in_user(login_as):
+    """
+    Fixture to provide logged-in state.
+    
+    Uses the standard_user snapshot instead of typing credentials,
+    falling back to a UI login if the snapshot is rejected.
+    
+    Args:
+        login_as: login_as fixture
         
     Yields:
         InventoryPage instance (user logged in)
     """
-    login_page = LoginPage(driver)
-    login_page.open()
-    inventory_page = login_page.login_as_standard_user()
+    inventory_page = login_as('standard_user')
     yield inventory_page
 
 
+@pytest.fixture(scope="function")
+def cart_state(driver, logged_in_user):
+    """
+    Fixture to seed the cart without add-to-cart clicks.
+    
+    Args:
+        driver: WebDriver fixture
+        logged_in_user: logged_in_user fixture (session on the app origin)
+        
+    Returns:
+        CartState bound to the logged-in session
+    """
+    return CartState(driver)
+
+
+@pytest.fixture(scope="function")
+def checkout_overview(cart_state, reach_page):
+    """
+    Fixture to open the checkout overview without walking the checkout flow.
+    
+    The navigation planner picks the cheapest route - normally seeding the
+    cart and deep-linking CheckoutOverviewPage.URL - and falls back to the
+    cart -> checkout form -> continue UI path if the app rejects it.
+    
+    Args:
+        cart_state: cart_state fixture
+        reach_page: reach_page fixture
+        
+    Returns:
+        Function taking product slugs (and optional customer info / via_ui)
+        and returning the CheckoutOverviewPage
+    """
+    def _open(product_names, via_ui=False, **customer):
+        if via_ui:
+            return cart_state.open_checkout_overview(product_names, via_ui=True, **customer)
+        return reach_page(CheckoutOverviewPage, products=product_names, **customer)
+    return _open
+
+
+@pytest.fixture(scope="session")
+def navigation_planner(request):
+    """
+    Session-wide navigation planner.
+    
+    Starts from the edge costs measured by earlier runs
+    (reports/navigation_costs.json) and saves its measurements at the end
+    of a serial run; parallel workers only read the file.
+    
+    Yields:
+        NavigationPlanner instance
+    """
+    planner = NavigationPlanner()
+    planner.load_json(NAVIGATION_COSTS)
+    request.config.stash[NAVIGATION_KEY] = planner
+    
+    yield planner
+    
+    if not parallel.get_worker_id() and planner.measured:
+        planner.write_json(NAVIGATION_COSTS)
+
+
+@pytest.fixture(scope="function")
+def reach_page(driver, logged_in_user, navigation_planner):
+    """
+    Fixture to reach any page object by the cheapest route.
+    
+    Args:
+        driver: WebDriver fixture
+        logged_in_user: logged_in_user fixture (starting page)
+        navigation_planner: NavigationPlanner fixture
+        
+    Returns:
+        Function taking a page class (plus optional products, customer info
+        and current page) and returning that page
+    """
+    last = {'page': logged_in_user}
+    
+    def _reach(page_class, products=None, current=None, **customer):
+        page = navigation_planner.navigate(driver, page_class, current or last['page'],
+                                           products, **customer)
+        last['page'] = page
+        return page
+    return _reach
+
+
 # =============================================================================
 # PYTEST HOOKS
 # =============================================================================
 
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """
-    Hook to capture screenshots on test failure.
-    """
-    outcome = yield
-    report = outcome.get_result()
-    
-    if report.when == "call" and report.failed:
-        # Get driver from fixture
-        driver = item.funcargs.get('driver')
-        if driver:
-            # Create screenshots directory
-            screenshots_dir = os.path.join(os.path.dirname(__file__), 'screenshots')
-            os.makedirs(screenshots_dir, exist_ok=True)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            test_name = item.name
-            filename = f"{test_name}_{timestamp}.png"
-            filepath = os.path.join(screenshots_dir, filename)
-            
-            # Take screenshot
-            driver.save_screenshot(filepath)
-            print(f"\nScreenshot saved: {filepath}")
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Report browser pool, driver cache, startup, grid latency, element cache
+    and resource blocking statistics.
+    """
+    stats = config.stash.get(POOL_STATS_KEY, None)
+    if stats is not None:
+        terminalreporter.write_sep("-", "browser pool")
+        terminalreporter.write_line(stats.format_summary())
+        resolver = get_resolver().stats()
+        terminalreporter.write_line(f"driver resolver hits={resolver['hits']} "
+                                    f"misses={resolver['misses']}")
+    prefetch = config.stash.get(PREFETCH_STATS_KEY, None)
+    if prefetch is not None and prefetch['served']:
+        terminalreporter.write_sep("-", "headless prefetch")
+        terminalreporter.write_line(f"prefetch served={prefetch['served']} "
+                                    f"wait total={prefetch['wait_total']:.3f}s")
+    startup_lines = get_collector().format_summary()
+    if startup_lines:
+        terminalreporter.write_sep("-", "driver startup phases")
+        for line in startup_lines:
+            terminalreporter.write_line(line)
+    latency_lines = get_latency_stats().format_summary()
+    if latency_lines:
+        terminalreporter.write_sep("-", "grid command latency")
+        for line in latency_lines:
+            terminalreporter.write_line(line)
+    cache = get_cache_totals()
+    if cache['hits'] or cache['misses']:
+        terminalreporter.write_sep("-", "element cache")
+        terminalreporter.write_line(f"hits={cache['hits']} misses={cache['misses']} "
+                                    f"stale={cache['stale']} "
+                                    f"round trips saved (net)={cache['round_trips_saved']}")
+    planner = config.stash.get(NAVIGATION_KEY, None)
+    if planner is not None and planner.stats['routes']:
+        terminalreporter.write_sep("-", "navigation planner")
+        for line in planner.format_summary():
+            terminalreporter.write_line(line)
+    blocker = config.stash.get(BLOCKER_KEY, None)
+    if blocker is not None and blocker.enabled:
+        terminalreporter.write_sep("-", "resource blocking")
+        terminalreporter.write_line(blocker.format_summary())
+
+
+def pytest_sessionfinish(session):
+    """
+    Write driver startup timings and grid command latency next to the test report.
+    
+    Parallel workers write their own files, which the controller merges.
+    """
+    worker_id = parallel.get_worker_id()
+    for name, stats in (("driver_startup", get_collector()),
+                        ("grid_latency", get_latency_stats())):
+        if worker_id:
+            if stats.samples:
+                stats.write_json(os.path.join(REPORTS_DIR, f"{name}_{worker_id}.json"))
+            continue
+        
+        for path in glob.glob(os.path.join(REPORTS_DIR, f"{name}_gw*.json")):
+            stats.merge_json(path)
+            os.remove(path)
+        if stats.samples:
+            stats.write_json(os.path.join(REPORTS_DIR, f"{name}.json"))
+
+
+def pytest_addoption(parser):
+    """
+    Register command line options.
+    """
+    parallel.add_options(parser)
+    profiler.add_options(parser)
 
 
 def pytest_configure(config):
     """
-    Configure pytest with custom markers.
+    Configure pytest with custom markers and parallel execution.
     """
     config.addinivalue_line("markers", "smoke: Smoke tests - critical functionality")
     config.addinivalue_line("markers", "regression: Regression tests - full test suite")
@@ -145,6 +389,41 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "cart: Tests related to shopping cart")
     config.addinivalue_line("markers", "checkout: Tests related to checkout flow")
     config.addinivalue_line("markers", "negative: Negative test cases")
+    config.addinivalue_line("markers", "allow_resources: Load images/fonts/scripts (no resource blocking)")
+    config.addinivalue_line("markers", "unit: Browser-free unit tests of framework modules")
+    
+    # All page-object waits use the timeouts from config.yaml (implicit waits are off)
+    BasePage.wait_policy = WaitPolicy.from_config(get_config(CONFIG_PATH).timeouts)
+    
+    # Failure screenshots and DOM snapshots, written by a background thread
+    reporting = get_config(CONFIG_PATH).reporting
+    if reporting.screenshots_on_failure:
+        directory = os.path.join(os.path.dirname(__file__), reporting.screenshot_dir)
+        config.pluginmanager.register(
+            artifacts.FailureArtifacts(directory, reporting.artifact_queue_size),
+            "saucedemo_artifacts")
+    
+    # WebDriver command profile (--profile-commands); workers inherit it via the environment
+    if profiler.is_enabled(config):
+        os.environ[profiler.PROFILE_ENV] = '1'
+        config.pluginmanager.register(profiler.CommandProfiler(REPORTS_DIR), "saucedemo_profiler")
+    
+    # execution.fail_fast stops the run at the first failure (like -x) unless
+    # --maxfail was given; the parallel scheduler forwards it to workers
+    if get_config(CONFIG_PATH).execution.fail_fast and not config.option.maxfail:
+        config.option.maxfail = 1
+    
+    # Parallel execution (execution.parallel_mode / max_workers or --workers)
+    results_path = os.environ.get(parallel.RESULTS_ENV)
+    if parallel.get_worker_id() and results_path:
+        config.pluginmanager.register(
+            parallel.WorkerReporter(config, results_path), "saucedemo_worker")
+    else:
+        execution = get_config(CONFIG_PATH).execution
+        workers = parallel.resolve_worker_count(config, execution)
+        if workers > 1:
+            config.pluginmanager.register(
+                parallel.ParallelScheduler(config, workers), "saucedemo_parallel")
 
 
 # =============================================================================
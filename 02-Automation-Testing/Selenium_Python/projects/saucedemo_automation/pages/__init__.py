@@ -7,6 +7,10 @@ Author: Muhammad Yasin Asif
 Portfolio: QA Engineer Portfolio
 """
 
+from .wait_policy import Expect, WaitPolicy
+from .element_cache import ElementCache, get_cache_totals
+from .fingerprint import FingerprintResult, PageFingerprint
+from .catalog import Catalog, Product
 from .base_page import BasePage
 from .login_page import LoginPage
 from .inventory_page import InventoryPage
@@ -14,6 +18,14 @@ from .cart_page import CartPage
 from .checkout_page import CheckoutPage, CheckoutOverviewPage, CheckoutCompletePage
 
 __all__ = [
+    'Expect',
+    'WaitPolicy',
+    'ElementCache',
+    'get_cache_totals',
+    'PageFingerprint',
+    'FingerprintResult',
+    'Catalog',
+    'Product',
     'BasePage',
     'LoginPage',
     'InventoryPage',
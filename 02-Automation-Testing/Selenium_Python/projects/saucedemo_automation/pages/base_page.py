@@ -8,13 +8,21 @@ Author: Muhammad Yasin Asif
 Portfolio: QA Engineer Portfolio
 """
 
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (NoSuchElementException, StaleElementReferenceException,
+                                        TimeoutException,
+                                        WebDriverException)
+
+from .element_cache import ElementCache
+from .fingerprint import FingerprintResult, PageFingerprint
+from .scripts import (CLICK_ALL_SCRIPT, COUNT_MATCHES_SCRIPT, FILL_FORM_SCRIPT, FINGERPRINT_SCRIPT,
+                      PEEK_SCRIPT, READ_MANY_SCRIPT)
+from .wait_policy import Expect, WaitPolicy
 
 
 class BasePage:
@@ -22,22 +30,39 @@ class BasePage:
     Base class for all Page Objects.
     
     Provides common functionality like:
-    - Element finding with waits
+    - Element finding with waits (all waiting goes through wait_policy)
     - Common actions (click, type, etc.)
     - Page verification methods
     """
     
-    def __init__(self, driver: WebDriver, timeout: int = 10):
+    # Cheap element that marks the page as usable (waited on by navigate_to)
+    READY_LOCATOR: Optional[Tuple[str, str]] = None
+    
+    # URL pattern, visible selectors and texts identifying the page (see verify_page)
+    FINGERPRINT: Optional[PageFingerprint] = None
+    
+    # Shared wait policy (configured from config.yaml timeouts in conftest)
+    wait_policy: WaitPolicy = WaitPolicy()
+    
+    # Opt-in: reuse located elements per locator (see pages/element_cache.py)
+    CACHE_ELEMENTS = False
+    
+    def __init__(self, driver: WebDriver, timeout: Optional[float] = None):
         """
         Initialize BasePage.
         
         Args:
             driver: WebDriver instance
-            timeout: Default wait timeout in seconds
+            timeout: Default wait timeout in seconds (defaults to timeouts.medium)
         """
         self.driver = driver
-        self.timeout = timeout
-        self.wait = WebDriverWait(driver, timeout)
+        self.timeout = timeout if timeout is not None else self.wait_policy.medium
+        self.element_cache: Optional[ElementCache] = ElementCache() if self.CACHE_ELEMENTS else None
+    
+    def _until(self, condition: Callable, timeout: Optional[float] = None):
+        """Wait for a condition through the wait policy."""
+        return self.wait_policy.until(self.driver, condition,
+                                      self.timeout if timeout is None else timeout)
     
     # =========================================================================
     # ELEMENT FINDING METHODS
@@ -53,43 +78,132 @@ class BasePage:
         Returns:
             WebElement if found
         """
-        return self.wait.until(
-            EC.presence_of_element_located(locator)
-        )
+        return self._find_cached(locator, 'present')
     
     def find_visible_element(self, locator: Tuple[str, str]) -> WebElement:
         """Find element that is visible."""
-        return self.wait.until(
-            EC.visibility_of_element_located(locator)
-        )
+        return self._find_cached(locator, 'visible')
     
     def find_clickable_element(self, locator: Tuple[str, str]) -> WebElement:
         """Find element that is clickable."""
-        return self.wait.until(
-            EC.element_to_be_clickable(locator)
-        )
+        return self._find_cached(locator, 'clickable')
+    
+    def _find_cached(self, locator: Tuple[str, str], state: str) -> WebElement:
+        """Serve a lookup from the element cache, or wait for a fresh element."""
+        if self.element_cache is not None:
+            element = self.element_cache.get(locator, state,
+                                             self.wait_policy.lookup_round_trips(state))
+            if element is not None:
+                return element
+        element = self.wait_policy.until_state(self.driver, state, locator, self.timeout)
+        if self.element_cache is not None:
+            self.element_cache.put(locator, element)
+        return element
+    
+    def _with_element(self, locator: Tuple[str, str], find: Callable, action: Callable):
+        """
+        Run an action on a located element.
+        
+        A cached element that went stale is dropped and looked up again once.
+        """
+        element = find(locator)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            if self.element_cache is None:
+                raise
+            self.element_cache.invalidate(locator, stale=True)
+            return action(find(locator))
     
     def find_elements(self, locator: Tuple[str, str]) -> List[WebElement]:
         """Find multiple elements."""
-        return self.wait.until(
-            EC.presence_of_all_elements_located(locator)
-        )
+        return self._until(EC.presence_of_all_elements_located(locator))
     
     def is_element_present(self, locator: Tuple[str, str]) -> bool:
-        """Check if element exists in DOM."""
-        try:
-            self.driver.find_element(*locator)
-            return True
-        except NoSuchElementException:
-            return False
+        """Check if element exists in DOM right now (no wait)."""
+        return len(self.driver.find_elements(*locator)) > 0
     
-    def is_element_visible(self, locator: Tuple[str, str]) -> bool:
-        """Check if element is visible."""
-        try:
-            element = self.find_visible_element(locator)
-            return element.is_displayed()
-        except TimeoutException:
-            return False
+    def is_element_visible(self, locator: Tuple[str, str],
+                           expect: Expect = Expect.PRESENT) -> bool:
+        """
+        Check if element is visible.
+        
+        Args:
+            locator: Element locator
+            expect: Expect.PRESENT waits for the element to appear,
+                    Expect.ABSENT checks once without waiting
+        """
+        return self.wait_policy.check_state(self.driver, 'visible', locator, expect, self.timeout)
+    
+    def peek(self, locator: Tuple[str, str]) -> Optional[str]:
+        """
+        Snapshot an element right now, in one script call (no wait).
+        
+        Neither the wait policy nor an implicit wait is involved, so a
+        missing element costs one round trip instead of a timeout.
+        
+        Args:
+            locator: Element locator
+            
+        Returns:
+            Text of the first match if it is visible, otherwise None
+        """
+        return self.driver.execute_script(PEEK_SCRIPT, *locator)
+    
+    def query_absent(self, locator: Tuple[str, str]) -> bool:
+        """Check that no visible element matches right now (no wait)."""
+        return self.peek(locator) is None
+    
+    # =========================================================================
+    # BATCHED READS
+    # =========================================================================
+    
+    def read_many(self, container: Tuple[str, str], field_map: Dict,
+                  expect: Expect = Expect.PRESENT) -> List[Dict[str, Optional[str]]]:
+        """
+        Read fields from every element matching a container locator in one script call.
+        
+        Each field_map value is one of:
+        - locator: text of the first match inside the container
+        - (locator, attribute): attribute/property of that match
+        - (None, attribute): attribute/property of the container itself
+        
+        Example:
+            read_many(CART_ITEM, {'name': ITEM_NAME, 'price': ITEM_PRICE})
+        
+        Args:
+            container: Locator matching one element per row
+            field_map: Field name to field spec
+            expect: Expect.PRESENT waits until at least one row exists,
+                    Expect.ABSENT reads once without waiting
+            
+        Returns:
+            One dictionary per container, None for fields that did not match
+        """
+        fields = []
+        for name, spec in field_map.items():
+            locator, attribute = spec if spec[0] is None or isinstance(spec[0], tuple) else (spec, None)
+            fields.append({
+                'name': name,
+                'by': locator[0] if locator else None,
+                'value': locator[1] if locator else None,
+                'attribute': attribute,
+            })
+        
+        def read(driver):
+            return driver.execute_script(READ_MANY_SCRIPT, list(container), fields)
+        
+        if expect is Expect.ABSENT:
+            return read(self.driver)
+        rows = []
+        
+        def has_rows(driver):
+            nonlocal rows
+            rows = read(driver)
+            return bool(rows)
+        
+        self.wait_policy.check(self.driver, has_rows, timeout=self.timeout)
+        return rows
     
     # =========================================================================
     # INTERACTION METHODS
@@ -97,7 +211,79 @@ class BasePage:
     
     def click(self, locator: Tuple[str, str]):
         """Click on element."""
-        self.find_clickable_element(locator).click()
+        self._with_element(locator, self.find_clickable_element, lambda element: element.click())
+    
+    def click_all(self, locators: List[Tuple[str, str]]) -> List[int]:
+        """
+        Click every element matching any of the locators in one script call.
+        
+        Matches are collected before the first click, so re-renders caused
+        by earlier clicks do not shift later ones.
+        
+        Args:
+            locators: Locators of the elements to click
+            
+        Returns:
+            Number of elements clicked per locator
+        """
+        self._clear_element_cache()
+        return self.driver.execute_script(CLICK_ALL_SCRIPT, self._locator_arguments(locators))
+    
+    def count_matches(self, locators: List[Tuple[str, str]]) -> int:
+        """Count elements matching any of the locators right now (one script call, no wait)."""
+        return self.driver.execute_script(COUNT_MATCHES_SCRIPT, self._locator_arguments(locators))
+    
+    def wait_until_gone(self, locators: List[Tuple[str, str]], action: str):
+        """
+        Wait until none of the locators match.
+        
+        Args:
+            locators: Locators that must stop matching
+            action: What was done, for the error message
+            
+        Raises:
+            TimeoutException: If matches remain after the timeout
+        """
+        remaining = 0
+        
+        def gone(driver):
+            nonlocal remaining
+            remaining = self.count_matches(locators)
+            return remaining == 0
+        
+        if not self.wait_policy.check(self.driver, gone, timeout=self.timeout):
+            raise TimeoutException(f"{action}: {remaining} element(s) still match "
+                                   f"{', '.join(f'{by}={value}' for by, value in locators)}")
+    
+    def _bulk_click(self, targets: List[Tuple[str, str]], names: Optional[List[str]],
+                    action: str):
+        """
+        Click target buttons in one call and verify once that they are gone.
+        
+        Args:
+            targets: Button locators (one per name when names are given)
+            names: Names the targets were built from, None for a match-all locator
+            action: What is being done, for error messages
+            
+        Raises:
+            TimeoutException: If the page is not ready or targets remain
+            NoSuchElementException: If a named target has no button
+        """
+        if not targets:
+            return
+        if not self.wait_until_ready():
+            raise TimeoutException(f"{action}: {type(self).__name__} did not become ready")
+        clicked = self.click_all(targets)
+        if names is not None:
+            missing = [name for name, count in zip(names, clicked) if not count]
+            if missing:
+                raise NoSuchElementException(f"{action}: no button for {missing}")
+        self.wait_until_gone(targets, action)
+    
+    @staticmethod
+    def _locator_arguments(locators: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        """Serialize locators for the page scripts."""
+        return [{'by': by, 'value': value} for by, value in locators]
     
     def type_text(self, locator: Tuple[str, str], text: str, clear_first: bool = True):
         """
@@ -108,34 +294,70 @@ class BasePage:
             text: Text to type
             clear_first: Clear field before typing
         """
-        element = self.find_visible_element(locator)
-        if clear_first:
-            element.clear()
-        element.send_keys(text)
+        def type_into(element):
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+        
+        self._with_element(locator, self.find_visible_element, type_into)
+    
+    def fill_form(self, fields: Dict[Tuple[str, str], str], keystrokes: bool = False):
+        """
+        Fill several form fields.
+        
+        By default all values are set in one script call through the native
+        value setter, with input/change events dispatched so React state
+        follows. keystrokes=True types each field with clear + send_keys
+        instead, for tests that need real keyboard events.
+        
+        Example:
+            fill_form({FIRST_NAME: 'John', LAST_NAME: 'Doe'})
+        
+        Args:
+            fields: Locator to value, filled in order
+            keystrokes: Type the values key by key
+        """
+        if keystrokes:
+            for locator, value in fields.items():
+                self.type_text(locator, value)
+            return
+        
+        payload = [{'by': locator[0], 'value': locator[1], 'text': str(value)}
+                   for locator, value in fields.items()]
+        missing = []
+        
+        def filled(driver):
+            nonlocal missing
+            missing = driver.execute_script(FILL_FORM_SCRIPT, payload)
+            return not missing
+        
+        if not self.wait_policy.check(self.driver, filled, timeout=self.timeout):
+            raise TimeoutException(f"Form fields not found: {', '.join(missing)}")
     
     def get_text(self, locator: Tuple[str, str]) -> str:
         """Get text content of element."""
-        return self.find_visible_element(locator).text
+        return self._with_element(locator, self.find_visible_element, lambda element: element.text)
     
     def get_attribute(self, locator: Tuple[str, str], attribute: str) -> str:
         """Get attribute value of element."""
-        return self.find_element(locator).get_attribute(attribute)
+        return self._with_element(locator, self.find_element,
+                                  lambda element: element.get_attribute(attribute))
     
     def select_by_text(self, locator: Tuple[str, str], text: str):
         """Select dropdown option by visible text."""
-        select = Select(self.find_element(locator))
-        select.select_by_visible_text(text)
+        self._with_element(locator, self.find_element,
+                           lambda element: Select(element).select_by_visible_text(text))
     
     def select_by_value(self, locator: Tuple[str, str], value: str):
         """Select dropdown option by value."""
-        select = Select(self.find_element(locator))
-        select.select_by_value(value)
+        self._with_element(locator, self.find_element,
+                           lambda element: Select(element).select_by_value(value))
     
     def hover(self, locator: Tuple[str, str]):
         """Hover over element."""
         from selenium.webdriver.common.action_chains import ActionChains
-        element = self.find_element(locator)
-        ActionChains(self.driver).move_to_element(element).perform()
+        self._with_element(locator, self.find_element,
+                           lambda element: ActionChains(self.driver).move_to_element(element).perform())
     
     # =========================================================================
     # WAIT METHODS
@@ -143,24 +365,65 @@ class BasePage:
     
     def wait_for_url_contains(self, text: str) -> bool:
         """Wait for URL to contain specific text."""
-        try:
-            return self.wait.until(EC.url_contains(text))
-        except TimeoutException:
-            return False
+        return self.wait_policy.check_state(self.driver, 'url_contains', text,
+                                            timeout=self.timeout)
+    
+    def wait_for_url_or_error(self, text: str, error_locator: Tuple[str, str]) -> bool:
+        """
+        Wait for URL to contain text, stopping early if an error appears.
+        
+        Args:
+            text: Expected URL fragment on success
+            error_locator: Element shown on failure
+            
+        Returns:
+            True if the URL contains text
+        """
+        outcome = EC.any_of(EC.url_contains(text), EC.visibility_of_element_located(error_locator))
+        self.wait_policy.check(self.driver, outcome, timeout=self.timeout)
+        return text in self.get_current_url()
     
     def wait_for_title_contains(self, text: str) -> bool:
         """Wait for page title to contain text."""
-        try:
-            return self.wait.until(EC.title_contains(text))
-        except TimeoutException:
-            return False
+        return self.wait_policy.check_state(self.driver, 'title_contains', text,
+                                            timeout=self.timeout)
     
     def wait_for_element_invisible(self, locator: Tuple[str, str]) -> bool:
         """Wait for element to become invisible."""
-        try:
-            return self.wait.until(EC.invisibility_of_element_located(locator))
-        except TimeoutException:
-            return False
+        return self.wait_policy.check(self.driver, EC.invisibility_of_element_located(locator),
+                                      timeout=self.timeout)
+    
+    # =========================================================================
+    # PAGE VERIFICATION
+    # =========================================================================
+    
+    def verify_page(self, expect: Expect = Expect.PRESENT) -> FingerprintResult:
+        """
+        Check the page's FINGERPRINT with one script evaluation per attempt.
+        
+        Args:
+            expect: Expect.PRESENT waits until the fingerprint matches,
+                    Expect.ABSENT checks once without waiting
+            
+        Returns:
+            FingerprintResult (truthy if matched) listing any mismatching parts
+            
+        Raises:
+            TypeError: If the page class does not declare a FINGERPRINT
+        """
+        if self.FINGERPRINT is None:
+            raise TypeError(f"{type(self).__name__} does not declare a FINGERPRINT")
+        argument = self.FINGERPRINT.to_script_argument()
+        result = FingerprintResult(url_pattern=self.FINGERPRINT.url_pattern)
+        
+        def matches(driver):
+            nonlocal result
+            result = FingerprintResult(url_pattern=self.FINGERPRINT.url_pattern,
+                                       **driver.execute_script(FINGERPRINT_SCRIPT, argument))
+            return result.matched
+        
+        self.wait_policy.check(self.driver, matches, expect, self.timeout)
+        return result
     
     # =========================================================================
     # PAGE METHODS
@@ -174,22 +437,75 @@ class BasePage:
         """Get page title."""
         return self.driver.title
     
-    def navigate_to(self, url: str):
-        """Navigate to URL."""
+    def navigate_to(self, url: str) -> bool:
+        """
+        Navigate to URL and wait until the page is usable.
+        
+        With the eager/none page load strategies driver.get returns before
+        the load event, so readiness is decided by the page's READY_LOCATOR.
+        
+        Args:
+            url: URL to open
+            
+        Returns:
+            True if the page became ready within the timeout
+        """
+        strategy = self.driver.capabilities.get('pageLoadStrategy', 'normal')
+        # With 'none' the old document may still be current after get()
+        previous_root = self._document_root() if strategy == 'none' else None
+        self._clear_element_cache()
         self.driver.get(url)
+        if strategy == 'normal' and self.READY_LOCATOR is None:
+            return True
+        return self.wait_until_ready(previous_root)
+    
+    def wait_until_ready(self, previous_root: Optional[WebElement] = None) -> bool:
+        """
+        Wait for the page's readiness condition.
+        
+        Args:
+            previous_root: <html> element of the document being replaced
+            
+        Returns:
+            True if READY_LOCATOR (or DOMContentLoaded) was reached in time
+        """
+        if previous_root is not None and not self.wait_policy.check(
+                self.driver, EC.staleness_of(previous_root), timeout=self.timeout):
+            return False
+        if self.READY_LOCATOR is not None:
+            return self.wait_policy.check_state(self.driver, 'present', self.READY_LOCATOR,
+                                                timeout=self.timeout)
+        condition = lambda driver: driver.execute_script(
+            "return document.readyState") != "loading"
+        return self.wait_policy.check(self.driver, condition, timeout=self.timeout)
+    
+    def _document_root(self) -> Optional[WebElement]:
+        """Get the current <html> element, if any."""
+        try:
+            return self.driver.find_element(By.TAG_NAME, "html")
+        except WebDriverException:
+            return None
     
     def refresh_page(self):
         """Refresh current page."""
+        self._clear_element_cache()
         self.driver.refresh()
     
     def go_back(self):
         """Navigate back in browser history."""
+        self._clear_element_cache()
         self.driver.back()
     
     def go_forward(self):
         """Navigate forward in browser history."""
+        self._clear_element_cache()
         self.driver.forward()
     
+    def _clear_element_cache(self):
+        """Drop cached elements before the document changes."""
+        if self.element_cache is not None:
+            self.element_cache.clear()
+    
     # =========================================================================
     # SCREENSHOT METHODS
     # =========================================================================
@@ -7,10 +7,12 @@ Author: Muhammad Yasin Asif
 Portfolio: QA Engineer Portfolio
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from .base_page import BasePage
+from .fingerprint import PageFingerprint
+from .wait_policy import Expect
 
 
 class CartPage(BasePage):
@@ -39,6 +41,12 @@ class CartPage(BasePage):
     CHECKOUT_BUTTON = (By.ID, "checkout")
     REMOVE_BUTTON = (By.CSS_SELECTOR, "button[id^='remove-']")
     
+    # Readiness
+    READY_LOCATOR = CART_LIST
+    FINGERPRINT = PageFingerprint(url_pattern=r"/cart\.html",
+                                  selectors=(PAGE_TITLE,),
+                                  texts={PAGE_TITLE: "Your Cart"})
+    
     def __init__(self, driver: WebDriver):
         """Initialize CartPage."""
         super().__init__(driver)
@@ -79,27 +87,38 @@ class CartPage(BasePage):
         self.click(locator)
         return self
     
+    def remove_items(self, product_names: Optional[List[str]] = None):
+        """
+        Remove several items with one script call, then verify once.
+        
+        Args:
+            product_names: Product IDs like 'sauce-labs-backpack'
+                           (None removes every item)
+            
+        Raises:
+            TimeoutException: If the cart page is not ready or an item remains
+            NoSuchElementException: If a named item is not in the cart
+        """
+        if product_names is None:
+            targets = [self.REMOVE_BUTTON]
+        else:
+            targets = [(By.ID, f"remove-{name}") for name in product_names]
+        self._bulk_click(targets, product_names, "Remove items from cart")
+        return self
+    
     def remove_all_items(self):
         """Remove all items from cart."""
-        while self.get_cart_item_count() > 0:
-            remove_buttons = self.find_elements(self.REMOVE_BUTTON)
-            if remove_buttons:
-                remove_buttons[0].click()
-            else:
-                break
-        return self
+        return self.remove_items()
     
     # =========================================================================
     # CART INFORMATION
     # =========================================================================
     
     def get_cart_item_count(self) -> int:
-        """Get number of items in cart."""
-        try:
-            items = self.find_elements(self.CART_ITEM)
-            return len(items)
-        except:
+        """Get number of items in cart (an empty cart returns without waiting)."""
+        if not self.wait_until_ready():
             return 0
+        return len(self.driver.find_elements(*self.CART_ITEM))
     
     def get_all_cart_items(self) -> List[Dict]:
         """
@@ -108,32 +127,27 @@ class CartPage(BasePage):
         Returns:
             List of dictionaries with item details
         """
-        items = []
-        cart_items = self.find_elements(self.CART_ITEM)
-        
-        for item in cart_items:
-            items.append({
-                'name': item.find_element(*self.ITEM_NAME).text,
-                'description': item.find_element(*self.ITEM_DESCRIPTION).text,
-                'price': item.find_element(*self.ITEM_PRICE).text,
-                'quantity': item.find_element(*self.CART_QUANTITY).text
-            })
-        
-        return items
+        return self._read_cart_items({
+            'name': self.ITEM_NAME,
+            'description': self.ITEM_DESCRIPTION,
+            'price': self.ITEM_PRICE,
+            'quantity': self.CART_QUANTITY,
+        })
     
     def get_cart_item_names(self) -> List[str]:
         """Get list of item names in cart."""
-        name_elements = self.find_elements(self.ITEM_NAME)
-        return [elem.text for elem in name_elements]
+        return [item['name'] for item in self._read_cart_items({'name': self.ITEM_NAME})]
     
     def get_cart_total_price(self) -> float:
         """Calculate total price of items in cart."""
-        price_elements = self.find_elements(self.ITEM_PRICE)
-        total = 0.0
-        for elem in price_elements:
-            price_text = elem.text.replace("$", "")
-            total += float(price_text)
-        return total
+        items = self._read_cart_items({'price': self.ITEM_PRICE})
+        return sum(float(item['price'].replace("$", "")) for item in items)
+    
+    def _read_cart_items(self, field_map: Dict) -> List[Dict]:
+        """Read cart rows in one script call (an empty cart returns without waiting)."""
+        if not self.wait_until_ready():
+            return []
+        return self.read_many(self.CART_ITEM, field_map, Expect.ABSENT)
     
     def is_item_in_cart(self, product_name: str) -> bool:
         """Check if specific item is in cart."""
@@ -146,8 +160,7 @@ class CartPage(BasePage):
     
     def is_cart_page_displayed(self) -> bool:
         """Check if cart page is displayed."""
-        return (self.is_element_visible(self.PAGE_TITLE) and 
-                "cart" in self.get_current_url())
+        return bool(self.verify_page())
     
     def get_page_title(self) -> str:
         """Get the page title text."""
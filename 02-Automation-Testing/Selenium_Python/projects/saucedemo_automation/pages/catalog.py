@@ -0,0 +1,142 @@
+"""
+Inventory Catalog
+=================
+In-memory model of the inventory grid, parsed from one batched read.
+
+Each product becomes a compact record (id slug, name, description, price
+in cents, in-cart flag). Records are indexed by name and by slug, so
+lookups, sorting checks and cart-state checks run in Python instead of
+issuing one WebDriver command per product.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterator, List, Optional
+
+
+ADD_PREFIX = "add-to-cart-"
+REMOVE_PREFIX = "remove-"
+
+
+def parse_price_cents(text: Optional[str]) -> int:
+    """
+    Convert a price label like '$29.99' to cents.
+
+    Args:
+        text: Price text as shown on the page
+
+    Returns:
+        Price in cents (0 if the text is missing or not a price)
+    """
+    try:
+        return int(Decimal((text or "").strip().lstrip("$")) * 100)
+    except InvalidOperation:
+        return 0
+
+
+class Product:
+    """One inventory item."""
+
+    __slots__ = ('slug', 'name', 'description', 'price_cents', 'in_cart')
+
+    def __init__(self, slug: str, name: str, description: str, price_cents: int,
+                 in_cart: bool = False):
+        """
+        Initialize Product.
+
+        Args:
+            slug: Id slug used by the cart buttons, e.g. 'sauce-labs-backpack'
+            name: Display name
+            description: Description text
+            price_cents: Price in cents
+            in_cart: The product's button reads "Remove"
+        """
+        self.slug = slug
+        self.name = name
+        self.description = description
+        self.price_cents = price_cents
+        self.in_cart = in_cart
+
+    @property
+    def price(self) -> float:
+        """Price in dollars."""
+        return self.price_cents / 100
+
+    def to_dict(self) -> Dict:
+        """Product info in the shape of InventoryPage.get_product_info."""
+        return {
+            'name': self.name,
+            'description': self.description,
+            'price': f"${self.price_cents // 100}.{self.price_cents % 100:02d}",
+        }
+
+    def __repr__(self) -> str:
+        return (f"Product({self.slug!r}, {self.name!r}, price_cents={self.price_cents}, "
+                f"in_cart={self.in_cart})")
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Optional[str]]) -> "Product":
+        """
+        Build a Product from a read_many row.
+
+        Args:
+            row: Fields name, description, price and button (button id)
+
+        Returns:
+            Product record
+        """
+        button = row.get('button') or ""
+        in_cart = button.startswith(REMOVE_PREFIX)
+        slug = button[len(REMOVE_PREFIX if in_cart else ADD_PREFIX):] if button else ""
+        return cls(slug, row.get('name') or "", row.get('description') or "",
+                   parse_price_cents(row.get('price')), in_cart)
+
+
+class Catalog:
+    """
+    Products in page order, indexed by name and slug.
+    """
+
+    __slots__ = ('products', '_by_name', '_by_slug')
+
+    def __init__(self, products: List[Product]):
+        """
+        Initialize Catalog.
+
+        Args:
+            products: Products in the order they are displayed
+        """
+        self.products = products
+        self._by_name = {product.name: product for product in products}
+        self._by_slug = {product.slug: product for product in products}
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __iter__(self) -> Iterator[Product]:
+        return iter(self.products)
+
+    def __getitem__(self, index: int) -> Product:
+        return self.products[index]
+
+    def by_name(self, name: str) -> Optional[Product]:
+        """Get a product by display name."""
+        return self._by_name.get(name)
+
+    def by_slug(self, slug: str) -> Optional[Product]:
+        """Get a product by id slug ('sauce-labs-backpack')."""
+        return self._by_slug.get(slug)
+
+    def names(self) -> List[str]:
+        """Product names in page order."""
+        return [product.name for product in self.products]
+
+    def prices(self) -> List[float]:
+        """Product prices in dollars, in page order."""
+        return [product.price for product in self.products]
+
+    def in_cart(self) -> List[Product]:
+        """Products whose button reads "Remove"."""
+        return [product for product in self.products if product.in_cart]
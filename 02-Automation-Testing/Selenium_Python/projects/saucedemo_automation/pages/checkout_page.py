@@ -10,6 +10,7 @@ Portfolio: QA Engineer Portfolio
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from .base_page import BasePage
+from .fingerprint import PageFingerprint
 
 
 class CheckoutPage(BasePage):
@@ -34,6 +35,14 @@ class CheckoutPage(BasePage):
     # Locators - Error
     ERROR_MESSAGE = (By.CSS_SELECTOR, "[data-test='error']")
     
+    # Readiness
+    READY_LOCATOR = CONTINUE_BUTTON
+    FINGERPRINT = PageFingerprint(url_pattern=r"/checkout-step-one\.html",
+                                  selectors=(FIRST_NAME, CONTINUE_BUTTON))
+    
+    # Form fields are used repeatedly; reuse located elements
+    CACHE_ELEMENTS = True
+    
     def __init__(self, driver: WebDriver):
         """Initialize CheckoutPage."""
         super().__init__(driver)
@@ -57,7 +66,8 @@ class CheckoutPage(BasePage):
         self.type_text(self.POSTAL_CODE, postal_code)
         return self
     
-    def fill_checkout_info(self, first_name: str, last_name: str, postal_code: str):
+    def fill_checkout_info(self, first_name: str, last_name: str, postal_code: str,
+                           keystrokes: bool = False):
         """
         Fill all checkout information fields.
         
@@ -65,17 +75,20 @@ class CheckoutPage(BasePage):
             first_name: Customer first name
             last_name: Customer last name
             postal_code: Postal/ZIP code
+            keystrokes: Type values key by key instead of one fill_form call
         """
-        self.enter_first_name(first_name)
-        self.enter_last_name(last_name)
-        self.enter_postal_code(postal_code)
+        self.fill_form({
+            self.FIRST_NAME: first_name,
+            self.LAST_NAME: last_name,
+            self.POSTAL_CODE: postal_code,
+        }, keystrokes=keystrokes)
         return self
     
     def click_continue(self):
         """Click continue button."""
         self.click(self.CONTINUE_BUTTON)
-        # Check if we moved to overview page
-        if self.wait_for_url_contains("checkout-step-two"):
+        # Check if we moved to overview page (stop early on a validation error)
+        if self.wait_for_url_or_error("checkout-step-two", self.ERROR_MESSAGE):
             return CheckoutOverviewPage(self.driver)
         return self
     
@@ -85,9 +98,10 @@ class CheckoutPage(BasePage):
         from .cart_page import CartPage
         return CartPage(self.driver)
     
-    def complete_checkout_info(self, first_name: str, last_name: str, postal_code: str):
+    def complete_checkout_info(self, first_name: str, last_name: str, postal_code: str,
+                               keystrokes: bool = False):
         """Fill form and continue to overview."""
-        self.fill_checkout_info(first_name, last_name, postal_code)
+        self.fill_checkout_info(first_name, last_name, postal_code, keystrokes)
         return self.click_continue()
     
     # =========================================================================
@@ -96,13 +110,11 @@ class CheckoutPage(BasePage):
     
     def is_checkout_page_displayed(self) -> bool:
         """Check if checkout info page is displayed."""
-        return "checkout-step-one" in self.get_current_url()
+        return bool(self.verify_page())
     
     def get_error_message(self) -> str:
-        """Get error message text."""
-        if self.is_element_visible(self.ERROR_MESSAGE):
-            return self.get_text(self.ERROR_MESSAGE)
-        return ""
+        """Get error message text ("" if none is shown; no wait)."""
+        return self.peek(self.ERROR_MESSAGE) or ""
     
     def is_error_displayed(self) -> bool:
         """Check if error is displayed."""
@@ -133,6 +145,11 @@ class CheckoutOverviewPage(BasePage):
     FINISH_BUTTON = (By.ID, "finish")
     CANCEL_BUTTON = (By.ID, "cancel")
     
+    # Readiness
+    READY_LOCATOR = FINISH_BUTTON
+    FINGERPRINT = PageFingerprint(url_pattern=r"/checkout-step-two\.html",
+                                  selectors=(SUMMARY_TOTAL, FINISH_BUTTON))
+    
     def __init__(self, driver: WebDriver):
         """Initialize CheckoutOverviewPage."""
         super().__init__(driver)
@@ -141,6 +158,11 @@ class CheckoutOverviewPage(BasePage):
     # ACTIONS
     # =========================================================================
     
+    def open(self):
+        """Navigate to the overview directly (requires login and a cart)."""
+        self.navigate_to(self.URL)
+        return self
+    
     def click_finish(self):
         """Click finish button to complete order."""
         self.click(self.FINISH_BUTTON)
@@ -183,7 +205,7 @@ class CheckoutOverviewPage(BasePage):
     
     def is_overview_page_displayed(self) -> bool:
         """Check if overview page is displayed."""
-        return "checkout-step-two" in self.get_current_url()
+        return bool(self.verify_page())
     
     def verify_totals(self) -> bool:
         """Verify that subtotal + tax = total."""
@@ -209,6 +231,12 @@ class CheckoutCompletePage(BasePage):
     PONY_EXPRESS = (By.CLASS_NAME, "pony_express")
     BACK_HOME_BUTTON = (By.ID, "back-to-products")
     
+    # Readiness
+    READY_LOCATOR = COMPLETE_HEADER
+    FINGERPRINT = PageFingerprint(url_pattern=r"/checkout-complete\.html",
+                                  selectors=(COMPLETE_HEADER,),
+                                  texts={COMPLETE_HEADER: "Thank you for your order"})
+    
     def __init__(self, driver: WebDriver):
         """Initialize CheckoutCompletePage."""
         super().__init__(driver)
@@ -229,8 +257,7 @@ class CheckoutCompletePage(BasePage):
     
     def is_order_complete(self) -> bool:
         """Check if order was completed successfully."""
-        return (self.is_element_visible(self.COMPLETE_HEADER) and 
-                "checkout-complete" in self.get_current_url())
+        return bool(self.verify_page())
     
     def get_confirmation_header(self) -> str:
         """Get the confirmation header text."""
@@ -0,0 +1,127 @@
+"""
+Element Cache
+=============
+Opt-in per-page cache of located WebElements, keyed by locator.
+
+A cached element is reused only after one in-page check confirms it is
+still attached, still the first match of its locator (React reuses DOM
+nodes, e.g. an add-to-cart button turning into a remove button) and in
+the required state. The check also reports the page URL: the whole cache
+is dropped when it changes.
+
+The check is itself one round trip. Under the polling wait backend it
+replaces the find plus is_displayed / is_enabled calls of a fresh lookup;
+under the mutation backend a fresh lookup is one round trip too, so a hit
+saves nothing and a failed check costs one extra. The net round trips
+saved are counted accordingly.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import StaleElementReferenceException
+
+from .scripts import VALIDATE_CACHED_SCRIPT
+
+
+_totals = {'hits': 0, 'misses': 0, 'stale': 0, 'round_trips_saved': 0}
+_totals_lock = threading.Lock()
+
+
+def get_cache_totals() -> Dict[str, int]:
+    """
+    Get hit/miss/stale/round-trip counters summed over every ElementCache in the process.
+
+    Returns:
+        Copy of the counters
+    """
+    with _totals_lock:
+        return dict(_totals)
+
+
+class ElementCache:
+    """
+    Locator -> WebElement cache for one page object.
+
+    Counts:
+    - hits: lookups served from the cache
+    - misses: lookups that needed a fresh find
+    - stale: cached elements dropped because they went stale
+    - round_trips_saved: net WebDriver round trips saved (hits minus the
+      cost of checks that failed; 0 or less under the mutation backend)
+    """
+
+    def __init__(self):
+        """Initialize empty cache."""
+        self.stats = {'hits': 0, 'misses': 0, 'stale': 0, 'round_trips_saved': 0}
+        self.url: Optional[str] = None
+        self._elements: Dict[Tuple[str, str], WebElement] = {}
+
+    def get(self, locator: Tuple[str, str], state: str = 'present',
+            lookup_round_trips: int = 1) -> Optional[WebElement]:
+        """
+        Return the cached element if it is still valid.
+
+        Args:
+            locator: Element locator
+            state: 'present', 'visible' or 'clickable'
+            lookup_round_trips: Round trips a fresh lookup would cost
+                                (WaitPolicy.lookup_round_trips)
+
+        Returns:
+            WebElement, or None when a fresh lookup is needed
+        """
+        element = self._elements.get(locator)
+        checked = element is not None
+        if checked:
+            try:
+                valid, url = element.parent.execute_script(VALIDATE_CACHED_SCRIPT, element,
+                                                           locator[0], locator[1], state)
+            except StaleElementReferenceException:
+                self.invalidate(locator, stale=True)
+                element = None
+            else:
+                if self.url is not None and url != self.url:
+                    self.clear()
+                    valid = False
+                self.url = url
+                if not valid:
+                    element = None
+        if element is not None:
+            self._count('hits')
+            self._count('round_trips_saved', lookup_round_trips - 1)
+        else:
+            self._count('misses')
+            if checked:
+                self._count('round_trips_saved', -1)
+        return element
+
+    def put(self, locator: Tuple[str, str], element: WebElement):
+        """Remember the element found for a locator."""
+        self._elements[locator] = element
+
+    def invalidate(self, locator: Tuple[str, str], stale: bool = False):
+        """
+        Forget one locator.
+
+        Args:
+            locator: Element locator
+            stale: The element raised StaleElementReferenceException
+        """
+        self._elements.pop(locator, None)
+        if stale:
+            self._count('stale')
+
+    def clear(self):
+        """Forget every element (after navigation)."""
+        self._elements.clear()
+        self.url = None
+
+    def _count(self, key: str, amount: int = 1):
+        """Update page and process-wide counters."""
+        self.stats[key] += amount
+        with _totals_lock:
+            _totals[key] += amount
@@ -0,0 +1,79 @@
+"""
+Page Fingerprints
+=================
+Declarative description of what makes a page "displayed": a URL pattern,
+selectors that must be visible and texts that must appear. BasePage
+checks a whole fingerprint with one script evaluation and returns a
+structured result listing every part that did not match.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+Locator = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class PageFingerprint:
+    """
+    What identifies a page.
+
+    Attributes:
+        url_pattern: JavaScript RegExp source the URL must match (None = any)
+        selectors: Locators that must match a visible element
+        texts: Locator -> text its first match must contain (case-insensitive)
+    """
+    url_pattern: Optional[str] = None
+    selectors: Tuple[Locator, ...] = ()
+    texts: Dict[Locator, str] = field(default_factory=dict)
+
+    def to_script_argument(self) -> Dict:
+        """Serialize for FINGERPRINT_SCRIPT."""
+        return {
+            "url_pattern": self.url_pattern,
+            "selectors": [{"by": by, "value": value} for by, value in self.selectors],
+            "texts": [{"by": by, "value": value, "text": text}
+                      for (by, value), text in self.texts.items()],
+        }
+
+
+@dataclass
+class FingerprintResult:
+    """
+    Outcome of a fingerprint check. Truthy when every part matched.
+
+    Attributes:
+        url: URL at the time of the check
+        url_pattern: Pattern the URL was checked against
+        url_matched: URL matched url_pattern
+        missing: Selectors without a visible match ("by=value")
+        texts: Text mismatches ({locator, expected, actual})
+    """
+    url: str = ""
+    url_pattern: Optional[str] = None
+    url_matched: bool = False
+    missing: List[str] = field(default_factory=list)
+    texts: List[Dict] = field(default_factory=list)
+
+    @property
+    def matched(self) -> bool:
+        """True if URL, selectors and texts all matched."""
+        return self.url_matched and not self.missing and not self.texts
+
+    def __bool__(self) -> bool:
+        return self.matched
+
+    @property
+    def mismatches(self) -> List[str]:
+        """Human-readable list of the parts that did not match."""
+        problems = []
+        if not self.url_matched:
+            problems.append(f"url {self.url!r} does not match {self.url_pattern!r}")
+        problems.extend(f"not visible: {locator}" for locator in self.missing)
+        problems.extend(f"text of {text['locator']}: expected {text['expected']!r}, "
+                        f"got {text['actual']!r}" for text in self.texts)
+        return problems
@@ -7,10 +7,13 @@ Author: Muhammad Yasin Asif
 Portfolio: QA Engineer Portfolio
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from .base_page import BasePage
+from .catalog import Catalog, Product
+from .fingerprint import PageFingerprint
+from .wait_policy import Expect
 
 
 class InventoryPage(BasePage):
@@ -40,6 +43,7 @@ class InventoryPage(BasePage):
     ITEM_DESCRIPTION = (By.CLASS_NAME, "inventory_item_desc")
     ITEM_PRICE = (By.CLASS_NAME, "inventory_item_price")
     ITEM_IMAGE = (By.CLASS_NAME, "inventory_item_img")
+    ITEM_BUTTON = (By.CSS_SELECTOR, "button.btn_inventory")
     
     # Locators - Sorting
     SORT_DROPDOWN = (By.CLASS_NAME, "product_sort_container")
@@ -58,14 +62,75 @@ class InventoryPage(BasePage):
     ADD_FLEECE_JACKET = (By.ID, "add-to-cart-sauce-labs-fleece-jacket")
     ADD_ONESIE = (By.ID, "add-to-cart-sauce-labs-onesie")
     ADD_TSHIRT_RED = (By.ID, "add-to-cart-test.allthethings()-t-shirt-(red)")
+    ADD_TO_CART_BUTTON = (By.CSS_SELECTOR, "button[id^='add-to-cart-']")
     
     # Product Remove Buttons
     REMOVE_BACKPACK = (By.ID, "remove-sauce-labs-backpack")
     REMOVE_BIKE_LIGHT = (By.ID, "remove-sauce-labs-bike-light")
     
+    # Readiness
+    READY_LOCATOR = INVENTORY_LIST
+    FINGERPRINT = PageFingerprint(url_pattern=r"/inventory\.html",
+                                  selectors=(PAGE_TITLE,),
+                                  texts={PAGE_TITLE: "Products"})
+    
+    # Add/remove buttons and the cart badge are used repeatedly; reuse located elements
+    CACHE_ELEMENTS = True
+    
     def __init__(self, driver: WebDriver):
         """Initialize InventoryPage."""
         super().__init__(driver)
+        self._catalog: Optional[Catalog] = None
+    
+    # =========================================================================
+    # CATALOG
+    # =========================================================================
+    
+    def catalog(self, expect: Expect = Expect.PRESENT) -> Catalog:
+        """
+        Get every product on the page, parsed in one batched read.
+        
+        The result is kept until a click, sort or navigation may have
+        changed the grid (order, or add/remove buttons).
+        
+        Args:
+            expect: Expect.PRESENT waits for the grid, Expect.ABSENT reads
+                    once (an empty catalog when there is no grid)
+        
+        Returns:
+            Catalog indexed by product name and slug
+        """
+        if self._catalog is None:
+            rows = self.read_many(self.INVENTORY_ITEM, {
+                'name': self.ITEM_NAME,
+                'description': self.ITEM_DESCRIPTION,
+                'price': self.ITEM_PRICE,
+                'button': (self.ITEM_BUTTON, 'id'),
+            }, expect)
+            if not rows:
+                # No grid (yet): do not cache, a later call may wait for it
+                return Catalog([])
+            self._catalog = Catalog([Product.from_row(row) for row in rows])
+        return self._catalog
+    
+    def invalidate_catalog(self):
+        """Drop the parsed catalog; the next catalog() call re-reads the grid."""
+        self._catalog = None
+    
+    def click(self, locator: Tuple[str, str]):
+        """Click an element (add/remove buttons change the catalog)."""
+        self.invalidate_catalog()
+        return super().click(locator)
+    
+    def select_by_value(self, locator: Tuple[str, str], value: str):
+        """Select an option by value (sorting reorders the catalog)."""
+        self.invalidate_catalog()
+        return super().select_by_value(locator, value)
+    
+    def _clear_element_cache(self):
+        """Drop cached elements and the catalog before the document changes."""
+        self.invalidate_catalog()
+        super()._clear_element_cache()
     
     # =========================================================================
     # PAGE NAVIGATION
@@ -152,20 +217,37 @@ class InventoryPage(BasePage):
         self.click(self.ADD_FLEECE_JACKET)
         return self
     
+    def add_products_to_cart(self, product_names: Optional[List[str]] = None):
+        """
+        Add several products with one script call, then verify once.
+        
+        Args:
+            product_names: Names like 'sauce-labs-backpack'
+                           (None adds every product not yet in the cart)
+            
+        Raises:
+            TimeoutException: If the page is not ready or an Add button remains
+            NoSuchElementException: If a named product has no Add button
+        """
+        if product_names is None:
+            targets = [self.ADD_TO_CART_BUTTON]
+        else:
+            targets = [(By.ID, f"add-to-cart-{name}") for name in product_names]
+        self._bulk_click(targets, product_names, "Add products to cart")
+        return self
+    
     def add_all_products_to_cart(self):
         """Add all products to cart."""
-        self.add_backpack_to_cart()
-        self.add_bike_light_to_cart()
-        self.add_bolt_tshirt_to_cart()
-        self.add_fleece_jacket_to_cart()
-        self.click(self.ADD_ONESIE)
-        self.click(self.ADD_TSHIRT_RED)
-        return self
+        return self.add_products_to_cart()
+    
+    @staticmethod
+    def product_name_locator(product_name: str) -> tuple:
+        """Get the product name link locator for a product."""
+        return (By.XPATH, f"//div[@class='inventory_item_name ' and text()='{product_name}']")
     
     def click_product(self, product_name: str):
         """Click on a product to view details."""
-        locator = (By.XPATH, f"//div[@class='inventory_item_name ' and text()='{product_name}']")
-        self.click(locator)
+        self.click(self.product_name_locator(product_name))
         return self
     
     # =========================================================================
@@ -198,38 +280,28 @@ class InventoryPage(BasePage):
     
     def is_inventory_page_displayed(self) -> bool:
         """Check if inventory page is displayed."""
-        return (self.is_element_visible(self.PAGE_TITLE) and 
-                "inventory" in self.get_current_url())
+        return bool(self.verify_page())
     
     def get_page_title(self) -> str:
         """Get the page title text."""
         return self.get_text(self.PAGE_TITLE)
     
     def get_cart_count(self) -> int:
-        """Get the number of items in cart."""
-        if self.is_element_present(self.SHOPPING_CART_BADGE):
-            badge_text = self.get_text(self.SHOPPING_CART_BADGE)
-            return int(badge_text) if badge_text else 0
-        return 0
+        """Get the number of items in cart (no badge means 0; no wait)."""
+        badge_text = self.peek(self.SHOPPING_CART_BADGE)
+        return int(badge_text) if badge_text else 0
     
     def get_product_count(self) -> int:
         """Get the number of products on the page."""
-        products = self.find_elements(self.INVENTORY_ITEM)
-        return len(products)
+        return len(self.catalog())
     
     def get_all_product_names(self) -> List[str]:
         """Get list of all product names."""
-        name_elements = self.find_elements(self.ITEM_NAME)
-        return [elem.text for elem in name_elements]
+        return self.catalog().names()
     
     def get_all_product_prices(self) -> List[float]:
         """Get list of all product prices."""
-        price_elements = self.find_elements(self.ITEM_PRICE)
-        prices = []
-        for elem in price_elements:
-            price_text = elem.text.replace("$", "")
-            prices.append(float(price_text))
-        return prices
+        return self.catalog().prices()
     
     def get_product_info(self, index: int = 0) -> Dict:
         """
@@ -241,18 +313,20 @@ class InventoryPage(BasePage):
         Returns:
             Dictionary with product info
         """
-        products = self.find_elements(self.INVENTORY_ITEM)
-        if index >= len(products):
+        catalog = self.catalog()
+        if index >= len(catalog):
             return {}
-        
-        product = products[index]
-        return {
-            'name': product.find_element(*self.ITEM_NAME).text,
-            'description': product.find_element(*self.ITEM_DESCRIPTION).text,
-            'price': product.find_element(*self.ITEM_PRICE).text
-        }
+        return catalog[index].to_dict()
     
     def is_product_in_cart(self, product_name: str) -> bool:
-        """Check if product has been added to cart (Remove button visible)."""
-        locator = (By.ID, f"remove-{product_name}")
-        return self.is_element_present(locator)
+        """
+        Check if product has been added to cart (Remove button shown).
+        
+        Args:
+            product_name: Name like 'sauce-labs-backpack'
+        
+        Returns:
+            False at once when there is no inventory grid
+        """
+        product = self.catalog(Expect.ABSENT).by_slug(product_name)
+        return product is not None and product.in_cart
@@ -10,6 +10,7 @@ Portfolio: QA Engineer Portfolio
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from .base_page import BasePage
+from .fingerprint import PageFingerprint
 
 
 class LoginPage(BasePage):
@@ -30,6 +31,13 @@ class LoginPage(BasePage):
     ERROR_CLOSE_BUTTON = (By.CLASS_NAME, "error-button")
     LOGIN_LOGO = (By.CLASS_NAME, "login_logo")
     
+    # Readiness
+    READY_LOCATOR = LOGIN_BUTTON
+    FINGERPRINT = PageFingerprint(selectors=(LOGIN_LOGO,))
+    
+    # Fields and button are used repeatedly; reuse located elements
+    CACHE_ELEMENTS = True
+    
     def __init__(self, driver: WebDriver):
         """Initialize LoginPage."""
         super().__init__(driver)
@@ -58,19 +66,22 @@ class LoginPage(BasePage):
         self.click(self.LOGIN_BUTTON)
         return self
     
-    def login(self, username: str, password: str):
+    def login(self, username: str, password: str, keystrokes: bool = False):
         """
         Perform complete login action.
         
         Args:
             username: User's username
             password: User's password
+            keystrokes: Type credentials key by key instead of one fill_form call
             
         Returns:
             InventoryPage if login successful
         """
-        self.enter_username(username)
-        self.enter_password(password)
+        self.fill_form({
+            self.USERNAME_INPUT: username,
+            self.PASSWORD_INPUT: password,
+        }, keystrokes=keystrokes)
         self.click_login()
         
         # Return InventoryPage if login successful
@@ -97,17 +108,15 @@ class LoginPage(BasePage):
     
     def is_login_page_displayed(self) -> bool:
         """Check if login page is displayed."""
-        return self.is_element_visible(self.LOGIN_LOGO)
+        return bool(self.verify_page())
     
     def is_login_successful(self) -> bool:
         """Check if login was successful (redirected to inventory)."""
-        return self.wait_for_url_contains("inventory")
+        return self.wait_for_url_or_error("inventory", self.ERROR_MESSAGE)
     
     def get_error_message(self) -> str:
-        """Get the error message text."""
-        if self.is_element_visible(self.ERROR_MESSAGE):
-            return self.get_text(self.ERROR_MESSAGE)
-        return ""
+        """Get the error message text ("" if none is shown; no wait)."""
+        return self.peek(self.ERROR_MESSAGE) or ""
     
     def is_error_displayed(self) -> bool:
         """Check if error message is displayed."""
@@ -115,7 +124,7 @@ class LoginPage(BasePage):
     
     def close_error_message(self):
         """Close the error message."""
-        if self.is_element_visible(self.ERROR_CLOSE_BUTTON):
+        if not self.query_absent(self.ERROR_CLOSE_BUTTON):
             self.click(self.ERROR_CLOSE_BUTTON)
         return self
     
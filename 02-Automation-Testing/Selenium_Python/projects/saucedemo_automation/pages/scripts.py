@@ -0,0 +1,209 @@
+"""
+Page Scripts
+============
+JavaScript snippets that let page objects do in one execute_script call
+what would otherwise take one WebDriver round trip per element.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+
+# query(root, by, value, all): resolve a Selenium locator inside the page.
+# Supports id, name, class name, css selector, tag name and xpath.
+LOCATOR_QUERY_JS = """
+function query(root, by, value, all) {
+    if (by === 'xpath') {
+        var type = all ? XPathResult.ORDERED_NODE_SNAPSHOT_TYPE
+                       : XPathResult.FIRST_ORDERED_NODE_TYPE;
+        var result = document.evaluate(value, root, null, type, null);
+        if (!all) { return result.singleNodeValue; }
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+        return nodes;
+    }
+    var css = value;
+    if (by === 'id') { css = '[id="' + value.replace(/"/g, '\\\\"') + '"]'; }
+    else if (by === 'name') { css = '[name="' + value.replace(/"/g, '\\\\"') + '"]'; }
+    else if (by === 'class name') { css = '.' + CSS.escape(value); }
+    return all ? Array.prototype.slice.call(root.querySelectorAll(css)) : root.querySelector(css);
+}
+function isShown(element) {
+    var style = window.getComputedStyle(element);
+    return style.visibility !== 'hidden' && style.display !== 'none'
+        && !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length);
+}
+"""
+
+# Reads text/attributes of every container match in one round trip.
+# arguments: [container_by, container_value], [{name, by, value, attribute}]
+READ_MANY_SCRIPT = LOCATOR_QUERY_JS + """
+var container = arguments[0], fields = arguments[1];
+function read(target, attribute) {
+    if (target === null) { return null; }
+    if (!attribute) { return (target.innerText || '').trim(); }
+    var property = target[attribute];
+    if (property !== undefined && property !== null && typeof property !== 'object'
+            && typeof property !== 'function') {
+        return String(property);
+    }
+    return target.getAttribute(attribute);
+}
+return query(document, container[0], container[1], true).map(function (element) {
+    var row = {};
+    fields.forEach(function (field) {
+        var target = field.by === null ? element : query(element, field.by, field.value, false);
+        row[field.name] = read(target, field.attribute);
+    });
+    return row;
+});
+"""
+
+# Checks a cached element is still the first match of its locator and,
+# optionally, visible ('visible') or visible and enabled ('clickable').
+# arguments: element, by, value, state -> [valid, location.href]
+VALIDATE_CACHED_SCRIPT = LOCATOR_QUERY_JS + """
+var element = arguments[0], state = arguments[3];
+function valid() {
+    if (!element.isConnected || query(document, arguments[1], arguments[2], false) !== element) {
+        return false;
+    }
+    if ((state === 'visible' || state === 'clickable') && !isShown(element)) {
+        return false;
+    }
+    return state !== 'clickable' || !element.disabled;
+}
+return [valid.apply(null, arguments), window.location.href];
+"""
+
+# Snapshots one locator without waiting: the trimmed text of its first
+# match, if that match is shown.
+# arguments: by, value -> text, or null when absent or hidden
+PEEK_SCRIPT = LOCATOR_QUERY_JS + """
+var element = query(document, arguments[0], arguments[1], false);
+if (!element || !isShown(element)) { return null; }
+return (element.innerText || element.textContent || '').trim();
+"""
+
+# Clicks every element matching any of the locators. All matches are
+# collected before the first click, so a re-render caused by one click
+# cannot shift the rest; elements detached meanwhile are skipped.
+# arguments: [{by, value}] -> elements clicked per locator
+CLICK_ALL_SCRIPT = LOCATOR_QUERY_JS + """
+var seen = [];
+var groups = arguments[0].map(function (locator) {
+    return query(document, locator.by, locator.value, true).filter(function (element) {
+        if (seen.indexOf(element) !== -1) { return false; }
+        seen.push(element);
+        return true;
+    });
+});
+return groups.map(function (elements) {
+    var clicked = 0;
+    elements.forEach(function (element) {
+        if (element.isConnected) { element.click(); clicked++; }
+    });
+    return clicked;
+});
+"""
+
+# Counts elements matching any of the locators.
+# arguments: [{by, value}] -> number of matches
+COUNT_MATCHES_SCRIPT = LOCATOR_QUERY_JS + """
+return arguments[0].reduce(function (total, locator) {
+    return total + query(document, locator.by, locator.value, true).length;
+}, 0);
+"""
+
+# Resolves as soon as a state holds, driven by a MutationObserver on the
+# document and popstate/hashchange listeners (plus a 100 ms check for
+# pushState and style changes that fire neither).
+# arguments: state, by, value, timeout_ms, callback
+# state: present | visible | clickable (by/value locator),
+#        url_contains | title_contains (value text)
+# Calls back with the element / true, or null after timeout_ms.
+WAIT_FOR_STATE_SCRIPT = LOCATOR_QUERY_JS + """
+var state = arguments[0], by = arguments[1], value = arguments[2];
+var timeoutMs = arguments[3], done = arguments[arguments.length - 1];
+function evaluate() {
+    if (state === 'url_contains') { return window.location.href.indexOf(value) !== -1 ? true : null; }
+    if (state === 'title_contains') { return document.title.indexOf(value) !== -1 ? true : null; }
+    var element = query(document, by, value, false);
+    if (!element) { return null; }
+    if (state === 'present') { return element; }
+    if (!isShown(element)) { return null; }
+    if (state === 'clickable' && element.disabled) { return null; }
+    return element;
+}
+var initial = evaluate();
+if (initial !== null) { done(initial); return; }
+var finished = false, observer, timer, deadline;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    window.removeEventListener('popstate', check);
+    window.removeEventListener('hashchange', check);
+    clearInterval(timer);
+    clearTimeout(deadline);
+    done(result);
+}
+function check() {
+    var result = evaluate();
+    if (result !== null) { finish(result); }
+}
+observer = new MutationObserver(check);
+observer.observe(document.documentElement || document,
+                 {childList: true, subtree: true, attributes: true, characterData: true});
+window.addEventListener('popstate', check);
+window.addEventListener('hashchange', check);
+timer = setInterval(check, 100);
+deadline = setTimeout(function () { finish(null); }, timeoutMs);
+"""
+
+# Sets form field values the way React expects: through the native value
+# setter of the element's prototype (bypassing React's value tracker),
+# followed by bubbling input and change events.
+# Nothing is set unless every field is found.
+# arguments: [{by, value, text}] -> list of "by=value" for missing fields
+FILL_FORM_SCRIPT = LOCATOR_QUERY_JS + """
+var fields = arguments[0];
+var elements = fields.map(function (field) { return query(document, field.by, field.value, false); });
+var missing = [];
+elements.forEach(function (element, index) {
+    if (!element) { missing.push(fields[index].by + '=' + fields[index].value); }
+});
+if (missing.length) { return missing; }
+elements.forEach(function (element, index) {
+    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value').set;
+    setter.call(element, fields[index].text);
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return missing;
+"""
+
+# Checks a page fingerprint in one evaluation.
+# arguments: {url_pattern (RegExp source or null), selectors: [{by, value}],
+#             texts: [{by, value, text}]}
+# -> {url, url_matched, missing: ["by=value"], texts: [{locator, expected, actual}]}
+FINGERPRINT_SCRIPT = LOCATOR_QUERY_JS + """
+var fingerprint = arguments[0];
+var result = {url: window.location.href, url_matched: true, missing: [], texts: []};
+if (fingerprint.url_pattern !== null) {
+    result.url_matched = new RegExp(fingerprint.url_pattern).test(result.url);
+}
+fingerprint.selectors.forEach(function (selector) {
+    var element = query(document, selector.by, selector.value, false);
+    if (!element || !isShown(element)) { result.missing.push(selector.by + '=' + selector.value); }
+});
+fingerprint.texts.forEach(function (expected) {
+    var element = query(document, expected.by, expected.value, false);
+    var actual = element ? (element.innerText || '').trim() : null;
+    if (actual === null || actual.toLowerCase().indexOf(expected.text.toLowerCase()) === -1) {
+        result.texts.push({locator: expected.by + '=' + expected.value,
+                           expected: expected.text, actual: actual});
+    }
+});
+return result;
+"""
@@ -0,0 +1,249 @@
+"""
+Wait Policy
+===========
+Single owner of all waiting done by the page objects.
+
+Implicit waits are disabled (browser.implicit_wait: 0), so every wait is
+explicit and goes through a WaitPolicy. Queries state what they expect:
+
+- Expect.PRESENT: the condition should become true, so wait for it
+  (up to a named timeout from config.yaml timeouts)
+- Expect.ABSENT: the condition is usually false, so check it once and
+  return immediately instead of burning the timeout
+
+The built-in states (present, visible, clickable, url_contains,
+title_contains) are waited on by an in-page MutationObserver through
+execute_async_script (backend 'mutation'): the wait resolves as soon as
+the DOM changes instead of on the next 500 ms poll, and costs one round
+trip. If the script fails (page unloaded mid-wait, scripts blocked) the
+rest of the wait falls back to WebDriverWait polling.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import time
+from enum import Enum
+from typing import Callable, Tuple, Union
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException,
+                                        StaleElementReferenceException, WebDriverException)
+
+from .scripts import WAIT_FOR_STATE_SCRIPT
+
+
+Timeout = Union[str, float]
+Target = Union[Tuple[str, str], str]
+
+
+# Polling equivalents of the states WAIT_FOR_STATE_SCRIPT understands
+POLLING_CONDITIONS = {
+    "present": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+    "url_contains": EC.url_contains,
+    "title_contains": EC.title_contains,
+}
+
+
+class Expect(Enum):
+    """What the caller expects a condition to evaluate to."""
+    PRESENT = "present"
+    ABSENT = "absent"
+
+
+class WaitPolicy:
+    """
+    Named timeouts and the wait/check primitives built on them.
+
+    Timeouts can be given as 'short', 'medium', 'long' or as seconds.
+    """
+
+    IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+    BACKENDS = ("mutation", "polling")
+
+    # WebDriver commands of an element lookup that succeeds at once under
+    # polling: find, + is_displayed, + is_enabled
+    POLLING_ROUND_TRIPS = {"present": 1, "visible": 2, "clickable": 3}
+
+    def __init__(self, short: float = 5, medium: float = 10, long: float = 30,
+                 poll_frequency: float = 0.5, backend: str = "mutation",
+                 script_timeout: float = 30):
+        """
+        Initialize WaitPolicy.
+
+        Args:
+            short: Timeout for quick UI reactions (seconds)
+            medium: Default timeout for element lookups (seconds)
+            long: Timeout for slow operations (seconds)
+            poll_frequency: Seconds between condition checks
+            backend: 'mutation' (event-driven) or 'polling' for built-in states
+            script_timeout: Driver script timeout; bounds one async wait call
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Wait backend '{backend}' not supported. "
+                             f"Use one of: {list(self.BACKENDS)}")
+        self.short = short
+        self.medium = medium
+        self.long = long
+        self.poll_frequency = poll_frequency
+        self.backend = backend
+        self.script_timeout = script_timeout
+        self.stats = {"event": 0, "fallback": 0}
+
+    @classmethod
+    def from_config(cls, timeouts) -> "WaitPolicy":
+        """
+        Build a policy from the timeouts section of config.yaml.
+
+        Args:
+            timeouts: TimeoutsConfig instance
+        """
+        return cls(short=timeouts.short, medium=timeouts.medium, long=timeouts.long,
+                   backend=timeouts.wait_backend, script_timeout=timeouts.script)
+
+    def lookup_round_trips(self, state: str) -> int:
+        """Round trips of an element lookup for a state when it succeeds at once."""
+        if self.backend == "mutation":
+            return 1
+        return self.POLLING_ROUND_TRIPS[state]
+
+    def seconds(self, timeout: Timeout) -> float:
+        """Resolve a named timeout ('short', 'medium', 'long') or pass seconds through."""
+        if isinstance(timeout, str):
+            return getattr(self, timeout)
+        return timeout
+
+    # =========================================================================
+    # WAITING
+    # =========================================================================
+
+    def until(self, driver: WebDriver, condition: Callable, timeout: Timeout = "medium",
+              message: str = ""):
+        """
+        Wait for a condition to return a truthy value.
+
+        Args:
+            driver: WebDriver instance
+            condition: Expected condition (callable taking the driver)
+            timeout: Named timeout or seconds
+            message: Message for the TimeoutException
+
+        Returns:
+            The condition's return value
+        """
+        wait = WebDriverWait(driver, self.seconds(timeout), self.poll_frequency,
+                             ignored_exceptions=self.IGNORED_EXCEPTIONS)
+        return wait.until(condition, message)
+
+    def until_not(self, driver: WebDriver, condition: Callable, timeout: Timeout = "medium",
+                  message: str = ""):
+        """Wait for a condition to return a falsy value."""
+        wait = WebDriverWait(driver, self.seconds(timeout), self.poll_frequency,
+                             ignored_exceptions=self.IGNORED_EXCEPTIONS)
+        return wait.until_not(condition, message)
+
+    def until_state(self, driver: WebDriver, state: str, target: Target,
+                    timeout: Timeout = "medium"):
+        """
+        Wait for a built-in state.
+
+        Args:
+            driver: WebDriver instance
+            state: 'present', 'visible', 'clickable' (target is a locator)
+                   or 'url_contains', 'title_contains' (target is text)
+            target: Locator or text
+            timeout: Named timeout or seconds
+
+        Returns:
+            The element for element states, True for url/title states
+        """
+        seconds = self.seconds(timeout)
+        deadline = time.monotonic() + seconds
+        if self.backend == "mutation":
+            try:
+                result = self._until_event(driver, state, target, deadline)
+            except TimeoutException:
+                raise
+            except WebDriverException:
+                self.stats["fallback"] += 1
+            else:
+                self.stats["event"] += 1
+                return result
+        remaining = max(deadline - time.monotonic(), 0)
+        return self.until(driver, POLLING_CONDITIONS[state](target), remaining,
+                          f"Timed out waiting for {state} {target!r}")
+
+    def _until_event(self, driver: WebDriver, state: str, target: Target, deadline: float):
+        """
+        Wait in the page with WAIT_FOR_STATE_SCRIPT.
+
+        One call waits at most script_timeout minus a second of headroom,
+        so long timeouts are split over several calls.
+        """
+        by, value = target if isinstance(target, tuple) else (None, target)
+        budget = max(self.script_timeout - 1, 1)
+        while True:
+            remaining = deadline - time.monotonic()
+            chunk = min(max(remaining, 0), budget)
+            result = driver.execute_async_script(WAIT_FOR_STATE_SCRIPT, state, by, value,
+                                                 int(chunk * 1000))
+            if result is not None:
+                return result
+            if chunk >= remaining:
+                raise TimeoutException(f"Timed out waiting for {state} {target!r}")
+
+    # =========================================================================
+    # CHECKING
+    # =========================================================================
+
+    def check(self, driver: WebDriver, condition: Callable,
+              expect: Expect = Expect.PRESENT, timeout: Timeout = "medium") -> bool:
+        """
+        Evaluate a condition as a boolean.
+
+        Expect.PRESENT waits up to the timeout for the condition to hold.
+        Expect.ABSENT evaluates it once, without waiting.
+
+        Args:
+            driver: WebDriver instance
+            condition: Expected condition (callable taking the driver)
+            expect: What the caller expects
+            timeout: Named timeout or seconds (Expect.PRESENT only)
+
+        Returns:
+            True if the condition holds
+        """
+        if expect is Expect.ABSENT:
+            try:
+                return bool(condition(driver))
+            except self.IGNORED_EXCEPTIONS:
+                return False
+        try:
+            return bool(self.until(driver, condition, timeout))
+        except TimeoutException:
+            return False
+
+    def check_state(self, driver: WebDriver, state: str, target: Target,
+                    expect: Expect = Expect.PRESENT, timeout: Timeout = "medium") -> bool:
+        """
+        Evaluate a built-in state (see until_state) as a boolean.
+
+        Args:
+            driver: WebDriver instance
+            state: State name
+            target: Locator or text
+            expect: What the caller expects
+            timeout: Named timeout or seconds (Expect.PRESENT only)
+
+        Returns:
+            True if the state holds
+        """
+        if expect is Expect.ABSENT:
+            return self.check(driver, POLLING_CONDITIONS[state](target), expect)
+        try:
+            return bool(self.until_state(driver, state, target, timeout))
+        except TimeoutException:
+            return False
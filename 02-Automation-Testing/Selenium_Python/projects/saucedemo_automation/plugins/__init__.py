@@ -0,0 +1,21 @@
+"""
+Plugins Package
+===============
+Pytest plugins for Sauce Demo test automation.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+from .artifacts import ArtifactWriter, FailureArtifacts
+from .parallel import ParallelScheduler, WorkerReporter, get_worker_id
+from .profiler import CommandProfiler
+
+__all__ = [
+    'ArtifactWriter',
+    'FailureArtifacts',
+    'CommandProfiler',
+    'ParallelScheduler',
+    'WorkerReporter',
+    'get_worker_id'
+]
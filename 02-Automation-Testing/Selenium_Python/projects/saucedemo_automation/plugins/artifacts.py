@@ -0,0 +1,242 @@
+"""
+Failure Artifacts Plugin
+========================
+Screenshots and DOM snapshots of failed tests, written in the background.
+
+On failure the test thread only grabs the raw data (the base64 screenshot
+string and the page HTML, two WebDriver commands) and queues it. A single
+writer thread decodes the screenshot, recompresses the PNG at the highest
+zlib level, gzips the DOM and writes both files, so teardown never waits
+on encoding or disk I/O. The queue is bounded; when it is full the
+artifact is dropped and counted instead of growing memory.
+
+File names carry the worker id, a microsecond timestamp and a sequence
+number, so parallel workers never overwrite each other.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import base64
+import gzip
+import itertools
+import os
+import queue
+import struct
+import threading
+import zlib
+from datetime import datetime
+from typing import Dict, Optional
+
+import pytest
+
+from .parallel import get_worker_id
+
+
+DRIVER_FIXTURES = ('driver', 'driver_headless')
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+DOM_SNAPSHOT_SCRIPT = "return document.documentElement ? document.documentElement.outerHTML : '';"
+
+
+def recompress_png(data: bytes, level: int = 9) -> bytes:
+    """
+    Re-deflate a PNG's image data at a higher zlib level.
+
+    Browsers encode screenshots for speed; merging the IDAT chunks and
+    compressing them again is lossless and usually noticeably smaller.
+    Data that does not parse as PNG is returned unchanged.
+
+    Args:
+        data: PNG file bytes
+        level: zlib compression level
+
+    Returns:
+        PNG file bytes (never larger than the input)
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        return data
+    chunks = []
+    image_data = bytearray()
+    position = len(PNG_SIGNATURE)
+    try:
+        while position < len(data):
+            length, kind = struct.unpack('>I4s', data[position:position + 8])
+            body = data[position + 8:position + 8 + length]
+            position += 12 + length
+            if kind == b'IDAT':
+                image_data += body
+                if chunks and chunks[-1][0] == b'IDAT':
+                    continue
+                chunks.append((b'IDAT', None))
+            else:
+                chunks.append((kind, body))
+        raw = zlib.decompress(bytes(image_data))
+    except (struct.error, zlib.error):
+        return data
+
+    output = bytearray(PNG_SIGNATURE)
+    for kind, body in chunks:
+        if kind == b'IDAT':
+            body = zlib.compress(raw, level)
+        output += struct.pack('>I', len(body)) + kind + body
+        output += struct.pack('>I', zlib.crc32(kind + body) & 0xffffffff)
+    return bytes(output) if len(output) < len(data) else data
+
+
+class ArtifactWriter:
+    """
+    Background writer for failure artifacts.
+
+    Features:
+    - Bounded queue (drops instead of blocking the test thread)
+    - Unique per-worker file names
+    - PNG recompression and gzipped DOM snapshots off the test thread
+    """
+
+    def __init__(self, directory: str, max_pending: int = 8):
+        """
+        Initialize ArtifactWriter.
+
+        Args:
+            directory: Directory the artifacts are written to
+            max_pending: Artifacts held in memory before new ones are dropped
+        """
+        self.directory = directory
+        self.worker_id = get_worker_id() or 'main'
+        self.stats = {'queued': 0, 'written': 0, 'dropped': 0, 'failed': 0,
+                      'bytes_in': 0, 'bytes_out': 0}
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='artifact-writer', daemon=True)
+        self._thread.start()
+
+    def unique_name(self, test_name: str) -> str:
+        """File name stem unique across workers, processes and fast failures."""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        safe_name = ''.join(char if char.isalnum() or char in '-_.' else '_' for char in test_name)
+        return f"{safe_name}_{self.worker_id}_{timestamp}_{next(self._sequence)}"
+
+    def capture(self, driver, test_name: str) -> Optional[Dict[str, str]]:
+        """
+        Grab a screenshot and DOM snapshot and queue them for writing.
+
+        Args:
+            driver: WebDriver of the failed test
+            test_name: Test name used in the file names
+
+        Returns:
+            Paths the artifacts will be written to, or None if dropped
+        """
+        screenshot = driver.get_screenshot_as_base64()
+        try:
+            dom = driver.execute_script(DOM_SNAPSHOT_SCRIPT)
+        except Exception:
+            dom = None
+
+        stem = os.path.join(self.directory, self.unique_name(test_name))
+        paths = {'screenshot': f"{stem}.png"}
+        if dom:
+            paths['dom_snapshot'] = f"{stem}.html.gz"
+        try:
+            self._queue.put_nowait((paths, screenshot, dom))
+        except queue.Full:
+            self._count('dropped')
+            return None
+        self._count('queued')
+        return paths
+
+    def close(self, timeout: Optional[float] = 30):
+        """Write everything still queued and stop the writer thread."""
+        self._queue.put((None, None, None))
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Writer thread: encode, compress and write queued artifacts."""
+        os.makedirs(self.directory, exist_ok=True)
+        while True:
+            paths, screenshot, dom = self._queue.get()
+            if paths is None:
+                return
+            try:
+                png = base64.b64decode(screenshot)
+                compressed = recompress_png(png)
+                with open(paths['screenshot'], 'wb') as file:
+                    file.write(compressed)
+                written = len(compressed)
+                if dom:
+                    with gzip.open(paths['dom_snapshot'], 'wt', encoding='utf-8') as file:
+                        file.write(dom)
+                    written += os.path.getsize(paths['dom_snapshot'])
+                with self._lock:
+                    self.stats['bytes_in'] += len(png) + len((dom or '').encode('utf-8'))
+                    self.stats['bytes_out'] += written
+                self._count('written')
+            except Exception as e:
+                print(f"Failed to write failure artifacts {paths}: {e}")
+                self._count('failed')
+
+    def _count(self, key: str):
+        """Update a counter."""
+        with self._lock:
+            self.stats[key] += 1
+
+    def format_summary(self) -> str:
+        """One-line summary for the terminal."""
+        stats = self.stats
+        line = (f"written={stats['written']} dropped={stats['dropped']} "
+                f"failed={stats['failed']} dir={self.directory}")
+        if stats['bytes_in']:
+            line += (f" size {stats['bytes_in'] / 1024:.0f}KB -> "
+                     f"{stats['bytes_out'] / 1024:.0f}KB")
+        return line
+
+
+class FailureArtifacts:
+    """
+    Pytest plugin capturing artifacts of failed tests through an ArtifactWriter.
+    """
+
+    def __init__(self, directory: str, max_pending: int = 8):
+        """
+        Initialize FailureArtifacts.
+
+        Args:
+            directory: Directory the artifacts are written to
+            max_pending: Bounded queue size of the writer
+        """
+        self.writer = ArtifactWriter(directory, max_pending)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        """Capture artifacts when the test body fails."""
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != 'call' or not report.failed:
+            return
+        driver = next((item.funcargs[name] for name in DRIVER_FIXTURES
+                       if item.funcargs.get(name)), None)
+        if driver is None:
+            return
+        try:
+            paths = self.writer.capture(driver, item.name)
+        except Exception as e:
+            print(f"\nCould not capture failure artifacts: {e}")
+            return
+        if paths is None:
+            print("\nFailure artifacts dropped (writer queue full)")
+            return
+        for name, path in paths.items():
+            report.user_properties.append((name, path))
+        print(f"\nScreenshot queued: {paths['screenshot']}")
+
+    def pytest_sessionfinish(self, session):
+        """Flush pending artifacts before the session ends."""
+        self.writer.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Report artifact counts and compression."""
+        stats = self.writer.stats
+        if stats['queued'] or stats['dropped']:
+            terminalreporter.write_sep('-', 'failure artifacts')
+            terminalreporter.write_line(self.writer.format_summary())
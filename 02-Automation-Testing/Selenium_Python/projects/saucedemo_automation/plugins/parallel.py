@@ -0,0 +1,334 @@
+"""
+Parallel Execution Plugin
+=========================
+Built-in parallel scheduler honoring execution.parallel_mode and
+execution.max_workers from config.yaml.
+
+The controller process collects the tests, splits them across worker
+processes (longest-first, using durations from the previous run) and
+replays every worker report through the normal pytest hooks, so the
+terminal output, JUnit XML and HTML reports come out as one run.
+
+-x / --maxfail (and execution.fail_fast) are forwarded to the workers and
+also apply to the run as a whole: once the replayed failures reach the
+limit, the remaining workers are stopped and their unrun tests skipped.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import pytest
+
+
+WORKER_ENV = 'SAUCEDEMO_WORKER_ID'
+RESULTS_ENV = 'SAUCEDEMO_WORKER_RESULTS'
+DURATIONS_CACHE_KEY = 'saucedemo/durations'
+DEFAULT_DURATION = 10.0
+
+
+def get_worker_id() -> Optional[str]:
+    """Return the worker id (gw0, gw1, ...) when running inside a worker."""
+    return os.environ.get(WORKER_ENV)
+
+
+def add_options(parser):
+    """Register command line options for parallel execution."""
+    group = parser.getgroup('parallel', 'parallel execution')
+    group.addoption('--workers', type=int, default=None,
+                    help='Number of worker processes (overrides execution.max_workers)')
+    group.addoption('--no-parallel', action='store_true', default=False,
+                    help='Run serially even if execution.parallel_mode is true')
+
+
+def resolve_worker_count(config, execution) -> int:
+    """
+    Decide how many workers to use.
+
+    Args:
+        config: pytest config
+        execution: ExecutionConfig (execution section of config.yaml)
+
+    Returns:
+        Number of workers (1 means serial execution)
+    """
+    if get_worker_id() or config.getoption('no_parallel'):
+        return 1
+    workers = config.getoption('workers')
+    if workers is not None:
+        return max(workers, 1)
+    if execution.parallel_mode:
+        return max(execution.max_workers, 1)
+    return 1
+
+
+class WorkerReporter:
+    """
+    Worker-side plugin that streams serialized reports to a JSON lines file.
+    """
+
+    def __init__(self, config, results_path: str):
+        """
+        Initialize WorkerReporter.
+
+        Args:
+            config: pytest config
+            results_path: File the controller reads reports from
+        """
+        self.config = config
+        self.file = open(results_path, 'a', buffering=1)
+
+    def pytest_runtest_logreport(self, report):
+        """Write each report as soon as it is produced."""
+        data = self.config.hook.pytest_report_to_serializable(config=self.config,
+                                                              report=report)
+        data['worker_id'] = get_worker_id()
+        self.file.write(json.dumps(data) + '\n')
+
+    def pytest_unconfigure(self, config):
+        """Close the results file."""
+        self.file.close()
+
+
+class ParallelScheduler:
+    """
+    Controller-side plugin that distributes tests across worker processes.
+
+    Features:
+    - Longest-processing-time-first partitioning from cached durations
+    - Live replay of worker reports into the controller session
+    - Crashed workers reported as failures of their unfinished tests
+    - Run-wide --maxfail: remaining workers stopped once it is reached
+    - Screenshots from all workers merged into one summary
+    """
+
+    def __init__(self, config, workers: int):
+        """
+        Initialize ParallelScheduler.
+
+        Args:
+            config: pytest config
+            workers: Number of worker processes
+        """
+        self.config = config
+        self.workers = workers
+        self.maxfail = config.getoption('maxfail') or 0
+        self.stopped = False
+        self.screenshots: List[str] = []
+        self.worker_stats: Dict[str, Dict] = {}
+        self.wall_time = 0.0
+
+    # =========================================================================
+    # SCHEDULING
+    # =========================================================================
+
+    def partition(self, items: List) -> List[List]:
+        """
+        Split items into balanced groups.
+
+        Uses durations recorded by the previous run so long tests are
+        spread first; unknown tests get a default estimate.
+
+        Args:
+            items: Collected test items
+
+        Returns:
+            One list of items per worker
+        """
+        durations = self.config.cache.get(DURATIONS_CACHE_KEY, {}) if self.config.cache else {}
+        count = min(self.workers, len(items))
+        groups: List[List] = [[] for _ in range(count)]
+        loads = [0.0] * count
+
+        ordered = sorted(items, key=lambda item: durations.get(item.nodeid, DEFAULT_DURATION),
+                         reverse=True)
+        for item in ordered:
+            target = loads.index(min(loads))
+            groups[target].append(item)
+            loads[target] += durations.get(item.nodeid, DEFAULT_DURATION)
+
+        # Keep the original collection order inside each worker
+        position = {item.nodeid: index for index, item in enumerate(items)}
+        for group in groups:
+            group.sort(key=lambda item: position[item.nodeid])
+        return groups
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        """Run the collected tests in worker processes."""
+        if session.testsfailed and not session.config.option.continue_on_collection_errors:
+            raise session.Interrupted(f"{session.testsfailed} errors during collection")
+        if session.config.option.collectonly or not session.items:
+            return True
+
+        start = time.perf_counter()
+        run_dir = tempfile.mkdtemp(prefix='saucedemo-workers-')
+        workers = [self._spawn(index, group, run_dir)
+                   for index, group in enumerate(self.partition(session.items))]
+
+        while any(worker['process'].poll() is None for worker in workers):
+            for worker in workers:
+                self._drain(worker)
+            if session.shouldfail or session.shouldstop:
+                self._stop(workers)
+            time.sleep(0.1)
+        for worker in workers:
+            self._drain(worker)
+        self.stopped = bool(session.shouldfail or session.shouldstop)
+        for worker in workers:
+            self._report_missing(worker)
+
+        self.wall_time = time.perf_counter() - start
+        self._store_durations(workers)
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        return True
+
+    # =========================================================================
+    # WORKERS
+    # =========================================================================
+
+    def _spawn(self, index: int, items: List, run_dir: str) -> Dict:
+        """Start a worker process for a group of items."""
+        worker_id = f'gw{index}'
+        results_path = os.path.join(run_dir, f'{worker_id}.jsonl')
+        log_path = os.path.join(run_dir, f'{worker_id}.log')
+        open(results_path, 'w').close()
+
+        env = dict(os.environ)
+        env[WORKER_ENV] = worker_id
+        env[RESULTS_ENV] = results_path
+
+        args = [sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider',
+                '--rootdir', str(self.config.rootpath), '--no-parallel']
+        if self.maxfail:
+            args.append(f'--maxfail={self.maxfail}')
+        args.extend(item.nodeid for item in items)
+
+        log_file = open(log_path, 'w')
+        process = subprocess.Popen(args, cwd=str(self.config.rootpath), env=env,
+                                   stdout=log_file, stderr=subprocess.STDOUT)
+        return {
+            'id': worker_id,
+            'items': {item.nodeid: item for item in items},
+            'finished': set(),
+            'durations': {},
+            'process': process,
+            'log_path': log_path,
+            'log_file': log_file,
+            'results': open(results_path, 'r'),
+            'buffer': '',
+        }
+
+    def _stop(self, workers: List[Dict]):
+        """Terminate workers still running after the run hit --maxfail."""
+        for worker in workers:
+            if worker['process'].poll() is None:
+                worker['process'].terminate()
+                worker['process'].wait()
+
+    def _drain(self, worker: Dict):
+        """Replay any new reports written by a worker."""
+        worker['buffer'] += worker['results'].read()
+        *lines, worker['buffer'] = worker['buffer'].split('\n')
+        for line in lines:
+            if line.strip():
+                self._replay(worker, json.loads(line))
+
+    def _replay(self, worker: Dict, data: Dict):
+        """Feed a worker report through the controller's hooks."""
+        hook = self.config.hook
+        data.pop('worker_id', None)
+        report = hook.pytest_report_from_serializable(config=self.config, data=data)
+
+        if report.when == 'setup':
+            hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+        hook.pytest_runtest_logreport(report=report)
+
+        worker['durations'][report.nodeid] = \
+            worker['durations'].get(report.nodeid, 0.0) + report.duration
+        for name, value in report.user_properties:
+            if name == 'screenshot':
+                self.screenshots.append(value)
+        if report.when == 'teardown':
+            worker['finished'].add(report.nodeid)
+            hook.pytest_runtest_logfinish(nodeid=report.nodeid, location=report.location)
+
+    def _report_missing(self, worker: Dict):
+        """
+        Report tests a crashed worker never finished as failures.
+
+        After the run was stopped (--maxfail) unfinished tests are left
+        unreported, as in a serial run.
+        """
+        worker['log_file'].close()
+        worker['results'].close()
+        missing = [nodeid for nodeid in worker['items'] if nodeid not in worker['finished']]
+
+        self.worker_stats[worker['id']] = {
+            'tests': len(worker['items']),
+            'exit_code': worker['process'].returncode,
+            'duration': sum(worker['durations'].values()),
+            'crashed': bool(missing) and not self.stopped,
+            'not_run': len(missing),
+        }
+        if not missing or self.stopped:
+            return
+
+        with open(worker['log_path'], 'r', errors='replace') as file:
+            log_tail = ''.join(file.readlines()[-30:])
+        for nodeid in missing:
+            item = worker['items'][nodeid]
+            report = pytest.TestReport(
+                nodeid=nodeid, location=item.location, keywords={},
+                outcome='failed', when='call',
+                longrepr=(f"Worker {worker['id']} exited with code "
+                          f"{worker['process'].returncode} before finishing this test.\n"
+                          f"{log_tail}"),
+            )
+            self.config.hook.pytest_runtest_logstart(nodeid=nodeid, location=item.location)
+            self.config.hook.pytest_runtest_logreport(report=report)
+            self.config.hook.pytest_runtest_logfinish(nodeid=nodeid, location=item.location)
+
+    def _store_durations(self, workers: List[Dict]):
+        """Remember per-test durations to balance the next run."""
+        if not self.config.cache:
+            return
+        durations = self.config.cache.get(DURATIONS_CACHE_KEY, {})
+        for worker in workers:
+            durations.update(worker['durations'])
+        self.config.cache.set(DURATIONS_CACHE_KEY, durations)
+
+    # =========================================================================
+    # REPORTING
+    # =========================================================================
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Summarize worker load and merged screenshots."""
+        if not self.worker_stats:
+            return
+        terminalreporter.write_sep('-', f'parallel execution ({self.workers} workers)')
+        busy = 0.0
+        for worker_id, stats in sorted(self.worker_stats.items()):
+            busy += stats['duration']
+            if stats['crashed']:
+                status = 'CRASHED'
+            elif self.stopped and stats['not_run']:
+                status = f"stopped, {stats['not_run']} not run"
+            else:
+                status = f"exit {stats['exit_code']}"
+            terminalreporter.write_line(f"{worker_id}: {stats['tests']} tests, "
+                                        f"{stats['duration']:.1f}s busy, {status}")
+        if self.wall_time:
+            terminalreporter.write_line(f"wall time {self.wall_time:.1f}s, "
+                                        f"serial estimate {busy:.1f}s, "
+                                        f"speedup x{busy / self.wall_time:.2f}")
+        for path in self.screenshots:
+            terminalreporter.write_line(f"screenshot: {path}")
@@ -0,0 +1,329 @@
+"""
+Command Profiler Plugin
+=======================
+Per-test profile of the WebDriver commands sent by the suite
+(enabled with --profile-commands).
+
+The driver's command executor is wrapped once per session, so every
+BasePage method, fixture and test goes through it. Each command is
+recorded with its name, locator, latency and request / response payload
+size, and attributed to the outermost page-object method on the call
+stack. Locators are taken from find commands and from the arguments of
+the page-object scripts (pages/scripts.py) that replaced most finds.
+Commands sent by BrowserPool (session reset on release) are recorded
+under their own bucket, so they do not count as test round trips.
+
+At session end the plugin ranks:
+- commands by total time
+- tests by round trips
+- page-object methods by total time
+
+and writes reports/command_profile.json (parallel workers write their
+own files, which the controller merges).
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+import pytest
+
+import browser_pool
+from pages.scripts import (CLICK_ALL_SCRIPT, COUNT_MATCHES_SCRIPT, FILL_FORM_SCRIPT,
+                           FINGERPRINT_SCRIPT, PEEK_SCRIPT, READ_MANY_SCRIPT,
+                           VALIDATE_CACHED_SCRIPT, WAIT_FOR_STATE_SCRIPT)
+from .parallel import get_worker_id
+
+
+PROFILE_ENV = 'SAUCEDEMO_PROFILE_COMMANDS'
+PAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pages')
+DRIVER_FIXTURES = ('driver', 'driver_headless')
+OUTSIDE_PAGES = '(outside page objects)'
+BACKGROUND = '(background)'
+POOL_RESET = '(pool reset)'
+POOL_FILE = os.path.abspath(browser_pool.__file__)
+
+
+def add_options(parser):
+    """Register command line options for the profiler."""
+    group = parser.getgroup('profiler', 'webdriver command profiler')
+    group.addoption('--profile-commands', action='store_true', default=False,
+                    help='Record every WebDriver command per test and report the chattiest '
+                         'commands, tests and page-object methods')
+
+
+def is_enabled(config) -> bool:
+    """Profiling is on for --profile-commands, or in workers of a profiled run."""
+    return config.getoption('profile_commands') or os.environ.get(PROFILE_ENV) == '1'
+
+
+def page_object_method() -> str:
+    """
+    Name the outermost page-object method on the current call stack.
+
+    Returns:
+        'ClassName.method', or OUTSIDE_PAGES for commands sent by tests/fixtures
+    """
+    owner = OUTSIDE_PAGES
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(PAGES_DIR):
+            instance = frame.f_locals.get('self')
+            if instance is not None:
+                owner = f"{type(instance).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return owner
+
+
+def sent_by_pool() -> bool:
+    """Whether the current command comes from BrowserPool (reset, replacement)."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename == POOL_FILE:
+            return True
+        frame = frame.f_back
+    return False
+
+
+def _pair(by, value) -> Optional[str]:
+    """Format a by/value pair, or None when there is no locator."""
+    return f"{by}={value}" if by is not None else None
+
+
+def _join(locators: List[Dict]) -> Optional[str]:
+    """Format a list of {by, value} locator arguments."""
+    return ', '.join(_pair(item['by'], item['value']) for item in locators) or None
+
+
+# Page-object script -> locator(s) in its argument list
+SCRIPT_LOCATORS = {
+    WAIT_FOR_STATE_SCRIPT: lambda args: _pair(args[1], args[2]),
+    PEEK_SCRIPT: lambda args: _pair(args[0], args[1]),
+    VALIDATE_CACHED_SCRIPT: lambda args: _pair(args[1], args[2]),
+    READ_MANY_SCRIPT: lambda args: _pair(*args[0]),
+    CLICK_ALL_SCRIPT: lambda args: _join(args[0]),
+    COUNT_MATCHES_SCRIPT: lambda args: _join(args[0]),
+    FILL_FORM_SCRIPT: lambda args: _join(args[0]),
+    FINGERPRINT_SCRIPT: lambda args: _join(args[0]['selectors']),
+}
+
+
+def command_locator(params: Optional[Dict]) -> Optional[str]:
+    """
+    Locator a command targets.
+
+    Args:
+        params: Command parameters
+
+    Returns:
+        'by=value' (comma separated for multi-locator scripts), or None
+    """
+    if not params:
+        return None
+    if 'using' in params:
+        return _pair(params['using'], params.get('value'))
+    extract = SCRIPT_LOCATORS.get(params.get('script'))
+    if extract is None:
+        return None
+    try:
+        return extract(params.get('args') or [])
+    except (IndexError, KeyError, TypeError):
+        return None
+
+
+def _payload_size(data) -> int:
+    """Approximate size of a command payload as JSON."""
+    if not data:
+        return 0
+    try:
+        return len(json.dumps(data, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class CommandProfiler:
+    """
+    Pytest plugin recording WebDriver commands per test.
+
+    Records are plain dictionaries:
+    {command, locator, seconds, request_bytes, response_bytes, method}
+    """
+
+    def __init__(self, reports_dir: str, top: int = 10):
+        """
+        Initialize CommandProfiler.
+
+        Args:
+            reports_dir: Directory for command_profile.json
+            top: Rows per ranking in the terminal summary
+        """
+        self.reports_dir = reports_dir
+        self.top = top
+        self.tests: Dict[str, List[Dict]] = {}
+        self.current_test: Optional[str] = None
+        self._main_thread = threading.main_thread()
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # RECORDING
+    # =========================================================================
+
+    def attach(self, driver):
+        """
+        Wrap the driver's command executor (once per session).
+
+        Args:
+            driver: WebDriver instance
+        """
+        executor = driver.command_executor
+        if getattr(executor, '_profiled', False):
+            return
+        execute = executor.execute
+
+        def profiled_execute(command, params):
+            start = time.perf_counter()
+            response = execute(command, params)
+            self.record(command, params, response, time.perf_counter() - start)
+            return response
+
+        executor.execute = profiled_execute
+        executor._profiled = True
+
+    def record(self, command: str, params: Optional[Dict], response, seconds: float):
+        """Record one command under the running test."""
+        entry = {
+            'command': command,
+            'locator': command_locator(params),
+            'seconds': seconds,
+            'request_bytes': _payload_size(params),
+            'response_bytes': _payload_size(response),
+            'method': page_object_method(),
+        }
+        # Pool resets run in the driver fixture teardown while the test is
+        # still current; prefetch and pool replacements run on other threads
+        if threading.current_thread() is not self._main_thread or not self.current_test:
+            test = BACKGROUND
+        elif sent_by_pool():
+            test = POOL_RESET
+        else:
+            test = self.current_test
+        with self._lock:
+            self.tests.setdefault(test, []).append(entry)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        """Attribute commands sent during setup, call and teardown to the test."""
+        self.current_test = item.nodeid
+        try:
+            yield
+        finally:
+            self.current_test = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef):
+        """Wrap drivers handed out by the driver fixtures."""
+        outcome = yield
+        if fixturedef.argname in DRIVER_FIXTURES and outcome.excinfo is None:
+            self.attach(outcome.get_result())
+
+    # =========================================================================
+    # REPORTING
+    # =========================================================================
+
+    def summary(self) -> Dict:
+        """
+        Rank the recorded commands.
+
+        Returns:
+            Dictionary with 'commands', 'tests' and 'methods' rankings,
+            each a list of {name, count, seconds, bytes} sorted by time
+            (tests by round trips)
+        """
+        with self._lock:
+            tests = {name: list(records) for name, records in self.tests.items()}
+
+        def _rank(groups: Dict[str, List[Dict]], key: str) -> List[Dict]:
+            rows = [{
+                'name': name,
+                'count': len(records),
+                'seconds': sum(record['seconds'] for record in records),
+                'bytes': sum(record['request_bytes'] + record['response_bytes']
+                             for record in records),
+            } for name, records in groups.items()]
+            return sorted(rows, key=lambda row: row[key], reverse=True)
+
+        by_command: Dict[str, List[Dict]] = {}
+        by_method: Dict[str, List[Dict]] = {}
+        for records in tests.values():
+            for record in records:
+                by_command.setdefault(record['command'], []).append(record)
+                by_method.setdefault(record['method'], []).append(record)
+        return {
+            'commands': _rank(by_command, 'seconds'),
+            'tests': _rank(tests, 'count'),
+            'methods': _rank(by_method, 'seconds'),
+        }
+
+    def format_summary(self) -> List[str]:
+        """Format the rankings for the terminal summary."""
+        summary = self.summary()
+        lines = []
+        for title, key in (('commands by total time', 'commands'),
+                           ('round trips per test', 'tests'),
+                           ('page-object methods by total time', 'methods')):
+            rows = summary[key][:self.top]
+            if not rows:
+                continue
+            lines.append(f"{title}:")
+            for row in rows:
+                lines.append(f"  {row['count']:5d} cmds {row['seconds']:8.3f}s "
+                             f"{row['bytes'] / 1024:8.1f}KB  {row['name']}")
+        return lines
+
+    def write_json(self, path: str):
+        """Write raw records and the rankings to a JSON file."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            tests = {name: list(records) for name, records in self.tests.items()}
+        with open(path, 'w') as file:
+            json.dump({'tests': tests, 'summary': self.summary()}, file, indent=2)
+
+    def merge_json(self, path: str):
+        """Add records from a file written by write_json (e.g. a worker)."""
+        with open(path, 'r') as file:
+            data = json.load(file)
+        with self._lock:
+            for name, records in data.get('tests', {}).items():
+                self.tests.setdefault(name, []).extend(records)
+
+    def pytest_sessionfinish(self, session):
+        """Write command_profile.json (merging worker files on the controller)."""
+        worker_id = get_worker_id()
+        if worker_id:
+            if self.tests:
+                self.write_json(os.path.join(self.reports_dir,
+                                             f"command_profile_{worker_id}.json"))
+            return
+        for path in glob.glob(os.path.join(self.reports_dir, "command_profile_gw*.json")):
+            self.merge_json(path)
+            os.remove(path)
+        if self.tests:
+            self.write_json(os.path.join(self.reports_dir, "command_profile.json"))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print the rankings."""
+        lines = self.format_summary()
+        if not lines:
+            return
+        terminalreporter.write_sep('-', 'webdriver command profile')
+        for line in lines:
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(
+            f"details: {os.path.join(self.reports_dir, 'command_profile.json')}")
@@ -109,23 +109,18 @@ class TestCart:
             "Cart should be empty after removal"
     
     @pytest.mark.cart
-    def test_remove_product_from_cart_page(self, logged_in_user):
+    def test_remove_product_from_cart_page(self, cart_state):
         """
         TC-015: Verify removing product from cart page.
         
         Steps:
-        1. Add product to cart
-        2. Go to cart
-        3. Remove product
+        1. Seed cart with a product and open the cart
+        2. Remove product
         
         Expected Result:
         - Product is removed from cart
         """
-        inventory_page = logged_in_user
-        
-        # Add and go to cart
-        inventory_page.add_backpack_to_cart()
-        cart_page = inventory_page.go_to_cart()
+        cart_page = cart_state.open_cart(["sauce-labs-backpack"])
         
         assert cart_page.get_cart_item_count() == 1
         
@@ -141,23 +136,19 @@ class TestCart:
     
     @pytest.mark.smoke
     @pytest.mark.cart
-    def test_view_cart_items(self, logged_in_user):
+    def test_view_cart_items(self, cart_state):
         """
         TC-016: Verify viewing items in cart.
         
         Steps:
-        1. Add products to cart
+        1. Seed cart with products
         2. Navigate to cart page
         
         Expected Result:
         - Cart page displays correct items
         - Item details are shown
         """
-        inventory_page = logged_in_user
-        
-        # Add products
-        inventory_page.add_backpack_to_cart()
-        inventory_page.add_bike_light_to_cart()
+        inventory_page = cart_state.seed(["sauce-labs-backpack", "sauce-labs-bike-light"])
         
         # Go to cart
         cart_page = inventory_page.go_to_cart()
@@ -168,21 +159,18 @@ class TestCart:
             "Cart should have 2 items"
     
     @pytest.mark.cart
-    def test_continue_shopping_from_cart(self, logged_in_user):
+    def test_continue_shopping_from_cart(self, cart_state):
         """
         TC-017: Verify continue shopping button.
         
         Steps:
-        1. Add product and go to cart
+        1. Seed cart with a product and open the cart
         2. Click Continue Shopping
         
         Expected Result:
         - Returns to inventory page
         """
-        inventory_page = logged_in_user
-        
-        inventory_page.add_backpack_to_cart()
-        cart_page = inventory_page.go_to_cart()
+        cart_page = cart_state.open_cart(["sauce-labs-backpack"])
         
         # Continue shopping
         inventory_page = cart_page.continue_shopping()
@@ -223,7 +211,7 @@ class TestCart:
     # =========================================================================
     
     @pytest.mark.cart
-    def test_cart_displays_correct_item_info(self, logged_in_user):
+    def test_cart_displays_correct_item_info(self, cart_state):
         """
         TC-019: Verify cart displays correct item information.
         
@@ -232,10 +220,7 @@ class TestCart:
         - Price is correct
         - Quantity is correct
         """
-        inventory_page = logged_in_user
-        
-        inventory_page.add_backpack_to_cart()
-        cart_page = inventory_page.go_to_cart()
+        cart_page = cart_state.open_cart(["sauce-labs-backpack"])
         
         items = cart_page.get_all_cart_items()
         
@@ -245,24 +230,19 @@ class TestCart:
         assert items[0]['quantity'] == "1"
     
     @pytest.mark.cart
-    def test_cart_calculates_total_correctly(self, logged_in_user):
+    def test_cart_calculates_total_correctly(self, cart_state):
         """
         TC-020: Verify cart total calculation.
         
         Steps:
-        1. Add known-price items
+        1. Seed cart with known-price items
         2. Check total
         
         Expected Result:
         - Total matches sum of prices
         """
-        inventory_page = logged_in_user
-        
-        # Add Backpack ($29.99) and Bike Light ($9.99)
-        inventory_page.add_backpack_to_cart()
-        inventory_page.add_bike_light_to_cart()
-        
-        cart_page = inventory_page.go_to_cart()
+        # Backpack ($29.99) and Bike Light ($9.99)
+        cart_page = cart_state.open_cart(["sauce-labs-backpack", "sauce-labs-bike-light"])
         total = cart_page.get_cart_total_price()
         
         expected_total = 29.99 + 9.99
@@ -61,29 +61,21 @@ class TestCheckout:
             "Should show thank you message"
     
     @pytest.mark.checkout
-    def test_checkout_with_multiple_items(self, logged_in_user):
+    def test_checkout_with_multiple_items(self, checkout_overview):
         """
         TC-022: Verify checkout with multiple items.
         
         Steps:
-        1. Add multiple products
+        1. Open the overview with multiple products in the cart
         2. Complete checkout
         
         Expected Result:
         - All items shown in overview
         - Order completes successfully
         """
-        inventory_page = logged_in_user
-        
-        # Add multiple products
-        inventory_page.add_backpack_to_cart()
-        inventory_page.add_bike_light_to_cart()
-        inventory_page.add_bolt_tshirt_to_cart()
-        
-        # Checkout
-        cart_page = inventory_page.go_to_cart()
-        checkout_page = cart_page.proceed_to_checkout()
-        overview_page = checkout_page.complete_checkout_info("Jane", "Smith", "67890")
+        overview_page = checkout_overview(
+            ["sauce-labs-backpack", "sauce-labs-bike-light", "sauce-labs-bolt-t-shirt"],
+            first_name="Jane", last_name="Smith", postal_code="67890")
         
         # Verify items in overview
         assert overview_page.get_item_count() == 3, \
@@ -188,7 +180,7 @@ class TestCheckout:
     # =========================================================================
     
     @pytest.mark.checkout
-    def test_checkout_overview_shows_totals(self, logged_in_user):
+    def test_checkout_overview_shows_totals(self, checkout_overview):
         """
         TC-027: Verify checkout overview displays totals.
         
@@ -198,12 +190,7 @@ class TestCheckout:
         - Total is displayed
         - Total = Subtotal + Tax
         """
-        inventory_page = logged_in_user
-        
-        inventory_page.add_backpack_to_cart()
-        cart_page = inventory_page.go_to_cart()
-        checkout_page = cart_page.proceed_to_checkout()
-        overview_page = checkout_page.complete_checkout_info("John", "Doe", "12345")
+        overview_page = checkout_overview(["sauce-labs-backpack"])
         
         # Verify totals
         subtotal = overview_page.get_subtotal()
@@ -239,19 +226,14 @@ class TestCheckout:
             "Item should still be in cart"
     
     @pytest.mark.checkout
-    def test_cancel_from_checkout_overview(self, logged_in_user):
+    def test_cancel_from_checkout_overview(self, checkout_overview):
         """
         TC-029: Verify cancel from checkout overview.
         
         Expected Result:
         - Returns to inventory page
         """
-        inventory_page = logged_in_user
-        
-        inventory_page.add_backpack_to_cart()
-        cart_page = inventory_page.go_to_cart()
-        checkout_page = cart_page.proceed_to_checkout()
-        overview_page = checkout_page.complete_checkout_info("John", "Doe", "12345")
+        overview_page = checkout_overview(["sauce-labs-backpack"])
         
         # Cancel
         inventory_page = overview_page.click_cancel()
@@ -264,7 +246,7 @@ class TestCheckout:
     # =========================================================================
     
     @pytest.mark.checkout
-    def test_back_home_after_checkout(self, logged_in_user):
+    def test_back_home_after_checkout(self, checkout_overview):
         """
         TC-030: Verify Back Home button after checkout.
         
@@ -272,13 +254,8 @@ class TestCheckout:
         - Returns to inventory page
         - Cart is empty
         """
-        inventory_page = logged_in_user
-        
         # Complete checkout
-        inventory_page.add_backpack_to_cart()
-        cart_page = inventory_page.go_to_cart()
-        checkout_page = cart_page.proceed_to_checkout()
-        overview_page = checkout_page.complete_checkout_info("John", "Doe", "12345")
+        overview_page = checkout_overview(["sauce-labs-backpack"])
         complete_page = overview_page.click_finish()
         
         # Go back home
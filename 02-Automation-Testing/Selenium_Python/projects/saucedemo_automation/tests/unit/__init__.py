@@ -0,0 +1,8 @@
+"""
+Unit Tests Package
+==================
+Browser-free tests for the framework's pure-logic modules.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
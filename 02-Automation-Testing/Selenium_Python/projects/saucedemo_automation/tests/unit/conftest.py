@@ -0,0 +1,43 @@
+"""
+Unit Test Fixtures
+==================
+Browser-free stand-ins used by the unit tests.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import pytest
+from pages import BasePage, WaitPolicy
+
+
+class ScriptDriver:
+    """
+    WebDriver stand-in answering execute_script from a list of results.
+    
+    The last result is repeated once the list is used up; every call is
+    recorded as (script, args).
+    """
+    
+    def __init__(self, *results):
+        """
+        Initialize ScriptDriver.
+        
+        Args:
+            *results: Values returned by successive execute_script calls
+        """
+        self.results = list(results)
+        self.calls = []
+    
+    def execute_script(self, script: str, *args):
+        """Record the call and return the next result."""
+        self.calls.append((script, args))
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+@pytest.fixture
+def fast_waits(monkeypatch):
+    """Page objects wait at most 0.3s, polling every 10ms."""
+    monkeypatch.setattr(BasePage, "wait_policy",
+                        WaitPolicy(short=0.3, medium=0.3, long=0.3, poll_frequency=0.01,
+                                   backend="polling"))
@@ -0,0 +1,79 @@
+"""
+Failure Artifact Unit Tests
+===========================
+Lossless PNG recompression used by the background artifact writer
+(plugins/artifacts.py).
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import struct
+import zlib
+import pytest
+from plugins.artifacts import PNG_SIGNATURE, recompress_png
+
+
+def chunk(kind: bytes, body: bytes) -> bytes:
+    """Encode one PNG chunk."""
+    return (struct.pack('>I', len(body)) + kind + body
+            + struct.pack('>I', zlib.crc32(kind + body) & 0xffffffff))
+
+
+def make_png(level: int, idat_parts: int = 1) -> bytes:
+    """A 64x64 grayscale PNG whose image data is deflated at a zlib level."""
+    header = struct.pack('>IIBBBBB', 64, 64, 8, 0, 0, 0, 0)
+    raw = b''.join(b'\x00' + bytes((x * y) % 7 for x in range(64)) for y in range(64))
+    data = zlib.compress(raw, level)
+    size = -(-len(data) // idat_parts)
+    parts = [data[index:index + size] for index in range(0, len(data), size)]
+    return (PNG_SIGNATURE + chunk(b'IHDR', header)
+            + b''.join(chunk(b'IDAT', part) for part in parts) + chunk(b'IEND', b''))
+
+
+def read_chunks(data: bytes):
+    """Decode (kind, body) chunks, checking every CRC."""
+    chunks, position = [], len(PNG_SIGNATURE)
+    while position < len(data):
+        length, kind = struct.unpack('>I4s', data[position:position + 8])
+        body = data[position + 8:position + 8 + length]
+        crc, = struct.unpack('>I', data[position + 8 + length:position + 12 + length])
+        assert crc == zlib.crc32(kind + body) & 0xffffffff
+        chunks.append((kind, body))
+        position += 12 + length
+    return chunks
+
+
+def pixels(data: bytes) -> bytes:
+    """Inflated image data of a PNG."""
+    return zlib.decompress(b''.join(body for kind, body in read_chunks(data) if kind == b'IDAT'))
+
+
+@pytest.mark.unit
+class TestRecompressPng:
+    """Test suite for recompress_png."""
+    
+    def test_recompression_is_lossless_and_smaller(self):
+        """Split, uncompressed IDAT data becomes one smaller IDAT with the same pixels."""
+        original = make_png(level=0, idat_parts=3)
+        
+        result = recompress_png(original)
+        
+        assert len(result) < len(original)
+        assert pixels(result) == pixels(original)
+        assert [kind for kind, body in read_chunks(result)] == [b'IHDR', b'IDAT', b'IEND']
+    
+    def test_never_larger_than_input(self):
+        """An already well compressed PNG is returned unchanged."""
+        original = make_png(level=9)
+        
+        assert recompress_png(original, level=1) == original
+    
+    @pytest.mark.parametrize("data", [
+        b"not a png",
+        PNG_SIGNATURE + chunk(b'IDAT', b'not deflate data') + chunk(b'IEND', b''),
+        PNG_SIGNATURE + b'\x00\x00',
+    ])
+    def test_unparseable_data_is_returned_unchanged(self, data):
+        """Data that does not parse as PNG passes through."""
+        assert recompress_png(data) == data
@@ -0,0 +1,94 @@
+"""
+Inventory Catalog Unit Tests
+============================
+Price parsing, product records, catalog indexes and the cached
+InventoryPage.catalog() (pages/catalog.py, pages/inventory_page.py).
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import pytest
+from pages import InventoryPage
+from pages.catalog import Catalog, Product, parse_price_cents
+from tests.unit.conftest import ScriptDriver
+
+
+ROWS = [
+    {'name': "Sauce Labs Backpack", 'description': "Carry all the things",
+     'price': "$29.99", 'button': "remove-sauce-labs-backpack"},
+    {'name': "Sauce Labs Onesie", 'description': "Rib snap infant onesie",
+     'price': "$7.99", 'button': "add-to-cart-sauce-labs-onesie"},
+]
+
+
+@pytest.mark.unit
+class TestCatalog:
+    """Test suite for the inventory catalog model."""
+    
+    # =========================================================================
+    # PARSING
+    # =========================================================================
+    
+    @pytest.mark.parametrize("text, cents", [
+        ("$29.99", 2999),
+        (" $7.99 ", 799),
+        ("$15", 1500),
+        ("", 0),
+        (None, 0),
+        ("free", 0),
+    ])
+    def test_parse_price_cents(self, text, cents):
+        """Price labels become exact integer cents; non-prices become 0."""
+        assert parse_price_cents(text) == cents
+    
+    def test_product_from_row(self):
+        """Slug and cart state come from the add/remove button id."""
+        in_cart = Product.from_row(ROWS[0])
+        not_in_cart = Product.from_row(ROWS[1])
+        
+        assert (in_cart.slug, in_cart.in_cart, in_cart.price) == \
+            ("sauce-labs-backpack", True, 29.99)
+        assert (not_in_cart.slug, not_in_cart.in_cart) == ("sauce-labs-onesie", False)
+        assert not_in_cart.to_dict() == {'name': "Sauce Labs Onesie",
+                                         'description': "Rib snap infant onesie",
+                                         'price': "$7.99"}
+    
+    # =========================================================================
+    # INDEXES
+    # =========================================================================
+    
+    def test_catalog_lookups(self):
+        """Products are found by name and slug, in page order."""
+        catalog = Catalog([Product.from_row(row) for row in ROWS])
+        
+        assert catalog.by_slug("sauce-labs-onesie").name == "Sauce Labs Onesie"
+        assert catalog.by_name("Sauce Labs Backpack").slug == "sauce-labs-backpack"
+        assert catalog.by_slug("sauce-labs-fleece-jacket") is None
+        assert catalog.names() == ["Sauce Labs Backpack", "Sauce Labs Onesie"]
+        assert catalog.prices() == [29.99, 7.99]
+        assert [product.slug for product in catalog.in_cart()] == ["sauce-labs-backpack"]
+    
+    # =========================================================================
+    # INVENTORY PAGE
+    # =========================================================================
+    
+    def test_catalog_is_read_once(self, fast_waits):
+        """Getters share one batched read until the catalog is invalidated."""
+        driver = ScriptDriver(ROWS)
+        page = InventoryPage(driver)
+        
+        assert page.get_all_product_names() == ["Sauce Labs Backpack", "Sauce Labs Onesie"]
+        assert page.get_all_product_prices() == [29.99, 7.99]
+        assert len(driver.calls) == 1
+        
+        page.invalidate_catalog()
+        page.catalog()
+        assert len(driver.calls) == 2
+    
+    def test_is_product_in_cart_without_grid_returns_at_once(self, fast_waits):
+        """Off the inventory page the check reads once instead of waiting."""
+        driver = ScriptDriver([])
+        
+        assert InventoryPage(driver).is_product_in_cart("sauce-labs-backpack") is False
+        assert len(driver.calls) == 1
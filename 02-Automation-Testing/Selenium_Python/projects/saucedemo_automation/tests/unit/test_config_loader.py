@@ -0,0 +1,109 @@
+"""
+Config Loader Unit Tests
+========================
+Typed parsing, QA_ environment overrides and mtime-based caching of
+config.yaml (config_loader.py).
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import os
+import pytest
+from config_loader import ExecutionConfig, _apply_env_overrides, get_config, load_config
+
+
+CONFIG_YAML = """
+browser:
+  name: firefox
+  headless: false
+execution:
+  max_workers: 2
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """config.yaml in a temporary directory, with no QA_ overrides set."""
+    for name in list(os.environ):
+        if name.startswith("QA_"):
+            monkeypatch.delenv(name)
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML)
+    return path
+
+
+@pytest.mark.unit
+class TestConfigLoader:
+    """Test suite for the shared typed config loader."""
+    
+    # =========================================================================
+    # PARSING
+    # =========================================================================
+    
+    def test_sections_are_typed(self, config_file):
+        """YAML sections become dataclasses; missing keys keep their defaults."""
+        config = load_config(str(config_file), environ={})
+        
+        assert config.browser.name == "firefox"
+        assert config.browser.headless is False
+        assert isinstance(config.execution, ExecutionConfig)
+        assert config.execution.max_workers == 2
+        assert config.execution.fail_fast is False
+    
+    def test_missing_file_uses_defaults(self, tmp_path):
+        """A missing config file yields the default configuration."""
+        config = load_config(str(tmp_path / "missing.yaml"), environ={})
+        
+        assert config.execution == ExecutionConfig()
+    
+    # =========================================================================
+    # ENVIRONMENT OVERRIDES
+    # =========================================================================
+    
+    def test_env_override_keeps_yaml_types(self):
+        """QA_<SECTION>__<KEY> values are parsed as YAML."""
+        raw = _apply_env_overrides({'execution': {'max_workers': 4}}, {
+            'QA_EXECUTION__MAX_WORKERS': "8",
+            'QA_EXECUTION__PARALLEL_MODE': "true",
+            'QA_BROWSER__BLOCK_RESOURCES__PATTERNS': "[a, b]",
+        })
+        
+        assert raw['execution'] == {'max_workers': 8, 'parallel_mode': True}
+        assert raw['browser']['block_resources']['patterns'] == ["a", "b"]
+    
+    def test_env_override_ignores_unknown_sections(self):
+        """Variables that do not name a config section are left alone."""
+        raw = _apply_env_overrides({}, {'QA_NOT_A_SECTION__KEY': "1", 'HOME': "/root"})
+        
+        assert raw == {}
+    
+    # =========================================================================
+    # CACHING
+    # =========================================================================
+    
+    def test_get_config_is_parsed_once(self, config_file):
+        """Repeated calls share one parsed instance."""
+        assert get_config(str(config_file)) is get_config(str(config_file))
+    
+    def test_get_config_reparses_on_mtime_change(self, config_file):
+        """Editing the file invalidates the cached instance."""
+        first = get_config(str(config_file))
+        config_file.write_text(CONFIG_YAML.replace("max_workers: 2", "max_workers: 6"))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        second = get_config(str(config_file))
+        
+        assert second is not first
+        assert second.execution.max_workers == 6
+    
+    def test_get_config_reparses_on_env_override_change(self, config_file, monkeypatch):
+        """Setting a QA_ variable invalidates the cached instance."""
+        first = get_config(str(config_file))
+        monkeypatch.setenv("QA_EXECUTION__MAX_WORKERS", "3")
+        
+        second = get_config(str(config_file))
+        
+        assert second is not first
+        assert second.execution.max_workers == 3
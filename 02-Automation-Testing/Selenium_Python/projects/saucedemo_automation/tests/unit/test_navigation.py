@@ -0,0 +1,177 @@
+"""
+Navigation Planner Unit Tests
+=============================
+Route planning over (page, cart seeded) states, measured edge costs and
+replanning after a rejected edge (utils/navigation.py).
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import pytest
+from pages import CartPage, CheckoutCompletePage, CheckoutOverviewPage, InventoryPage
+from utils.navigation import ANY, Edge, NavigationPlanner
+
+
+BACKPACK = ["sauce-labs-backpack"]
+
+
+def names(route):
+    """Edge names of a planned route."""
+    return [edge.name for edge in route]
+
+
+@pytest.fixture
+def ui_planner():
+    """Planner on the Sauce Demo graph where url/seeded shortcuts are too expensive."""
+    planner = NavigationPlanner()
+    for edge in planner.edges:
+        if edge.kind != 'ui':
+            planner.measured[edge.name] = (1, 100.0)
+    return planner
+
+
+class FakePage:
+    """Page stand-in whose fingerprint check can be made to fail."""
+    
+    valid = True
+    
+    def __init__(self, driver=None):
+        """Initialize FakePage."""
+        self.driver = driver
+    
+    def verify_page(self) -> bool:
+        """Fingerprint check result."""
+        return self.valid
+
+
+class Start(FakePage):
+    """Page the session starts on."""
+
+
+class Middle(FakePage):
+    """Page on the slower route."""
+
+
+class Target(FakePage):
+    """Page to reach."""
+
+
+class RejectedTarget(Target):
+    """Target page whose fingerprint does not match."""
+    
+    valid = False
+
+
+@pytest.mark.unit
+class TestNavigationPlanner:
+    """Test suite for the cheapest-route page planner."""
+    
+    # =========================================================================
+    # PLANNING
+    # =========================================================================
+    
+    def test_seeded_deep_link_from_unknown_page(self):
+        """With default costs the overview is one seeded deep link away."""
+        route = NavigationPlanner().plan(CheckoutOverviewPage, ANY, BACKPACK)
+        
+        assert names(route) == ["seeded:CheckoutOverviewPage"]
+    
+    def test_already_there(self):
+        """No edges are needed when the session is on the target with its cart."""
+        route = NavigationPlanner().plan(CartPage, CartPage, BACKPACK, cart_seeded=True)
+        
+        assert route == []
+    
+    def test_products_are_added_when_needed(self, ui_planner):
+        """A cart target reached through the UI adds the products on the way."""
+        route = ui_planner.plan(CartPage, InventoryPage, BACKPACK)
+        
+        assert names(route) == ["InventoryPage.add_products_to_cart", "InventoryPage.go_to_cart"]
+    
+    def test_finish_empties_the_cart(self, ui_planner):
+        """A route through click_finish must add the products again (clears_cart)."""
+        ui_planner.measured["CheckoutOverviewPage.click_cancel"] = (1, 100.0)
+        
+        route = ui_planner.plan(InventoryPage, CheckoutOverviewPage, BACKPACK, cart_seeded=True)
+        
+        assert names(route) == ["CheckoutOverviewPage.click_finish",
+                                "CheckoutCompletePage.click_back_home",
+                                "InventoryPage.add_products_to_cart"]
+    
+    def test_logout_empties_the_cart(self):
+        """Only click_finish and logout are marked as emptying the cart."""
+        planner = NavigationPlanner()
+        
+        clearing = sorted(edge.name for edge in planner.edges if edge.clears_cart)
+        
+        assert clearing == ["CheckoutOverviewPage.click_finish", "InventoryPage.logout"]
+    
+    def test_finish_reaches_complete_page_for_an_order(self, ui_planner):
+        """click_finish is a valid last edge although it empties the cart."""
+        route = ui_planner.plan(CheckoutCompletePage, CheckoutOverviewPage, BACKPACK,
+                                cart_seeded=True)
+        
+        assert names(route) == ["CheckoutOverviewPage.click_finish"]
+    
+    def test_excluded_edges_are_avoided(self):
+        """Rejected edges are planned around."""
+        route = NavigationPlanner().plan(CartPage, ANY, BACKPACK, exclude={"seeded:CartPage"})
+        
+        assert "seeded:CartPage" not in names(route)
+        assert route[-1].target is CartPage
+    
+    def test_unreachable_returns_none(self):
+        """No route when every edge into the target is excluded."""
+        planner = NavigationPlanner()
+        exclude = {edge.name for edge in planner.edges if edge.target is CartPage}
+        
+        assert planner.plan(CartPage, ANY, BACKPACK, exclude=exclude) is None
+    
+    # =========================================================================
+    # COSTS
+    # =========================================================================
+    
+    def test_measured_cost_is_a_running_mean(self):
+        """Traversal times replace the default cost with their mean."""
+        planner = NavigationPlanner()
+        edge = planner.edges[0]
+        
+        planner.record(edge, 1.0)
+        planner.record(edge, 3.0)
+        
+        assert planner.cost(edge) == pytest.approx(2.0)
+    
+    def test_costs_round_trip_through_json(self, tmp_path):
+        """Measured costs saved by one run are loaded by the next."""
+        path = str(tmp_path / "costs.json")
+        planner = NavigationPlanner()
+        planner.record(planner.edges[0], 0.25)
+        planner.write_json(path)
+        
+        loaded = NavigationPlanner()
+        loaded.load_json(path)
+        loaded.load_json(str(tmp_path / "missing.json"))
+        
+        assert loaded.measured == {planner.edges[0].name: (1, 0.25)}
+    
+    # =========================================================================
+    # NAVIGATION
+    # =========================================================================
+    
+    def test_rejected_edge_triggers_replan(self, capsys):
+        """An edge whose arrival fails verification is excluded and a new route taken."""
+        edges = [
+            Edge("shortcut", Start, Target, 'url', lambda page, context: RejectedTarget()),
+            Edge("step", Start, Middle, 'ui', lambda page, context: Middle()),
+            Edge("finish", Middle, Target, 'ui', lambda page, context: Target()),
+            Edge("url:Start", ANY, Start, 'url', lambda driver, context: Start()),
+        ]
+        planner = NavigationPlanner(edges)
+        planner.measured["shortcut"] = (1, 0.1)
+        
+        page = planner.navigate(driver=None, to=Target, current=Start)
+        
+        assert type(page) is Target
+        assert planner.stats == {'routes': 1, 'edges': 3, 'rejected': 1}
+        assert "shortcut rejected" in capsys.readouterr().out
@@ -0,0 +1,103 @@
+"""
+Parallel Scheduler Unit Tests
+=============================
+Worker count resolution and duration-balanced partitioning
+(plugins/parallel.py).
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+from types import SimpleNamespace
+import pytest
+from plugins.parallel import DURATIONS_CACHE_KEY, ParallelScheduler, resolve_worker_count
+
+
+class FakeCache:
+    """pytest cache stand-in holding recorded durations."""
+    
+    def __init__(self, durations):
+        """Initialize FakeCache."""
+        self.values = {DURATIONS_CACHE_KEY: durations}
+    
+    def get(self, key, default):
+        """Get a cached value."""
+        return self.values.get(key, default)
+
+
+class FakeConfig:
+    """pytest config stand-in with command line options and a cache."""
+    
+    def __init__(self, durations=None, **options):
+        """Initialize FakeConfig."""
+        self.cache = FakeCache(durations or {})
+        self.options = {'maxfail': 0, 'workers': None, 'no_parallel': False, **options}
+    
+    def getoption(self, name):
+        """Get a command line option."""
+        return self.options[name]
+
+
+def items(*nodeids):
+    """Collected item stand-ins."""
+    return [SimpleNamespace(nodeid=nodeid) for nodeid in nodeids]
+
+
+def nodeids(groups):
+    """Node ids per worker group."""
+    return [[item.nodeid for item in group] for group in groups]
+
+
+@pytest.mark.unit
+class TestParallelScheduler:
+    """Test suite for the parallel worker scheduler."""
+    
+    # =========================================================================
+    # WORKER COUNT
+    # =========================================================================
+    
+    def test_parallel_mode_uses_max_workers(self, monkeypatch):
+        """execution.parallel_mode splits across execution.max_workers."""
+        monkeypatch.delenv("SAUCEDEMO_WORKER_ID", raising=False)
+        execution = SimpleNamespace(parallel_mode=True, max_workers=4)
+        
+        assert resolve_worker_count(FakeConfig(), execution) == 4
+        assert resolve_worker_count(FakeConfig(workers=2), execution) == 2
+        assert resolve_worker_count(FakeConfig(no_parallel=True), execution) == 1
+    
+    def test_serial_by_default(self, monkeypatch):
+        """Without parallel_mode or --workers the run is serial."""
+        monkeypatch.delenv("SAUCEDEMO_WORKER_ID", raising=False)
+        execution = SimpleNamespace(parallel_mode=False, max_workers=4)
+        
+        assert resolve_worker_count(FakeConfig(), execution) == 1
+    
+    # =========================================================================
+    # PARTITIONING
+    # =========================================================================
+    
+    def test_partition_balances_recorded_durations(self):
+        """Longest tests are spread first, so group loads stay even."""
+        durations = {'t::a': 8.0, 't::b': 5.0, 't::c': 4.0, 't::d': 3.0}
+        scheduler = ParallelScheduler(FakeConfig(durations), workers=2)
+        
+        groups = scheduler.partition(items('t::a', 't::b', 't::c', 't::d'))
+        
+        assert nodeids(groups) == [['t::a', 't::d'], ['t::b', 't::c']]
+    
+    def test_partition_keeps_collection_order_in_groups(self):
+        """Inside a group tests run in collection order."""
+        durations = {'t::a': 1.0, 't::b': 1.0, 't::c': 9.0}
+        scheduler = ParallelScheduler(FakeConfig(durations), workers=2)
+        
+        groups = scheduler.partition(items('t::a', 't::b', 't::c'))
+        
+        assert nodeids(groups) == [['t::c'], ['t::a', 't::b']]
+    
+    def test_partition_never_exceeds_test_count(self):
+        """Fewer tests than workers give one group per test; unknown tests still get placed."""
+        scheduler = ParallelScheduler(FakeConfig(), workers=4)
+        
+        groups = scheduler.partition(items('t::new', 't::other'))
+        
+        assert sorted(nodeids(groups)) == [['t::new'], ['t::other']]
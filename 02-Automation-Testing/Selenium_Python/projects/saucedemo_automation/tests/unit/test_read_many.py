@@ -0,0 +1,66 @@
+"""
+Batched Read Unit Tests
+=======================
+BasePage.read_many: one script call per read, field specs, and waiting
+behaviour (pages/base_page.py).
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+from pages import BasePage, Expect
+from pages.scripts import READ_MANY_SCRIPT
+from tests.unit.conftest import ScriptDriver
+
+
+ITEM = (By.CLASS_NAME, "cart_item")
+NAME = (By.CLASS_NAME, "inventory_item_name")
+BUTTON = (By.TAG_NAME, "button")
+ROWS = [{'name': "Sauce Labs Backpack", 'button': "remove-sauce-labs-backpack", 'id': "4"}]
+
+
+@pytest.mark.unit
+class TestReadMany:
+    """Test suite for BasePage.read_many."""
+    
+    def test_reads_all_fields_in_one_call(self, fast_waits):
+        """Text, child attribute and container attribute fields share one script call."""
+        driver = ScriptDriver(ROWS)
+        
+        rows = BasePage(driver).read_many(ITEM, {
+            'name': NAME,
+            'button': (BUTTON, 'id'),
+            'id': (None, 'data-id'),
+        })
+        
+        assert rows == ROWS
+        assert len(driver.calls) == 1
+        script, (container, fields) = driver.calls[0]
+        assert script == READ_MANY_SCRIPT
+        assert container == list(ITEM)
+        assert fields == [
+            {'name': 'name', 'by': By.CLASS_NAME, 'value': "inventory_item_name",
+             'attribute': None},
+            {'name': 'button', 'by': By.TAG_NAME, 'value': "button", 'attribute': 'id'},
+            {'name': 'id', 'by': None, 'value': None, 'attribute': 'data-id'},
+        ]
+    
+    def test_present_waits_for_rows(self, fast_waits):
+        """Expect.PRESENT reads again until rows appear."""
+        driver = ScriptDriver([], [], ROWS)
+        
+        rows = BasePage(driver).read_many(ITEM, {'name': NAME})
+        
+        assert rows == ROWS
+        assert len(driver.calls) == 3
+    
+    def test_absent_reads_once(self, fast_waits):
+        """Expect.ABSENT returns the first read, even when empty."""
+        driver = ScriptDriver([], ROWS)
+        
+        rows = BasePage(driver).read_many(ITEM, {'name': NAME}, Expect.ABSENT)
+        
+        assert rows == []
+        assert len(driver.calls) == 1
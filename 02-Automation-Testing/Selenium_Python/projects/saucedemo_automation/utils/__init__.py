@@ -0,0 +1,21 @@
+"""
+Utilities Package
+=================
+Test support helpers for Sauce Demo automation.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+from .auth_state import AuthSnapshot, AuthStateCache
+from .cart_state import CartState, PRODUCT_IDS
+from .navigation import Edge, NavigationPlanner
+
+__all__ = [
+    'AuthSnapshot',
+    'AuthStateCache',
+    'CartState',
+    'PRODUCT_IDS',
+    'Edge',
+    'NavigationPlanner'
+]
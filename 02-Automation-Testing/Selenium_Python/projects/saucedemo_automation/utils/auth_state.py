@@ -0,0 +1,170 @@
+"""
+Authenticated State Snapshots
+=============================
+Log in through the UI once per user type, capture the resulting cookies
+and localStorage, and inject that snapshot into later sessions so tests
+start on the inventory page without typing credentials.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import time
+from typing import Dict, List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config_loader import UserCredentials
+from pages import LoginPage, InventoryPage
+
+
+class AuthSnapshot:
+    """Cookies and localStorage captured right after a successful login."""
+
+    __slots__ = ('user_type', 'cookies', 'local_storage', 'captured_at')
+
+    def __init__(self, user_type: str, cookies: List[Dict], local_storage: Dict[str, str]):
+        """
+        Initialize AuthSnapshot.
+
+        Args:
+            user_type: Key from config.yaml test_users
+            cookies: Cookies as returned by driver.get_cookies()
+            local_storage: localStorage key/value pairs
+        """
+        self.user_type = user_type
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.captured_at = time.time()
+
+
+class AuthStateCache:
+    """
+    Session-wide cache of authenticated state per user type.
+
+    Features:
+    - One real UI login per user type
+    - Snapshot injection into fresh or pooled sessions
+    - Direct navigation to InventoryPage.URL
+    - Falls back to UI login (and re-captures) when a snapshot is rejected
+    """
+
+    GET_LOCAL_STORAGE = "return Object.assign({}, window.localStorage);"
+    SET_LOCAL_STORAGE = (
+        "var items = arguments[0];"
+        "Object.keys(items).forEach(function (key) {"
+        "  window.localStorage.setItem(key, items[key]);"
+        "});"
+    )
+
+    def __init__(self, users: Dict[str, UserCredentials], base_url: str = LoginPage.URL):
+        """
+        Initialize AuthStateCache.
+
+        Args:
+            users: test_users section of config.yaml
+            base_url: Application origin the snapshot belongs to
+        """
+        self.users = users
+        self.base_url = base_url
+        self.stats = {'captured': 0, 'injected': 0, 'rejected': 0}
+        self._snapshots: Dict[str, AuthSnapshot] = {}
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def login(self, driver: WebDriver, user_type: str = 'standard_user'):
+        """
+        Bring a session to the logged-in inventory page.
+
+        Args:
+            driver: WebDriver instance (fresh or pooled)
+            user_type: Key from config.yaml test_users
+
+        Returns:
+            InventoryPage when logged in, LoginPage if the UI login failed
+        """
+        snapshot = self._snapshots.get(user_type)
+        if snapshot is not None:
+            if self._inject(driver, snapshot):
+                self.stats['injected'] += 1
+                return InventoryPage(driver)
+            self.stats['rejected'] += 1
+            self._snapshots.pop(user_type, None)
+        return self._ui_login(driver, user_type)
+
+    def invalidate(self, user_type: Optional[str] = None):
+        """Drop one snapshot, or all of them."""
+        if user_type is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(user_type, None)
+
+    # =========================================================================
+    # CAPTURE / INJECT
+    # =========================================================================
+
+    def _ui_login(self, driver: WebDriver, user_type: str):
+        """Log in through the login form and capture a snapshot on success."""
+        if user_type not in self.users:
+            raise KeyError(f"Unknown user type '{user_type}'. "
+                           f"Use one of: {list(self.users)}")
+        credentials = self.users[user_type]
+
+        login_page = LoginPage(driver)
+        login_page.open()
+        page = login_page.login(credentials.username, credentials.password)
+
+        if isinstance(page, InventoryPage):
+            self._snapshots[user_type] = AuthSnapshot(
+                user_type,
+                driver.get_cookies(),
+                driver.execute_script(self.GET_LOCAL_STORAGE) or {},
+            )
+            self.stats['captured'] += 1
+        return page
+
+    def _inject(self, driver: WebDriver, snapshot: AuthSnapshot) -> bool:
+        """
+        Load a snapshot into the session and open the inventory page.
+
+        Chrome sessions with no localStorage to restore get their cookies
+        through CDP, which avoids loading the login page first.
+
+        Returns:
+            True if the application accepted the snapshot
+        """
+        if not snapshot.local_storage and hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Network.setCookies', {
+                'cookies': [self._to_cdp_cookie(cookie) for cookie in snapshot.cookies]
+            })
+        else:
+            # Cookies and storage can only be written on the target origin
+            driver.get(self.base_url)
+            for cookie in snapshot.cookies:
+                driver.add_cookie(cookie)
+            if snapshot.local_storage:
+                driver.execute_script(self.SET_LOCAL_STORAGE, snapshot.local_storage)
+
+        inventory_page = InventoryPage(driver)
+        inventory_page.open()
+        return inventory_page.is_inventory_page_displayed()
+
+    def _to_cdp_cookie(self, cookie: Dict) -> Dict:
+        """Convert a WebDriver cookie into a CDP Network.CookieParam."""
+        param = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False),
+        }
+        if cookie.get('domain'):
+            param['domain'] = cookie['domain']
+        else:
+            param['url'] = self.base_url
+        if 'expiry' in cookie:
+            param['expires'] = cookie['expiry']
+        if cookie.get('sameSite'):
+            param['sameSite'] = cookie['sameSite']
+        return param
@@ -0,0 +1,185 @@
+"""
+Cart State Seeding
+==================
+Put products in the cart without clicking through the inventory page.
+
+Sauce Demo keeps the cart in localStorage ('cart-contents', a JSON list of
+numeric product ids) and reads it when a page loads. CartState writes that
+list for a set of product slugs, reloads the inventory page once and checks
+the cart badge, so cart and checkout tests start from their precondition
+instead of paying for one add-to-cart click per product.
+
+The checkout overview can be deep-linked the same way: with the cart
+seeded, CheckoutOverviewPage.URL renders the order directly. Sauce Demo
+keeps the customer information in component state only and does not
+require it on the overview page, so it is only typed when the shortcut is
+rejected and the UI path is taken instead.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import json
+from typing import Dict, List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages import CartPage, CheckoutOverviewPage, InventoryPage
+from pages.catalog import ADD_PREFIX
+
+
+def _slug(locator) -> str:
+    """Product slug encoded in an InventoryPage.ADD_* locator."""
+    return locator[1][len(ADD_PREFIX):]
+
+
+# Product slug (as used by the add-to-cart/remove button ids) -> app item id
+PRODUCT_IDS: Dict[str, int] = {
+    _slug(InventoryPage.ADD_BIKE_LIGHT): 0,
+    _slug(InventoryPage.ADD_BOLT_TSHIRT): 1,
+    _slug(InventoryPage.ADD_ONESIE): 2,
+    _slug(InventoryPage.ADD_TSHIRT_RED): 3,
+    _slug(InventoryPage.ADD_BACKPACK): 4,
+    _slug(InventoryPage.ADD_FLEECE_JACKET): 5,
+}
+
+
+class CartState:
+    """
+    Seeds the Sauce Demo cart through localStorage.
+
+    Features:
+    - Cart contents written in one script call
+    - One reload, verified through the inventory cart badge
+    - Falls back to bulk add-to-cart clicks when the app ignores the seed
+    - Deep link to the checkout overview, validated, with a UI fallback
+    """
+
+    STORAGE_KEY = "cart-contents"
+    SET_ITEM = "window.localStorage.setItem(arguments[0], arguments[1]);"
+    GET_ITEM = "return window.localStorage.getItem(arguments[0]);"
+    REMOVE_ITEM = "window.localStorage.removeItem(arguments[0]);"
+
+    def __init__(self, driver: WebDriver):
+        """
+        Initialize CartState.
+
+        Args:
+            driver: Logged-in WebDriver on the Sauce Demo origin
+        """
+        self.driver = driver
+        self.stats = {'seeded': 0, 'fallback': 0, 'overview_direct': 0, 'overview_ui': 0}
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def seed(self, product_names: List[str]) -> InventoryPage:
+        """
+        Make the cart contain exactly these products.
+
+        Args:
+            product_names: Slugs like 'sauce-labs-backpack'
+
+        Returns:
+            InventoryPage reloaded with the seeded cart
+        """
+        item_ids = self._write(product_names)
+
+        inventory_page = InventoryPage(self.driver)
+        inventory_page.open()
+        if inventory_page.get_cart_count() == len(item_ids):
+            self.stats['seeded'] += 1
+            return inventory_page
+
+        print(f"Cart seed not applied (badge {inventory_page.get_cart_count()}, "
+              f"expected {len(item_ids)}); adding through the UI")
+        self.stats['fallback'] += 1
+        self.clear()
+        inventory_page.open()
+        if product_names:
+            inventory_page.add_products_to_cart(list(product_names))
+        return inventory_page
+
+    def open_cart(self, product_names: List[str]) -> CartPage:
+        """
+        Seed the cart and open the cart page.
+
+        Args:
+            product_names: Slugs like 'sauce-labs-backpack'
+
+        Returns:
+            CartPage showing the seeded items
+        """
+        self.seed(product_names)
+        cart_page = CartPage(self.driver)
+        cart_page.open()
+        return cart_page
+
+    def open_checkout_overview(self, product_names: List[str], first_name: str = "John",
+                               last_name: str = "Doe", postal_code: str = "12345",
+                               via_ui: bool = False):
+        """
+        Reach the checkout overview with these products in the order.
+
+        The cart is written to localStorage and CheckoutOverviewPage.URL is
+        opened directly - a single page load. The result is validated (page
+        fingerprint and item count); if the app rejected the shortcut the
+        cart is seeded through the inventory page and the UI path is taken:
+        cart, checkout form, continue.
+
+        Args:
+            product_names: Slugs like 'sauce-labs-backpack'
+            first_name: Customer first name (UI path)
+            last_name: Customer last name (UI path)
+            postal_code: Postal/ZIP code (UI path)
+            via_ui: Skip the shortcut and always go through the UI
+
+        Returns:
+            CheckoutOverviewPage, or the page the UI path stopped on
+        """
+        if not via_ui:
+            self._write(product_names)
+            overview_page = CheckoutOverviewPage(self.driver)
+            overview_page.open()
+            if overview_page.verify_page() and \
+                    overview_page.get_item_count() == len(product_names):
+                self.stats['overview_direct'] += 1
+                return overview_page
+            print("Checkout overview deep link rejected; going through the UI")
+
+        inventory_page = self.seed(product_names)
+        self.stats['overview_ui'] += 1
+        checkout_page = inventory_page.go_to_cart().proceed_to_checkout()
+        return checkout_page.complete_checkout_info(first_name, last_name, postal_code)
+
+    def read(self) -> List[str]:
+        """Get the slugs currently stored in the cart."""
+        raw: Optional[str] = self.driver.execute_script(self.GET_ITEM, self.STORAGE_KEY)
+        slugs = {item_id: slug for slug, item_id in PRODUCT_IDS.items()}
+        return [slugs.get(item_id, str(item_id)) for item_id in json.loads(raw or "[]")]
+
+    def clear(self):
+        """Empty the stored cart (takes effect on the next page load)."""
+        self.driver.execute_script(self.REMOVE_ITEM, self.STORAGE_KEY)
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    def _write(self, product_names: List[str]) -> List[int]:
+        """
+        Store the cart for these products (applied on the next page load).
+
+        Raises:
+            KeyError: For slugs that are not Sauce Demo products
+
+        Returns:
+            App item ids written
+        """
+        unknown = [name for name in product_names if name not in PRODUCT_IDS]
+        if unknown:
+            raise KeyError(f"Unknown product(s) {unknown}. "
+                           f"Use one of: {list(PRODUCT_IDS)}")
+        item_ids = [PRODUCT_IDS[name] for name in product_names]
+        self.driver.execute_script(self.SET_ITEM, self.STORAGE_KEY, json.dumps(item_ids))
+        return item_ids
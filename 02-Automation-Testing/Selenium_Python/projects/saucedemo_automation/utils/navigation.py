@@ -0,0 +1,315 @@
+"""
+Page Navigation Planner
+=======================
+Explicit graph of how the page objects reach each other, and a planner
+that picks the cheapest route to a target page.
+
+Edges come in three kinds:
+- url: open the page's URL directly (usable from any page)
+- seeded: write the cart to localStorage and deep-link (CartState)
+- ui: a page-object action whose return value is the next page
+  (go_to_cart, proceed_to_checkout, click_finish, ...)
+
+Routes are planned over (page, cart seeded) states: seeding edges and
+add_products_to_cart fill the cart, click_finish and logout empty it.
+
+Every edge starts with a default cost estimate. The time each traversal
+actually takes replaces it with a running mean, and the means can be saved
+and loaded between runs. After an edge the planner checks the page
+fingerprint. If the app rejected the route, the planner drops that edge
+and plans again from wherever the session is.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import heapq
+import itertools
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages import (BasePage, CartPage, CheckoutCompletePage, CheckoutOverviewPage,
+                   CheckoutPage, InventoryPage, LoginPage)
+from .cart_state import CartState
+
+
+# Source of edges that can be taken from any page
+ANY = None
+
+# Estimated seconds per edge kind until a traversal has been measured
+DEFAULT_COSTS = {'url': 1.0, 'seeded': 1.2, 'ui': 0.5}
+
+DEFAULT_CUSTOMER = {'first_name': "John", 'last_name': "Doe", 'postal_code': "12345"}
+
+
+class Edge:
+    """One way of getting from a page (or ANY page) to another."""
+
+    __slots__ = ('name', 'source', 'target', 'kind', 'action', 'needs_products', 'seeds_cart',
+                 'clears_cart')
+
+    def __init__(self, name: str, source, target, kind: str, action: Callable,
+                 needs_products: bool = False, seeds_cart: bool = False,
+                 clears_cart: bool = False):
+        """
+        Initialize Edge.
+
+        Args:
+            name: Unique name, used as the key of measured costs
+            source: Page class the edge starts from, or ANY
+            target: Page class the edge arrives at
+            kind: 'url', 'seeded' or 'ui'
+            action: Callable(page_or_driver, context) returning the target page
+            needs_products: Only usable when products were requested
+            seeds_cart: Leaves the requested products in the cart
+            clears_cart: Leaves the cart empty
+        """
+        self.name = name
+        self.source = source
+        self.target = target
+        self.kind = kind
+        self.action = action
+        self.needs_products = needs_products
+        self.seeds_cart = seeds_cart
+        self.clears_cart = clears_cart
+
+    def seeded_after(self, seeded: bool) -> bool:
+        """Whether the requested products are in the cart after this edge."""
+        return not self.clears_cart and (seeded or self.seeds_cart)
+
+    def __repr__(self) -> str:
+        return f"Edge({self.name!r})"
+
+
+def _open_url(page_class) -> Callable:
+    """Action opening a page's URL."""
+    def action(driver: WebDriver, context: Dict):
+        page = page_class(driver)
+        page.navigate_to(page_class.URL)
+        return page
+    return action
+
+
+def build_edges() -> List[Edge]:
+    """
+    Build the Sauce Demo navigation graph.
+
+    Returns:
+        Every known edge
+    """
+    edges = [
+        Edge(f"url:{page_class.__name__}", ANY, page_class, 'url', _open_url(page_class))
+        for page_class in (LoginPage, InventoryPage, CartPage, CheckoutPage, CheckoutOverviewPage)
+    ]
+    edges += [
+        Edge("seeded:InventoryPage", ANY, InventoryPage, 'seeded',
+             lambda driver, context: CartState(driver).seed(context['products']),
+             needs_products=True, seeds_cart=True),
+        Edge("seeded:CartPage", ANY, CartPage, 'seeded',
+             lambda driver, context: CartState(driver).open_cart(context['products']),
+             needs_products=True, seeds_cart=True),
+        Edge("seeded:CheckoutOverviewPage", ANY, CheckoutOverviewPage, 'seeded',
+             lambda driver, context: CartState(driver).open_checkout_overview(
+                 context['products'], **context['customer']),
+             needs_products=True, seeds_cart=True),
+    ]
+    # The app empties the cart when an order is finished or the user logs out
+    clears = {"click_finish", "logout"}
+    ui = [
+        (LoginPage, InventoryPage, "login_as_standard_user",
+         lambda page, context: page.login_as_standard_user()),
+        (InventoryPage, InventoryPage, "add_products_to_cart",
+         lambda page, context: page.add_products_to_cart(list(context['products']))),
+        (InventoryPage, CartPage, "go_to_cart", lambda page, context: page.go_to_cart()),
+        (InventoryPage, LoginPage, "logout", lambda page, context: page.logout()),
+        (CartPage, InventoryPage, "continue_shopping",
+         lambda page, context: page.continue_shopping()),
+        (CartPage, CheckoutPage, "proceed_to_checkout",
+         lambda page, context: page.proceed_to_checkout()),
+        (CheckoutPage, CartPage, "click_cancel", lambda page, context: page.click_cancel()),
+        (CheckoutPage, CheckoutOverviewPage, "complete_checkout_info",
+         lambda page, context: page.complete_checkout_info(**context['customer'])),
+        (CheckoutOverviewPage, CheckoutCompletePage, "click_finish",
+         lambda page, context: page.click_finish()),
+        (CheckoutOverviewPage, InventoryPage, "click_cancel",
+         lambda page, context: page.click_cancel()),
+        (CheckoutCompletePage, InventoryPage, "click_back_home",
+         lambda page, context: page.click_back_home()),
+    ]
+    for source, target, method, action in ui:
+        adds = method == "add_products_to_cart"
+        edges.append(Edge(f"{source.__name__}.{method}", source, target, 'ui', action,
+                          needs_products=adds, seeds_cart=adds,
+                          clears_cart=method in clears))
+    return edges
+
+
+class NavigationPlanner:
+    """
+    Cheapest-route navigation between page objects.
+
+    Features:
+    - Dijkstra over (page, cart seeded) states
+    - Measured edge costs (running mean), persisted between runs
+    - Arrival validated by page fingerprint, replanning on rejection
+    """
+
+    def __init__(self, edges: Optional[List[Edge]] = None):
+        """
+        Initialize NavigationPlanner.
+
+        Args:
+            edges: Navigation graph (defaults to build_edges())
+        """
+        self.edges = edges if edges is not None else build_edges()
+        self.measured: Dict[str, Tuple[int, float]] = {}
+        self.stats = {'routes': 0, 'edges': 0, 'rejected': 0}
+
+    # =========================================================================
+    # COSTS
+    # =========================================================================
+
+    def cost(self, edge: Edge) -> float:
+        """Mean measured seconds of an edge, or the default for its kind."""
+        measured = self.measured.get(edge.name)
+        return measured[1] if measured else DEFAULT_COSTS[edge.kind]
+
+    def record(self, edge: Edge, seconds: float):
+        """Add a traversal time to an edge's running mean."""
+        count, mean = self.measured.get(edge.name, (0, 0.0))
+        count += 1
+        self.measured[edge.name] = (count, mean + (seconds - mean) / count)
+
+    def write_json(self, path: str):
+        """Write measured edge costs to a JSON file."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        data = {name: {'count': count, 'mean_seconds': round(mean, 4)}
+                for name, (count, mean) in sorted(self.measured.items())}
+        with open(path, 'w') as file:
+            json.dump({'edges': data, 'stats': self.stats}, file, indent=2)
+
+    def load_json(self, path: str):
+        """Start from edge costs measured in an earlier run (missing file is ignored)."""
+        try:
+            with open(path, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        for name, entry in data.get('edges', {}).items():
+            self.measured[name] = (entry['count'], entry['mean_seconds'])
+
+    # =========================================================================
+    # PLANNING
+    # =========================================================================
+
+    def plan(self, to, current=ANY, products: Optional[List[str]] = None,
+             exclude: Optional[Set[str]] = None,
+             cart_seeded: bool = False) -> Optional[List[Edge]]:
+        """
+        Find the cheapest route.
+
+        Args:
+            to: Target page class
+            current: Page class the session is on, or ANY if unknown
+            products: Product slugs the cart must contain on arrival
+            exclude: Edge names not to use
+            cart_seeded: The requested products are already in the cart
+
+        Returns:
+            Edges to traverse (empty if already there), or None if unreachable
+        """
+        exclude = exclude or set()
+        need_cart = products is not None
+        # (page, products in the cart, arrived at the target with them) - the
+        # last flag keeps e.g. click_finish a valid final edge although the
+        # app empties the cart on arrival
+        start = (current, cart_seeded or not need_cart, False)
+        counter = itertools.count()
+        queue = [(0.0, next(counter), start, [])]
+        best = {start: 0.0}
+        while queue:
+            total, _, state, route = heapq.heappop(queue)
+            page, seeded, arrived = state
+            if page is to and (seeded or arrived):
+                return route
+            if total > best.get(state, float('inf')):
+                continue
+            for edge in self.edges:
+                if edge.name in exclude or (edge.needs_products and not need_cart):
+                    continue
+                if edge.source is not ANY and edge.source is not page:
+                    continue
+                carried = seeded or edge.seeds_cart
+                state = (edge.target, edge.seeded_after(seeded) or not need_cart,
+                         edge.target is to and carried)
+                cost = total + self.cost(edge)
+                if cost < best.get(state, float('inf')):
+                    best[state] = cost
+                    heapq.heappush(queue, (cost, next(counter), state, route + [edge]))
+        return None
+
+    # =========================================================================
+    # NAVIGATION
+    # =========================================================================
+
+    def navigate(self, driver: WebDriver, to, current=None,
+                 products: Optional[List[str]] = None, **customer) -> BasePage:
+        """
+        Bring the session to a page by the cheapest validated route.
+
+        Args:
+            driver: WebDriver of a logged-in session
+            to: Target page class
+            current: Page object (or page class) the session is on, None if unknown
+            products: Product slugs the cart must contain on arrival
+            **customer: first_name, last_name, postal_code for the checkout form
+
+        Returns:
+            Page object of the target page
+
+        Raises:
+            RuntimeError: If no remaining route reaches the target
+        """
+        context = {'products': products, 'customer': {**DEFAULT_CUSTOMER, **customer}}
+        page = current(driver) if isinstance(current, type) else current
+        exclude: Set[str] = set()
+        cart_seeded = False
+        self.stats['routes'] += 1
+
+        while True:
+            route = self.plan(to, type(page) if page is not None else ANY, products,
+                              exclude, cart_seeded)
+            if route is None:
+                raise RuntimeError(f"No route to {to.__name__} "
+                                   f"(rejected edges: {sorted(exclude) or 'none'})")
+            if not route:
+                return page
+
+            for edge in route:
+                started = time.perf_counter()
+                arrived = edge.action(driver if edge.source is ANY else page, context)
+                if isinstance(arrived, edge.target) and arrived.verify_page():
+                    self.record(edge, time.perf_counter() - started)
+                    self.stats['edges'] += 1
+                    page = arrived
+                    cart_seeded = edge.seeded_after(cart_seeded)
+                    continue
+                print(f"Navigation edge {edge.name} rejected; replanning")
+                self.stats['rejected'] += 1
+                exclude.add(edge.name)
+                page, cart_seeded = None, False
+                break
+            else:
+                return page
+
+    def format_summary(self) -> List[str]:
+        """Lines describing measured edge costs, slowest first."""
+        lines = [f"routes={self.stats['routes']} edges={self.stats['edges']} "
+                 f"rejected={self.stats['rejected']}"]
+        for name, (count, mean) in sorted(self.measured.items(),
+                                          key=lambda item: item[1][1], reverse=True):
+            lines.append(f"  {name:<45} mean={mean:.3f}s n={count}")
+        return lines
@@ -7,12 +7,21 @@ Author: Muhammad Yasin Asif
 Portfolio: QA Engineer Portfolio
 """
 
+import os
+import sys
 import requests
 import json
 import logging
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
 
+# Shared framework configuration lives at the repository root
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config_loader import get_config
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -50,21 +59,22 @@ class APIClient:
     - Easy authentication
     """
     
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(self, base_url: str, timeout: Optional[float] = None):
         """
         Initialize API client.
         
+        Defaults come from the api section of config.yaml.
+        
         Args:
             base_url: Base URL for API
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds (defaults to api.timeout)
         """
+        api_config = get_config().api
         self.base_url = base_url.rstrip('/')
-        self.timeout = timeout
+        self.timeout = timeout if timeout is not None else api_config.timeout
         self.session = requests.Session()
-        self.default_headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        self.session.verify = api_config.verify_ssl
+        self.default_headers = dict(api_config.default_headers)
     
     def set_auth_token(self, token: str, prefix: str = 'Bearer'):
         """Set authorization token for requests."""
@@ -0,0 +1,369 @@
+"""
+Browser Pool Module
+===================
+Pool of pre-started WebDriver sessions for test automation.
+Sessions are leased per test and reset on return instead of being
+quit and relaunched, which removes browser startup from every test.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from driver_setup import DriverFactory
+
+
+class PoolStats:
+    """
+    Timing statistics collected by a BrowserPool.
+
+    Tracks:
+    - Time tests spent waiting for a session (lease wait)
+    - Time spent resetting sessions on return (reset cost)
+    - Sessions created and replaced after failed resets
+    - Replacement sessions that failed to start (slot refilled on demand)
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.lease_waits: List[float] = []
+        self.reset_times: List[float] = []
+        self.sessions_created = 0
+        self.sessions_replaced = 0
+        self.spawn_failures = 0
+        self.last_spawn_error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def record_lease(self, seconds: float):
+        """Record how long a lease waited for an idle session."""
+        with self._lock:
+            self.lease_waits.append(seconds)
+
+    def record_reset(self, seconds: float):
+        """Record how long a session reset took."""
+        with self._lock:
+            self.reset_times.append(seconds)
+
+    def record_created(self, replaced: bool = False):
+        """Record a newly started session."""
+        with self._lock:
+            self.sessions_created += 1
+            if replaced:
+                self.sessions_replaced += 1
+
+    def record_spawn_failure(self, error: Exception):
+        """Record a replacement session that failed to start."""
+        with self._lock:
+            self.spawn_failures += 1
+            self.last_spawn_error = f"{type(error).__name__}: {error}"
+
+    def summary(self) -> Dict:
+        """
+        Summarize collected statistics.
+
+        Returns:
+            Dictionary with lease and reset totals, averages and maximums
+        """
+        with self._lock:
+            waits = list(self.lease_waits)
+            resets = list(self.reset_times)
+
+        def _avg(values: List[float]) -> float:
+            return sum(values) / len(values) if values else 0.0
+
+        return {
+            'leases': len(waits),
+            'lease_wait_avg': _avg(waits),
+            'lease_wait_max': max(waits, default=0.0),
+            'resets': len(resets),
+            'reset_avg': _avg(resets),
+            'reset_max': max(resets, default=0.0),
+            'sessions_created': self.sessions_created,
+            'sessions_replaced': self.sessions_replaced,
+            'spawn_failures': self.spawn_failures,
+            'last_spawn_error': self.last_spawn_error,
+        }
+
+    def format_summary(self) -> str:
+        """Return a one-line human readable summary."""
+        data = self.summary()
+        line = (f"leases={data['leases']} "
+                f"wait avg={data['lease_wait_avg']:.3f}s max={data['lease_wait_max']:.3f}s | "
+                f"resets={data['resets']} "
+                f"cost avg={data['reset_avg']:.3f}s max={data['reset_max']:.3f}s | "
+                f"sessions created={data['sessions_created']} "
+                f"replaced={data['sessions_replaced']}")
+        if data['spawn_failures']:
+            line += (f" spawn failures={data['spawn_failures']} "
+                     f"(last: {data['last_spawn_error']})")
+        return line
+
+
+class BrowserPool:
+    """
+    Pool of warm WebDriver sessions built on DriverFactory.
+
+    Features:
+    - One warm session per consumer (more for multi-threaded callers),
+      larger pools started concurrently
+    - Lease/release semantics, one session per test
+    - Session reset on release (cookies, storage, tabs, window size)
+    - Broken sessions are replaced transparently, in the background with
+      browser.prefetch (or on the next lease if the replacement fails)
+    - Lease wait and reset cost statistics
+    """
+
+    BLANK_PAGE = 'about:blank'
+
+    def __init__(self, factory: Optional[DriverFactory] = None,
+                 size: Optional[int] = None,
+                 browser_name: Optional[str] = None,
+                 headless: Optional[bool] = None,
+                 lease_timeout: float = 60,
+                 prefetch: Optional[bool] = None):
+        """
+        Initialize BrowserPool.
+
+        Args:
+            factory: DriverFactory used to start sessions
+            size: Number of warm sessions - one per thread leasing from
+                  the pool (defaults to 1: a test process runs one test
+                  at a time)
+            browser_name: Browser to use (defaults to config)
+            headless: Run in headless mode (defaults to config)
+            lease_timeout: Seconds to wait for an idle session
+            prefetch: Start replacements for broken sessions on a background
+                      thread instead of during release (defaults to
+                      browser.prefetch)
+        """
+        self.factory = factory or DriverFactory()
+        self.size = size or 1
+        self.browser_name = browser_name
+        self.headless = headless
+        self.lease_timeout = lease_timeout
+        self.prefetch = (self.factory.config.browser.prefetch
+                         if prefetch is None else prefetch)
+        self.stats = PoolStats()
+
+        self._idle: 'queue.Queue[webdriver.Remote]' = queue.Queue()
+        self._sessions: List[webdriver.Remote] = []
+        self._starting = 0  # sessions being spawned (reserved slots)
+        self._replacer: Optional[ThreadPoolExecutor] = None
+        self._window_rects: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    def start(self):
+        """Start all sessions (concurrently) so they are warm before the first lease."""
+        slots = 0
+        while self._reserve_slot():
+            slots += 1
+        if slots == 1:
+            self._idle.put(self._spawn())
+        elif slots:
+            with ThreadPoolExecutor(max_workers=slots) as executor:
+                for driver in executor.map(lambda _: self._spawn(), range(slots)):
+                    self._idle.put(driver)
+        return self
+
+    def close(self):
+        """Quit every session owned by the pool (and any prefetched one)."""
+        with self._lock:
+            self._closed = True
+        # Let a replacement still starting finish, so it is quit below
+        if self._replacer is not None:
+            self._replacer.shutdown(wait=True)
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        self.factory.disable_prefetch()
+        for driver in sessions:
+            self._quit(driver)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # =========================================================================
+    # LEASING
+    # =========================================================================
+
+    def lease(self, timeout: Optional[float] = None) -> webdriver.Remote:
+        """
+        Take an idle session out of the pool.
+
+        Waits for a replacement being started in the background. If a
+        slot was lost because a replacement session failed to start, a new
+        session is started for this lease, so a start failure surfaces
+        with its real cause instead of a lease timeout.
+
+        Args:
+            timeout: Seconds to wait (defaults to lease_timeout)
+
+        Returns:
+            WebDriver instance reserved for the caller
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+
+        start = time.perf_counter()
+        deadline = start + (timeout or self.lease_timeout)
+        driver = None
+        while driver is None:
+            # None in the queue: a background replacement failed, its slot is free
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                if self._reserve_slot():
+                    driver = self._spawn()
+                    break
+                try:
+                    driver = self._idle.get(timeout=max(deadline - time.perf_counter(), 0))
+                except queue.Empty:
+                    raise TimeoutError(f"No browser session became available within "
+                                       f"{timeout or self.lease_timeout}s "
+                                       f"(pool size {self.size})")
+        self.stats.record_lease(time.perf_counter() - start)
+        return driver
+
+    def release(self, driver: webdriver.Remote):
+        """
+        Reset a session and return it to the pool.
+
+        Sessions that fail to reset are quit and replaced - on a background
+        thread when prefetch is on, so teardown does not wait for the new
+        browser. If the replacement cannot be started the failure is
+        recorded and the free slot is filled by the next lease().
+
+        Args:
+            driver: WebDriver previously returned by lease()
+        """
+        if self._closed:
+            self._quit(driver)
+            return
+
+        start = time.perf_counter()
+        try:
+            self._reset(driver)
+        except (WebDriverException, IndexError):
+            self._discard(driver)
+            driver = None
+            if self._reserve_slot():
+                if self.prefetch:
+                    self._replace_in_background()
+                else:
+                    driver = self._spawn_replacement()
+        self.stats.record_reset(time.perf_counter() - start)
+        if driver is not None:
+            self._idle.put(driver)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[webdriver.Remote]:
+        """Lease a session for the duration of a with-block."""
+        driver = self.lease(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    # =========================================================================
+    # SESSION MANAGEMENT
+    # =========================================================================
+
+    def _reserve_slot(self) -> bool:
+        """Claim room for one more session (released again by _spawn)."""
+        with self._lock:
+            if self._closed or len(self._sessions) + self._starting >= self.size:
+                return False
+            self._starting += 1
+            return True
+
+    def _spawn(self, replaced: bool = False) -> webdriver.Remote:
+        """Start a new session in a slot claimed with _reserve_slot."""
+        try:
+            driver = self.factory.create_driver(browser_name=self.browser_name,
+                                                headless=self.headless)
+        finally:
+            with self._lock:
+                self._starting -= 1
+        with self._lock:
+            self._sessions.append(driver)
+            self._window_rects[driver.session_id] = driver.get_window_rect()
+        self.stats.record_created(replaced=replaced)
+        return driver
+
+    def _spawn_replacement(self) -> Optional[webdriver.Remote]:
+        """Start a replacement in a reserved slot; None (recorded) if it fails."""
+        try:
+            return self._spawn(replaced=True)
+        except Exception as e:
+            self.stats.record_spawn_failure(e)
+            print(f"Replacement browser session failed to start: {e}")
+            return None
+
+    def _replace_in_background(self):
+        """Start a replacement on the replacer thread; it is queued (or None) when done."""
+        if self._replacer is None:
+            self._replacer = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix='pool-replace')
+        self._replacer.submit(lambda: self._idle.put(self._spawn_replacement()))
+
+    def _discard(self, driver: webdriver.Remote):
+        """Remove a session from the pool and quit it."""
+        with self._lock:
+            if driver in self._sessions:
+                self._sessions.remove(driver)
+            self._window_rects.pop(driver.session_id, None)
+        self._quit(driver)
+
+    def _reset(self, driver: webdriver.Remote):
+        """
+        Restore a session to a clean state.
+
+        Closes extra tabs, clears storage and cookies, restores the
+        original window size and parks the session on a blank page.
+        """
+        handles = driver.window_handles
+        if len(handles) > 1:
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is scoped to the current origin, so clear it before leaving
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); }"
+            " catch (e) {}"
+        )
+
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        else:
+            driver.delete_all_cookies()
+
+        rect = self._window_rects.get(driver.session_id)
+        if rect and driver.get_window_rect() != rect:
+            driver.set_window_rect(**rect)
+
+        driver.get(self.BLANK_PAGE)
+
+    @staticmethod
+    def _quit(driver: webdriver.Remote):
+        """Quit a session, ignoring errors from dead browsers."""
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error quitting pooled driver: {e}")
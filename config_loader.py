@@ -0,0 +1,295 @@
+"""
+Configuration Loader Module
+===========================
+Single, shared, typed view of config.yaml.
+
+The file is parsed once per process and re-parsed only when its mtime
+changes. Every section is a dataclass with __slots__, so the driver
+factory, logger, API client and fixtures read attributes instead of
+walking nested dictionaries.
+
+Environment variables override any value:
+    QA_<SECTION>__<KEY>=<yaml value>
+    e.g. QA_BROWSER__HEADLESS=true, QA_EXECUTION__MAX_WORKERS=2,
+         QA_DEFAULT_ENVIRONMENT=qa
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import dataclasses
+import os
+import threading
+import typing
+import yaml
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.yaml')
+ENV_PREFIX = 'QA_'
+
+
+# =============================================================================
+# CONFIGURATION SECTIONS
+# =============================================================================
+
+@dataclass(slots=True)
+class EnvironmentConfig:
+    """URLs for one target environment."""
+    base_url: str = 'https://www.saucedemo.com'
+    api_url: str = ''
+
+
+@dataclass(slots=True)
+class BlockResourcesConfig:
+    """Network resource blocking profile (Chrome only)."""
+    enabled: bool = False
+    report: bool = True
+    patterns: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class BrowserConfig:
+    """Browser startup settings."""
+    name: str = 'chrome'
+    headless: bool = False
+    maximize: bool = True
+    implicit_wait: float = 0
+    explicit_wait: float = 20
+    page_load_timeout: float = 30
+    page_load_strategy: str = 'normal'
+    prefetch: bool = False
+    chrome_options: List[str] = field(default_factory=list)
+    firefox_options: List[str] = field(default_factory=list)
+    block_resources: BlockResourcesConfig = field(default_factory=BlockResourcesConfig)
+
+
+@dataclass(slots=True)
+class RemoteConfig:
+    """Selenium Grid / standalone server settings."""
+    enabled: bool = False
+    url: str = 'http://localhost:4444'
+    keep_alive: bool = True
+    pool_maxsize: int = 4
+    timeout: float = 120
+
+
+@dataclass(slots=True)
+class UserCredentials:
+    """Login credentials for one test user."""
+    username: str = ''
+    password: str = ''
+    description: str = ''
+
+
+@dataclass(slots=True)
+class LoggingConfig:
+    """Logger settings."""
+    level: str = 'INFO'
+    format: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    file_name: str = 'test_execution.log'
+    log_dir: str = 'logs'
+    max_bytes: int = 10485760  # 10MB
+    backup_count: int = 5
+
+
+@dataclass(slots=True)
+class ReportingConfig:
+    """Report and artifact locations."""
+    screenshots_on_failure: bool = True
+    screenshot_dir: str = 'screenshots'
+    artifact_queue_size: int = 8
+    report_dir: str = 'reports'
+    allure_results: str = 'allure-results'
+    html_report: bool = True
+
+
+@dataclass(slots=True)
+class ExecutionConfig:
+    """Test execution settings."""
+    parallel_mode: bool = False
+    max_workers: int = 1
+    retry_failed_tests: int = 0
+    fail_fast: bool = False
+
+
+@dataclass(slots=True)
+class TimeoutsConfig:
+    """Named timeouts in seconds, and how waits detect changes."""
+    short: float = 5
+    medium: float = 10
+    long: float = 30
+    page_load: float = 60
+    script: float = 30
+    wait_backend: str = 'mutation'
+
+
+@dataclass(slots=True)
+class ApiConfig:
+    """API client settings."""
+    timeout: float = 30
+    verify_ssl: bool = True
+    default_headers: Dict[str, str] = field(default_factory=lambda: {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+    })
+
+
+@dataclass(slots=True)
+class FrameworkConfig:
+    """Complete, typed contents of config.yaml."""
+    environments: Dict[str, EnvironmentConfig] = field(
+        default_factory=lambda: {'dev': EnvironmentConfig()}
+    )
+    default_environment: str = 'dev'
+    browser: BrowserConfig = field(default_factory=BrowserConfig)
+    remote: RemoteConfig = field(default_factory=RemoteConfig)
+    test_users: Dict[str, UserCredentials] = field(default_factory=dict)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    reporting: ReportingConfig = field(default_factory=ReportingConfig)
+    execution: ExecutionConfig = field(default_factory=ExecutionConfig)
+    timeouts: TimeoutsConfig = field(default_factory=TimeoutsConfig)
+    api: ApiConfig = field(default_factory=ApiConfig)
+    path: Optional[str] = None
+
+    def base_url(self, environment: Optional[str] = None) -> str:
+        """
+        Get base URL for an environment.
+
+        Args:
+            environment: Environment name (defaults to default_environment)
+
+        Returns:
+            Base URL string
+        """
+        env = self.environments.get(environment or self.default_environment)
+        return env.base_url if env else EnvironmentConfig().base_url
+
+
+# =============================================================================
+# BUILDING
+# =============================================================================
+
+def _build(cls, data):
+    """Recursively build a dataclass (or typed container) from raw YAML data."""
+    if dataclasses.is_dataclass(cls):
+        if not isinstance(data, dict):
+            return cls()
+        hints = typing.get_type_hints(cls)
+        values = {}
+        for item in dataclasses.fields(cls):
+            if item.name in data and data[item.name] is not None:
+                values[item.name] = _build(hints[item.name], data[item.name])
+        return cls(**values)
+
+    origin = typing.get_origin(cls)
+    args = typing.get_args(cls)
+    if origin is dict:
+        return {key: _build(args[1], value) for key, value in (data or {}).items()}
+    if origin is list:
+        return [_build(args[0], value) for value in (data or [])]
+    if origin is typing.Union:
+        return _build(next(arg for arg in args if arg is not type(None)), data)
+    if cls is float and isinstance(data, int):
+        return float(data)
+    return data
+
+
+def _apply_env_overrides(raw: Dict, environ) -> Dict:
+    """
+    Apply QA_<SECTION>__<KEY> overrides to the raw YAML data.
+
+    Values are parsed as YAML, so 'true', '2' and '[a, b]' keep their types.
+    """
+    for name, value in environ.items():
+        if not name.startswith(ENV_PREFIX):
+            continue
+        path = [part.lower() for part in name[len(ENV_PREFIX):].split('__')]
+        if path[0] not in FrameworkConfig.__dataclass_fields__:
+            continue
+        target = raw
+        for part in path[:-1]:
+            target = target.setdefault(part, {})
+            if not isinstance(target, dict):
+                break
+        else:
+            target[path[-1]] = yaml.safe_load(value)
+    return raw
+
+
+def load_config(path: Optional[str] = None, environ=None) -> FrameworkConfig:
+    """
+    Parse config.yaml into a FrameworkConfig (no caching).
+
+    Args:
+        path: Path to config.yaml (defaults to the repository root file)
+        environ: Environment mapping for overrides (defaults to os.environ)
+
+    Returns:
+        FrameworkConfig instance
+    """
+    path = os.path.abspath(path or DEFAULT_CONFIG_PATH)
+    try:
+        with open(path, 'r') as file:
+            raw = yaml.safe_load(file) or {}
+    except FileNotFoundError:
+        print(f"Config file not found: {path}. Using defaults.")
+        raw = {}
+
+    raw = _apply_env_overrides(raw, os.environ if environ is None else environ)
+    config = _build(FrameworkConfig, raw)
+    config.path = path
+    return config
+
+
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_cache: Dict[str, Tuple[Tuple, FrameworkConfig]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_key(path: str) -> Tuple:
+    """File mtime plus QA_ environment variables identify a parsed config."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    overrides = tuple(sorted((name, value) for name, value in os.environ.items()
+                             if name.startswith(ENV_PREFIX)))
+    return (mtime, overrides)
+
+
+def get_config(path: Optional[str] = None) -> FrameworkConfig:
+    """
+    Get the process-wide configuration.
+
+    The file is parsed on first use and again only when its mtime or the
+    QA_ environment overrides change.
+
+    Args:
+        path: Path to config.yaml (defaults to the repository root file)
+
+    Returns:
+        Shared FrameworkConfig instance
+    """
+    path = os.path.abspath(path or DEFAULT_CONFIG_PATH)
+    key = _cache_key(path)
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is None or cached[0] != key:
+            cached = (key, load_config(path))
+            _cache[path] = cached
+        return cached[1]
+
+
+# Example usage
+if __name__ == '__main__':
+    config = get_config()
+    print(f"Config file: {config.path}")
+    print(f"Browser: {config.browser.name} (headless={config.browser.headless})")
+    print(f"Base URL: {config.base_url()}")
+    print(f"Workers: {config.execution.max_workers}")
+    print(f"Users: {', '.join(config.test_users)}")
@@ -0,0 +1,319 @@
+"""
+Driver Resolver Module
+======================
+Cached, offline-capable resolution of browser driver binaries.
+Replaces calling *DriverManager().install() on every driver creation.
+
+Resolved paths are cached per browser name and installed browser
+version, validated with a cheap stat check (falling back to a content
+hash) and looked up without any network access.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+from typing import Dict, List, Optional
+
+
+class DriverResolver:
+    """
+    Resolves and caches driver binary paths.
+
+    Lookup order on a cache miss:
+    1. Environment variable override (e.g. CHROMEDRIVER_PATH)
+    2. Driver binary on PATH
+    3. Drivers already downloaded by webdriver-manager (~/.wdm)
+    4. webdriver-manager download (skipped in offline mode)
+
+    Returns None when nothing is found so Selenium Manager can take over.
+    """
+
+    DRIVER_BINARIES = {
+        'chrome': 'chromedriver',
+        'firefox': 'geckodriver',
+        'edge': 'msedgedriver',
+    }
+
+    BROWSER_BINARIES = {
+        'chrome': ['google-chrome', 'google-chrome-stable', 'chromium',
+                   'chromium-browser', 'chrome'],
+        'firefox': ['firefox'],
+        'edge': ['microsoft-edge', 'microsoft-edge-stable', 'msedge'],
+    }
+
+    ENV_OVERRIDES = {
+        'chrome': 'CHROMEDRIVER_PATH',
+        'firefox': 'GECKODRIVER_PATH',
+        'edge': 'EDGEDRIVER_PATH',
+    }
+
+    DEFAULT_CACHE_PATH = os.path.join(
+        os.path.expanduser('~'), '.cache', 'qa-portfolio', 'driver_paths.json'
+    )
+
+    def __init__(self, cache_path: Optional[str] = None,
+                 offline: Optional[bool] = None):
+        """
+        Initialize DriverResolver.
+
+        Args:
+            cache_path: JSON file holding resolved paths
+            offline: Never download drivers (defaults to QA_DRIVER_OFFLINE env)
+        """
+        self.cache_path = cache_path or os.environ.get('QA_DRIVER_CACHE',
+                                                       self.DEFAULT_CACHE_PATH)
+        if offline is None:
+            offline = os.environ.get('QA_DRIVER_OFFLINE', '').lower() in ('1', 'true', 'yes')
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+
+        self._memory: Dict[str, str] = {}
+        self._versions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def resolve(self, browser: str) -> Optional[str]:
+        """
+        Return the driver binary path for a browser.
+
+        Args:
+            browser: Browser name (chrome, firefox, edge)
+
+        Returns:
+            Path to driver binary, or None to let Selenium Manager decide
+        """
+        browser = browser.lower()
+        with self._lock:
+            key = f'{browser}:{self.browser_version(browser)}'
+
+            path = self._memory.get(key)
+            if path:
+                self.hits += 1
+                return path
+
+            cache = self._read_cache()
+            entry = cache.get(key)
+            if entry and self._is_valid(entry):
+                self.hits += 1
+                self._memory[key] = entry['path']
+                if entry.get('_refreshed'):
+                    entry.pop('_refreshed')
+                    self._write_cache(cache)
+                return entry['path']
+
+            self.misses += 1
+            path = self._locate(browser, key)
+            if path:
+                self._memory[key] = path
+                cache[key] = self._make_entry(path)
+                self._write_cache(cache)
+            return path
+
+    def browser_version(self, browser: str) -> str:
+        """
+        Get the installed browser version without network access.
+
+        Args:
+            browser: Browser name (chrome, firefox, edge)
+
+        Returns:
+            Version string like '120.0.6099.109', or 'unknown'
+        """
+        if browser not in self._versions:
+            self._versions[browser] = self._detect_browser_version(browser)
+        return self._versions[browser]
+
+    def stats(self) -> Dict:
+        """Return cache hit/miss counters."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def clear(self):
+        """Forget all cached paths (memory and disk)."""
+        with self._lock:
+            self._memory.clear()
+            self._write_cache({})
+
+    # =========================================================================
+    # CACHE VALIDATION
+    # =========================================================================
+
+    def _make_entry(self, path: str) -> Dict:
+        """Build a cache entry with stat and hash fingerprints."""
+        stat = os.stat(path)
+        return {
+            'path': path,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': self._hash_file(path),
+        }
+
+    def _is_valid(self, entry: Dict) -> bool:
+        """
+        Check a cache entry still points at the same binary.
+
+        A matching size and mtime is accepted as-is. If the stat changed
+        but the content hash still matches, the entry is refreshed.
+        """
+        path = entry.get('path', '')
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if not os.access(path, os.X_OK):
+            return False
+
+        if stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime_ns'):
+            return True
+
+        if self._hash_file(path) == entry.get('sha256'):
+            entry['size'] = stat.st_size
+            entry['mtime_ns'] = stat.st_mtime_ns
+            entry['_refreshed'] = True
+            return True
+        return False
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        """Return sha256 hex digest of a file."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _read_cache(self) -> Dict:
+        """Load the on-disk cache, ignoring missing or corrupt files."""
+        try:
+            with open(self.cache_path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, cache: Dict):
+        """Atomically write the on-disk cache."""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f'{self.cache_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as file:
+                json.dump(cache, file, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Could not write driver cache {self.cache_path}: {e}")
+
+    # =========================================================================
+    # LOOKUP
+    # =========================================================================
+
+    def _locate(self, browser: str, key: str) -> Optional[str]:
+        """Find a driver binary on a cache miss."""
+        binary = self.DRIVER_BINARIES.get(browser)
+        if binary is None:
+            raise ValueError(f"No driver binary known for browser '{browser}'")
+
+        override = os.environ.get(self.ENV_OVERRIDES[browser])
+        if override and os.path.isfile(override):
+            return override
+
+        on_path = shutil.which(binary)
+        if on_path:
+            return on_path
+
+        downloaded = self._find_downloaded(binary, self.browser_version(browser))
+        if downloaded:
+            return downloaded
+
+        if self.offline:
+            return None
+        return self._download(browser)
+
+    @staticmethod
+    def _find_downloaded(binary: str, version: str) -> Optional[str]:
+        """Look for a driver previously downloaded by webdriver-manager."""
+        wdm_root = os.environ.get('WDM_LOCAL_PATH') or os.path.join(os.path.expanduser('~'), '.wdm')
+        names = [binary, f'{binary}.exe']
+        candidates: List[str] = []
+        for name in names:
+            candidates.extend(glob.glob(os.path.join(wdm_root, 'drivers', '**', name),
+                                        recursive=True))
+        candidates = [path for path in candidates if os.access(path, os.X_OK)]
+        if not candidates:
+            return None
+
+        major = version.split('.')[0]
+        matching = [path for path in candidates if f'{os.sep}{major}.' in path]
+        return sorted(matching or candidates)[-1]
+
+    @staticmethod
+    def _download(browser: str) -> Optional[str]:
+        """Download a driver through webdriver-manager (network access)."""
+        try:
+            if browser == 'chrome':
+                from webdriver_manager.chrome import ChromeDriverManager
+                return ChromeDriverManager().install()
+            if browser == 'firefox':
+                from webdriver_manager.firefox import GeckoDriverManager
+                return GeckoDriverManager().install()
+            from webdriver_manager.microsoft import EdgeChromiumDriverManager
+            return EdgeChromiumDriverManager().install()
+        except Exception as e:
+            print(f"Driver download for {browser} failed: {e}. "
+                  f"Falling back to Selenium Manager.")
+            return None
+
+    def _detect_browser_version(self, browser: str) -> str:
+        """Run the browser binary with --version to read its version."""
+        for name in self.BROWSER_BINARIES.get(browser, []):
+            executable = shutil.which(name)
+            if not executable:
+                continue
+            try:
+                output = subprocess.run([executable, '--version'], capture_output=True,
+                                        text=True, timeout=10).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+            match = re.search(r'(\d+(?:\.\d+)+)', output)
+            if match:
+                return match.group(1)
+        return 'unknown'
+
+
+_default_resolver: Optional[DriverResolver] = None
+
+
+def get_resolver() -> DriverResolver:
+    """
+    Get the process-wide DriverResolver.
+
+    Returns:
+        Shared DriverResolver instance
+    """
+    global _default_resolver
+    if _default_resolver is None:
+        _default_resolver = DriverResolver()
+    return _default_resolver
+
+
+def resolve_driver_path(browser: str = 'chrome') -> Optional[str]:
+    """Quick driver path lookup through the shared resolver."""
+    return get_resolver().resolve(browser)
+
+
+# Example usage
+if __name__ == '__main__':
+    resolver = get_resolver()
+    for name in ('chrome', 'firefox', 'edge'):
+        print(f"{name}: version={resolver.browser_version(name)} "
+              f"driver={resolver.resolve(name)}")
+    print(f"Cache stats: {resolver.stats()}")
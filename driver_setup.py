@@ -8,9 +8,9 @@ Author: Muhammad Yasin Asif
 Portfolio: QA Engineer Portfolio
 """
 
-import os
-import yaml
-from typing import Optional
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -18,9 +18,12 @@ from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+from config_loader import FrameworkConfig, get_config
+from driver_resolver import DriverResolver, get_resolver
+from grid_connection import GridConnection
+from resource_blocking import ResourceBlocker
+from startup_timing import StartupTiming, get_collector
 
 
 class DriverFactory:
@@ -28,51 +31,43 @@ class DriverFactory:
     Factory class for creating WebDriver instances.
     
     Supports multiple browsers and configurations.
-    Uses webdriver-manager for automatic driver management.
+    Driver binaries are resolved through a cached DriverResolver,
+    falling back to webdriver-manager only on a cold cache.
+    With remote.enabled sessions are created on a Selenium Grid instead.
     """
     
     SUPPORTED_BROWSERS = ['chrome', 'firefox', 'edge']
     
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: Optional[str] = None,
+                 resolver: Optional[DriverResolver] = None):
         """
         Initialize DriverFactory with configuration.
         
         Args:
             config_path: Path to the YAML configuration file
+                         (defaults to the repository config.yaml)
+            resolver: Driver binary resolver (defaults to the shared one)
         """
-        self.config = self._load_config(config_path)
+        self.config: FrameworkConfig = get_config(config_path)
+        self.resolver = resolver or get_resolver()
+        self.resource_blocker = ResourceBlocker(self.config.browser.block_resources)
         self.driver: Optional[webdriver.Remote] = None
+        self.last_timing: Optional[StartupTiming] = None
+        
+        # Background prefetch of the next session (see enable_prefetch)
+        self.prefetch_stats = {'served': 0, 'wait_total': 0.0}
+        self._prefetch_target: Optional[Tuple[str, bool]] = None
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_future: Optional[Future] = None
         
-    def _load_config(self, config_path: str) -> dict:
-        """Load configuration from YAML file."""
-        try:
-            with open(config_path, 'r') as file:
-                return yaml.safe_load(file)
-        except FileNotFoundError:
-            print(f"Config file not found: {config_path}. Using defaults.")
-            return self._get_default_config()
-    
-    def _get_default_config(self) -> dict:
-        """Return default configuration if config file not found."""
-        return {
-            'browser': {
-                'name': 'chrome',
-                'headless': False,
-                'maximize': True,
-                'implicit_wait': 10,
-                'page_load_timeout': 30,
-            },
-            'environments': {
-                'dev': {'base_url': 'https://www.saucedemo.com'}
-            },
-            'default_environment': 'dev'
-        }
-    
     def create_driver(self, browser_name: Optional[str] = None, 
                       headless: Optional[bool] = None) -> webdriver.Remote:
         """
         Create and return a WebDriver instance.
         
+        Returns the prefetched session when prefetch is enabled for the
+        same browser/headless combination.
+        
         Args:
             browser_name: Browser to use (chrome, firefox, edge)
             headless: Run in headless mode
@@ -80,36 +75,175 @@ class DriverFactory:
         Returns:
             WebDriver instance
         """
-        browser = browser_name or self.config.get('browser', {}).get('name', 'chrome')
+        browser, is_headless = self._resolve_target(browser_name, headless)
+        
+        if self._prefetch_target == (browser, is_headless):
+            driver = self._take_prefetched()
+        else:
+            driver = self._build_driver(browser, is_headless)
+        
+        self.driver = driver
+        return self.driver
+    
+    def _resolve_target(self, browser_name: Optional[str],
+                        headless: Optional[bool]) -> Tuple[str, bool]:
+        """Apply config defaults and validate the requested browser."""
+        browser = browser_name or self.config.browser.name
         browser = browser.lower()
         
         if browser not in self.SUPPORTED_BROWSERS:
             raise ValueError(f"Browser '{browser}' not supported. "
                            f"Use one of: {self.SUPPORTED_BROWSERS}")
         
-        is_headless = headless if headless is not None else \
-                      self.config.get('browser', {}).get('headless', False)
+        is_headless = headless if headless is not None else self.config.browser.headless
+        return browser, is_headless
+    
+    def _build_driver(self, browser: str, headless: bool) -> webdriver.Remote:
+        """
+        Start and configure a new session.
         
-        if browser == 'chrome':
-            self.driver = self._create_chrome_driver(is_headless)
+        Uses only local state, so it is safe to run on the prefetch thread.
+        """
+        timing = StartupTiming(browser)
+        if self.config.remote.enabled:
+            driver = self._create_remote_driver(browser, headless, timing)
+        elif browser == 'chrome':
+            driver = self._create_chrome_driver(headless, timing)
         elif browser == 'firefox':
-            self.driver = self._create_firefox_driver(is_headless)
+            driver = self._create_firefox_driver(headless, timing)
         elif browser == 'edge':
-            self.driver = self._create_edge_driver(is_headless)
+            driver = self._create_edge_driver(headless, timing)
             
-        self._configure_driver()
-        return self.driver
+        self._configure_driver(driver, timing)
+        
+        self.last_timing = timing
+        get_collector().record(timing)
+        return driver
+    
+    # =========================================================================
+    # PREFETCH
+    # =========================================================================
+    
+    def enable_prefetch(self, browser_name: Optional[str] = None,
+                        headless: Optional[bool] = None):
+        """
+        Keep the next session starting in a background thread.
+        
+        While the current test runs, the next browser is spawned, its
+        session negotiated and _configure_driver applied, so
+        create_driver can hand it out without startup latency.
+        
+        Args:
+            browser_name: Browser to prefetch (defaults to config)
+            headless: Run in headless mode (defaults to config)
+        """
+        target = self._resolve_target(browser_name, headless)
+        if self._prefetch_target == target:
+            return
+        self.disable_prefetch()
+        self._prefetch_target = target
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1,
+                                                     thread_name_prefix='driver-prefetch')
+        self._schedule_prefetch()
+    
+    def disable_prefetch(self):
+        """Stop prefetching and quit the session prepared in the background."""
+        future, self._prefetch_future = self._prefetch_future, None
+        executor, self._prefetch_executor = self._prefetch_executor, None
+        self._prefetch_target = None
+        if executor:
+            executor.shutdown(wait=True)
+        if future and not future.exception():
+            try:
+                future.result().quit()
+            except Exception as e:
+                print(f"Error quitting prefetched driver: {e}")
+    
+    def _schedule_prefetch(self):
+        """Start building the next session in the background."""
+        browser, headless = self._prefetch_target
+        self._prefetch_future = self._prefetch_executor.submit(
+            self._build_driver, browser, headless
+        )
+    
+    def _take_prefetched(self) -> webdriver.Remote:
+        """Hand out the prefetched session and start preparing the next one."""
+        future = self._prefetch_future
+        start = time.perf_counter()
+        try:
+            driver = future.result()
+        except Exception as e:
+            print(f"Prefetched driver failed to start: {e}. Starting synchronously.")
+            driver = self._build_driver(*self._prefetch_target)
+        self.prefetch_stats['served'] += 1
+        self.prefetch_stats['wait_total'] += time.perf_counter() - start
+        
+        self._schedule_prefetch()
+        return driver
     
-    def _create_chrome_driver(self, headless: bool) -> webdriver.Chrome:
+    def _create_chrome_driver(self, headless: bool, timing: StartupTiming) -> webdriver.Chrome:
         """Create Chrome WebDriver instance."""
+        options = self._chrome_options(headless)
+        
+        with timing.phase('resolve'):
+            service = ChromeService(self.resolver.resolve('chrome'))
+        driver = self._start_session(webdriver.Chrome, service, options, timing)
+        
+        # Block images, fonts and third-party scripts via CDP
+        with timing.phase('resource_blocking'):
+            self.resource_blocker.apply(driver)
+        return driver
+    
+    def _create_firefox_driver(self, headless: bool, timing: StartupTiming) -> webdriver.Firefox:
+        """Create Firefox WebDriver instance."""
+        options = self._firefox_options(headless)
+        
+        with timing.phase('resolve'):
+            service = FirefoxService(self.resolver.resolve('firefox'))
+        return self._start_session(webdriver.Firefox, service, options, timing)
+    
+    def _create_edge_driver(self, headless: bool, timing: StartupTiming) -> webdriver.Edge:
+        """Create Edge WebDriver instance."""
+        options = self._edge_options(headless)
+        
+        with timing.phase('resolve'):
+            service = EdgeService(self.resolver.resolve('edge'))
+        return self._start_session(webdriver.Edge, service, options, timing)
+    
+    def _create_remote_driver(self, browser: str, headless: bool,
+                              timing: StartupTiming) -> webdriver.Remote:
+        """
+        Create a session on the Selenium Grid from remote.url.
+        
+        Commands go through a GridConnection, which keeps connections
+        alive and records per-command latency.
+        """
+        options_builders = {
+            'chrome': self._chrome_options,
+            'firefox': self._firefox_options,
+            'edge': self._edge_options,
+        }
+        options = options_builders[browser](headless)
+        
+        with timing.phase('connect'):
+            executor = GridConnection(self.config.remote)
+        with timing.phase('session'):
+            return webdriver.Remote(command_executor=executor, options=options)
+    
+    # =========================================================================
+    # BROWSER OPTIONS
+    # =========================================================================
+    
+    def _chrome_options(self, headless: bool) -> ChromeOptions:
+        """Build Chrome options from config."""
         options = ChromeOptions()
         
         if headless:
             options.add_argument('--headless=new')
+        options.page_load_strategy = self.config.browser.page_load_strategy
             
         # Add Chrome options from config
-        chrome_options = self.config.get('browser', {}).get('chrome_options', [])
-        for opt in chrome_options:
+        for opt in self.config.browser.chrome_options:
             options.add_argument(opt)
             
         # Common options for stability
@@ -117,44 +251,68 @@ class DriverFactory:
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-gpu')
         
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        # Performance log for resource blocking report
+        self.resource_blocker.configure_options(options)
+        return options
     
-    def _create_firefox_driver(self, headless: bool) -> webdriver.Firefox:
-        """Create Firefox WebDriver instance."""
+    def _firefox_options(self, headless: bool) -> FirefoxOptions:
+        """Build Firefox options from config."""
         options = FirefoxOptions()
         
         if headless:
             options.add_argument('--headless')
-            
-        service = FirefoxService(GeckoDriverManager().install())
-        return webdriver.Firefox(service=service, options=options)
+        options.page_load_strategy = self.config.browser.page_load_strategy
+        return options
     
-    def _create_edge_driver(self, headless: bool) -> webdriver.Edge:
-        """Create Edge WebDriver instance."""
+    def _edge_options(self, headless: bool) -> EdgeOptions:
+        """Build Edge options from config."""
         options = EdgeOptions()
         
         if headless:
             options.add_argument('--headless')
-            
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        return webdriver.Edge(service=service, options=options)
+        options.page_load_strategy = self.config.browser.page_load_strategy
+        return options
     
-    def _configure_driver(self):
+    @staticmethod
+    def _start_session(driver_class, service, options, timing: StartupTiming) -> webdriver.Remote:
+        """
+        Start the driver process and negotiate a session.
+        
+        The driver constructor does both; service.start is wrapped so the
+        process spawn is recorded separately from session negotiation.
+        """
+        start_service = service.start
+        
+        def timed_start(*args, **kwargs):
+            with timing.phase('spawn'):
+                return start_service(*args, **kwargs)
+        
+        service.start = timed_start
+        with timing.phase('session'):
+            driver = driver_class(service=service, options=options)
+        timing.phases['session'] -= timing.phases.get('spawn', 0.0)
+        return driver
+    
+    def _configure_driver(self, driver: webdriver.Remote, timing: StartupTiming):
         """Configure driver with timeouts and window settings."""
-        browser_config = self.config.get('browser', {})
+        browser_config = self.config.browser
         
         # Set implicit wait
-        implicit_wait = browser_config.get('implicit_wait', 10)
-        self.driver.implicitly_wait(implicit_wait)
+        with timing.phase('implicit_wait'):
+            driver.implicitly_wait(browser_config.implicit_wait)
         
         # Set page load timeout
-        page_load_timeout = browser_config.get('page_load_timeout', 30)
-        self.driver.set_page_load_timeout(page_load_timeout)
+        with timing.phase('page_load_timeout'):
+            driver.set_page_load_timeout(browser_config.page_load_timeout)
+        
+        # Set script timeout (bounds event-driven waits, see WaitPolicy)
+        with timing.phase('script_timeout'):
+            driver.set_script_timeout(self.config.timeouts.script)
         
         # Maximize window if configured
-        if browser_config.get('maximize', True):
-            self.driver.maximize_window()
+        if browser_config.maximize:
+            with timing.phase('maximize'):
+                driver.maximize_window()
     
     def get_base_url(self, environment: Optional[str] = None) -> str:
         """
@@ -166,12 +324,11 @@ class DriverFactory:
         Returns:
             Base URL string
         """
-        env = environment or self.config.get('default_environment', 'dev')
-        environments = self.config.get('environments', {})
-        return environments.get(env, {}).get('base_url', 'https://www.saucedemo.com')
+        return self.config.base_url(environment)
     
     def quit_driver(self):
-        """Safely quit the WebDriver instance."""
+        """Safely quit the WebDriver instance (and any prefetched session)."""
+        self.disable_prefetch()
         if self.driver:
             try:
                 self.driver.quit()
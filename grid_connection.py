@@ -0,0 +1,162 @@
+"""
+Grid Connection Module
+======================
+WebDriver command channel for Selenium Grid / standalone servers.
+
+Every find_element or click against a grid is an HTTP round trip, so the
+command connection keeps HTTP connections alive in a sized urllib3 pool
+and measures the latency of every command it sends.
+
+Each session owns its own connection pool and the pool never blocks when
+all connections are busy, so concurrent sessions never wait on each other.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from config_loader import RemoteConfig
+from startup_timing import percentile
+
+
+class CommandLatencyStats:
+    """
+    Latency of WebDriver commands sent to a grid.
+
+    Features:
+    - Thread-safe recording from any number of sessions
+    - p50/p95/max overall and per command
+    - JSON export and merge (parallel workers)
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, command: str, seconds: float):
+        """Record one command round trip."""
+        with self._lock:
+            self.samples.setdefault(command, []).append(seconds)
+
+    def summary(self) -> Dict:
+        """
+        Summarize recorded latencies.
+
+        Returns:
+            Dictionary with overall and per-command count, total, p50, p95, max
+        """
+        with self._lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+
+        def _stats(values: List[float]) -> Dict:
+            return {
+                'count': len(values),
+                'total': sum(values),
+                'p50': percentile(values, 50),
+                'p95': percentile(values, 95),
+                'max': max(values, default=0.0),
+            }
+
+        everything = [value for values in samples.values() for value in values]
+        return {
+            'overall': _stats(everything),
+            'commands': {name: _stats(values) for name, values in samples.items()},
+        }
+
+    def format_summary(self, top: int = 5) -> List[str]:
+        """
+        Return human readable lines: overall, then the slowest commands by total time.
+
+        Args:
+            top: Number of commands to list
+        """
+        data = self.summary()
+        overall = data['overall']
+        if not overall['count']:
+            return []
+        lines = [f"commands={overall['count']} p50={overall['p50'] * 1000:.1f}ms "
+                 f"p95={overall['p95'] * 1000:.1f}ms max={overall['max'] * 1000:.1f}ms"]
+        ranked = sorted(data['commands'].items(), key=lambda item: item[1]['total'], reverse=True)
+        for name, stats in ranked[:top]:
+            lines.append(f"{name}: n={stats['count']} total={stats['total']:.3f}s "
+                         f"p50={stats['p50'] * 1000:.1f}ms p95={stats['p95'] * 1000:.1f}ms")
+        return lines
+
+    def write_json(self, path: str):
+        """Write raw samples and the summary to a JSON file."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+        with open(path, 'w') as file:
+            json.dump({'samples': samples, 'summary': self.summary()}, file, indent=2)
+
+    def merge_json(self, path: str):
+        """Add samples from a file written by write_json (e.g. a worker)."""
+        with open(path, 'r') as file:
+            data = json.load(file)
+        with self._lock:
+            for name, values in data.get('samples', {}).items():
+                self.samples.setdefault(name, []).extend(values)
+
+
+class GridConnection(RemoteConnection):
+    """
+    RemoteConnection with a sized keep-alive pool and latency measurement.
+
+    Features:
+    - Persistent HTTP connections (keep-alive)
+    - urllib3 pool of remote.pool_maxsize connections, non-blocking
+    - Per-command latency recorded into CommandLatencyStats
+    """
+
+    def __init__(self, settings: RemoteConfig,
+                 latency: Optional[CommandLatencyStats] = None):
+        """
+        Initialize GridConnection.
+
+        Args:
+            settings: remote section of config.yaml
+            latency: Statistics to record into (defaults to the shared one)
+        """
+        self.pool_maxsize = max(settings.pool_maxsize, 1)
+        self.latency = latency or get_latency_stats()
+        super().__init__(client_config=ClientConfig(
+            remote_server_addr=settings.url,
+            keep_alive=settings.keep_alive,
+            timeout=settings.timeout,
+        ))
+
+    def _get_connection_manager(self):
+        """Size the pool; block=False opens an extra connection instead of waiting."""
+        manager = super()._get_connection_manager()
+        manager.connection_pool_kw.update(maxsize=self.pool_maxsize, block=False)
+        return manager
+
+    def execute(self, command, params):
+        """Send a command and record its round trip time."""
+        start = time.perf_counter()
+        try:
+            return super().execute(command, params)
+        finally:
+            self.latency.record(command, time.perf_counter() - start)
+
+
+_latency_stats = CommandLatencyStats()
+
+
+def get_latency_stats() -> CommandLatencyStats:
+    """
+    Get the process-wide CommandLatencyStats.
+
+    Returns:
+        Shared statistics instance
+    """
+    return _latency_stats
@@ -0,0 +1,484 @@
+"""
+Locator Benchmark Module
+========================
+Audits every locator in basics/locators.py and the Sauce Demo page objects.
+
+Locators are loaded from the class constants (and static methods that
+return a locator, sampled with a product name), then:
+
+- checked against static rules (XPath, text() matching, exact @class
+  comparisons that break on whitespace changes)
+- resolved against the live site or saved HTML pages: match count and
+  in-page lookup time (one script call per page for all locators), plus
+  the WebDriver round trip of find_elements
+- compared with alternative strategies built from the first matched
+  element (id, data-test, class, name); an alternative that matches the
+  exact same elements faster is suggested
+
+Results go to a JSON report. --fail-on and --baseline turn flags and
+slowdowns against a previous report into a non-zero exit code, so the
+report can gate CI.
+
+Usage:
+    python locator_benchmark.py                     # live site, headless Chrome
+    python locator_benchmark.py --saved-page cart.html
+    python locator_benchmark.py --static            # rule checks only, no browser
+    python locator_benchmark.py --fail-on slow regressed --baseline old.json
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import argparse
+import importlib.util
+import inspect
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config_loader import get_config
+
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+SELENIUM_DIR = os.path.join(REPO_ROOT, '02-Automation-Testing', 'Selenium_Python')
+BASICS_LOCATORS = os.path.join(SELENIUM_DIR, 'basics', 'locators.py')
+SAUCEDEMO_DIR = os.path.join(SELENIUM_DIR, 'projects', 'saucedemo_automation')
+DEFAULT_REPORT = os.path.join(SAUCEDEMO_DIR, 'reports', 'locator_report.json')
+
+STRATEGIES = {By.ID, By.NAME, By.CLASS_NAME, By.CSS_SELECTOR, By.TAG_NAME, By.XPATH}
+
+# Arguments used to sample static methods that build locators
+SAMPLE_ARGUMENTS = {'product_name': 'Sauce Labs Backpack'}
+
+# Pages without a URL constant (e.g. product details) are looked up here too
+EXTRA_PATHS = ['/inventory-item.html?id=4']
+
+# Locators meant to match one element per product / cart row
+MULTI_MATCH_NAMES = {
+    'INVENTORY_ITEM', 'ITEM_NAME', 'ITEM_DESCRIPTION', 'ITEM_PRICE', 'ITEM_IMAGE',
+    'CART_ITEM', 'CART_QUANTITY', 'CART_ITEM_LABEL', 'REMOVE_BUTTON',
+}
+
+# Measure lookups this many times in the page; report the mean
+DEFAULT_ITERATIONS = 50
+
+# Baseline comparisons ignore differences below this (timer resolution)
+NOISE_FLOOR_MS = 0.02
+
+
+# =============================================================================
+# LOCATORS
+# =============================================================================
+
+@dataclass(slots=True)
+class LocatorEntry:
+    """One locator and everything measured about it."""
+    source: str
+    owner: str
+    name: str
+    by: str
+    value: str
+    urls: List[str] = field(default_factory=list)
+    page: Optional[str] = None
+    matches: Optional[int] = None
+    query_ms: Optional[float] = None
+    roundtrip_ms: Optional[float] = None
+    error: Optional[str] = None
+    flags: List[str] = field(default_factory=list)
+    suggestion: Optional[Dict] = None
+    notes: List[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Stable identifier across reports."""
+        return f"{self.source}:{self.owner}.{self.name}"
+
+
+def _is_locator(value) -> bool:
+    """True for (By.<strategy>, 'value') tuples."""
+    return (isinstance(value, tuple) and len(value) == 2
+            and value[0] in STRATEGIES and isinstance(value[1], str))
+
+
+def _import_pages():
+    """Import the Sauce Demo page objects package."""
+    if SAUCEDEMO_DIR not in sys.path:
+        sys.path.insert(0, SAUCEDEMO_DIR)
+    import pages
+    return pages
+
+
+def _class_locators(cls, source: str) -> List[LocatorEntry]:
+    """Locator constants and sampled locator-building static methods of a class."""
+    urls = [value for name, value in vars(cls).items()
+            if name.endswith('URL') and isinstance(value, str)]
+    entries = []
+    for name, value in vars(cls).items():
+        if name == 'READY_LOCATOR':
+            continue  # alias of another constant
+        if isinstance(value, staticmethod):
+            function = value.__func__
+            parameters = inspect.signature(function).parameters
+            if not parameters or any(param not in SAMPLE_ARGUMENTS for param in parameters):
+                continue
+            value = function(**{param: SAMPLE_ARGUMENTS[param] for param in parameters})
+            name = f"{name}()"
+        if _is_locator(value):
+            entries.append(LocatorEntry(source, cls.__name__, name, value[0], value[1],
+                                        urls=list(urls)))
+    return entries
+
+
+def collect_locators() -> List[LocatorEntry]:
+    """
+    Load every locator from basics/locators.py and the page objects.
+
+    Returns:
+        List of LocatorEntry
+    """
+    entries = []
+
+    spec = importlib.util.spec_from_file_location('basics_locators', BASICS_LOCATORS)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    source = os.path.relpath(BASICS_LOCATORS, REPO_ROOT)
+    for _, cls in inspect.getmembers(module, inspect.isclass):
+        if cls.__module__ == module.__name__:
+            entries.extend(_class_locators(cls, source))
+
+    pages = _import_pages()
+    for _, cls in inspect.getmembers(pages, inspect.isclass):
+        if issubclass(cls, pages.BasePage) and cls is not pages.BasePage:
+            source = os.path.relpath(inspect.getsourcefile(cls), REPO_ROOT)
+            entries.extend(_class_locators(cls, source))
+    return entries
+
+
+# =============================================================================
+# STATIC RULES
+# =============================================================================
+
+SIMPLE_XPATH = re.compile(r"^//([\w-]+|\*)\[@([\w-]+)=['\"]([^'\"]*)['\"]\]$")
+CLASS_EQUALITY = re.compile(r"@class\s*=\s*['\"]([^'\"]*)['\"]")
+
+
+def check_static(entry: LocatorEntry):
+    """Apply rule-based checks (no browser needed)."""
+    if entry.by != By.XPATH:
+        return
+    entry.flags.append('xpath')
+
+    if 'text()' in entry.value:
+        entry.flags.append('text-match')
+        entry.notes.append("text() scans every candidate node and breaks on copy changes; "
+                           "locate by id/data-test or match text in one read_many call")
+
+    for class_value in CLASS_EQUALITY.findall(entry.value):
+        if 'class-equality' not in entry.flags:
+            entry.flags.append('class-equality')
+        if class_value != class_value.strip():
+            entry.flags.append('class-whitespace')
+            entry.notes.append(f"@class='{class_value}' depends on surrounding whitespace "
+                               f"in the class attribute")
+        else:
+            entry.notes.append(f"@class='{class_value}' fails as soon as another class is added")
+
+    match = SIMPLE_XPATH.match(entry.value)
+    if match:
+        tag, attribute, value = match.groups()
+        tag = '' if tag == '*' else tag
+        if attribute == 'id':
+            entry.suggestion = {'by': By.ID, 'value': value, 'reason': 'static rewrite'}
+        elif attribute == 'class':
+            css = tag + ''.join(f".{name}" for name in value.split())
+            entry.suggestion = {'by': By.CSS_SELECTOR, 'value': css, 'reason': 'static rewrite'}
+        else:
+            entry.suggestion = {'by': By.CSS_SELECTOR, 'value': f"{tag}[{attribute}='{value}']",
+                                'reason': 'static rewrite'}
+
+
+# =============================================================================
+# LIVE MEASUREMENT
+# =============================================================================
+
+def _benchmark_script() -> str:
+    """In-page script measuring all locators of one page (uses the page-object query helper)."""
+    return _import_pages().scripts.LOCATOR_QUERY_JS + """
+var locators = arguments[0], iterations = arguments[1];
+function timed(by, value) {
+    var start = performance.now(), nodes = [];
+    for (var i = 0; i < iterations; i++) { nodes = query(document, by, value, true); }
+    return [nodes, (performance.now() - start) / iterations];
+}
+function sameNodes(a, b) {
+    if (a.length !== b.length) { return false; }
+    for (var i = 0; i < a.length; i++) { if (a[i] !== b[i]) { return false; } }
+    return true;
+}
+function alternatives(element) {
+    var list = [];
+    if (element.id) { list.push(['id', element.id]); }
+    var dataTest = element.getAttribute('data-test');
+    if (dataTest) { list.push(['css selector', '[data-test="' + dataTest + '"]']); }
+    for (var i = 0; i < element.classList.length; i++) { list.push(['class name', element.classList[i]]); }
+    var name = element.getAttribute('name');
+    if (name) { list.push(['name', name]); }
+    return list;
+}
+return locators.map(function (locator) {
+    var measured;
+    try { measured = timed(locator.by, locator.value); }
+    catch (error) { return {matches: 0, query_ms: null, error: String(error.message || error), candidates: []}; }
+    var nodes = measured[0];
+    var result = {matches: nodes.length, query_ms: measured[1], error: null, candidates: []};
+    if (!nodes.length) { return result; }
+    alternatives(nodes[0]).forEach(function (candidate) {
+        if (candidate[0] === locator.by && candidate[1] === locator.value) { return; }
+        var other = timed(candidate[0], candidate[1]);
+        if (sameNodes(other[0], nodes)) {
+            result.candidates.push({by: candidate[0], value: candidate[1], query_ms: other[1]});
+        }
+    });
+    return result;
+});
+"""
+
+
+class LocatorBenchmark:
+    """
+    Resolves locators in a browser and measures them.
+
+    Each page is opened once; all locators still unresolved for that page
+    are measured with a single script call.
+    """
+
+    def __init__(self, driver, iterations: int = DEFAULT_ITERATIONS, roundtrips: int = 3):
+        """
+        Initialize LocatorBenchmark.
+
+        Args:
+            driver: WebDriver instance
+            iterations: In-page lookups per locator
+            roundtrips: find_elements calls per matched locator
+        """
+        self.driver = driver
+        self.iterations = iterations
+        self.roundtrips = roundtrips
+        self.script = _benchmark_script()
+
+    def open(self, url: str):
+        """Open a page and wait for it to finish loading."""
+        self.driver.get(url)
+        WebDriverWait(self.driver, 10).until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete")
+
+    def measure_page(self, page: str, entries: List[LocatorEntry]):
+        """
+        Measure locators on the current page.
+
+        Entries that match are resolved (page, match count, timings and
+        alternatives); the others keep waiting for a later page.
+        """
+        payload = [{'by': entry.by, 'value': entry.value} for entry in entries]
+        results = self.driver.execute_script(self.script, payload, self.iterations)
+        for entry, result in zip(entries, results):
+            if not result['matches'] and entry.page is not None:
+                continue  # keep the first page it was measured on
+            entry.page = page
+            entry.error = result['error']
+            entry.matches = result['matches']
+            entry.query_ms = result['query_ms']
+            if not entry.matches:
+                continue
+            entry.roundtrip_ms = self._roundtrip(entry)
+            faster = [candidate for candidate in result['candidates']
+                      if candidate['query_ms'] < entry.query_ms * 0.8]
+            if faster:
+                best = min(faster, key=lambda candidate: candidate['query_ms'])
+                entry.suggestion = dict(best, reason='same elements, faster lookup')
+
+    def _roundtrip(self, entry: LocatorEntry) -> float:
+        """Median WebDriver find_elements latency in milliseconds."""
+        samples = []
+        for _ in range(self.roundtrips):
+            start = time.perf_counter()
+            self.driver.find_elements(entry.by, entry.value)
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
+
+
+def run_live(driver, entries: List[LocatorEntry], base_url: str, **options):
+    """
+    Measure locators on the live site.
+
+    The login page is measured first, then standard_user logs in and adds
+    one product so cart and checkout pages have rows to match. Locators
+    of states that are not set up (error messages, other products' remove
+    buttons) are reported as not-found.
+    """
+    pages = _import_pages()
+    benchmark = LocatorBenchmark(driver, **options)
+    urls = sorted({url for entry in entries for url in entry.urls},
+                  key=lambda url: (url.rstrip('/') != base_url.rstrip('/'), url))
+    urls += [base_url.rstrip('/') + path for path in EXTRA_PATHS]
+
+    for index, url in enumerate(urls):
+        if index == 1:
+            credentials = get_config().test_users.get('standard_user')
+            pages.LoginPage(driver).login(credentials.username, credentials.password)
+            pages.InventoryPage(driver).add_bike_light_to_cart()
+        benchmark.open(url)
+        pending = [entry for entry in entries
+                   if not entry.matches and (not entry.urls or url in entry.urls)]
+        if pending:
+            benchmark.measure_page(url, pending)
+
+
+def run_saved(driver, entries: List[LocatorEntry], paths: List[str], **options):
+    """Measure locators against saved HTML pages (first page with a match wins)."""
+    benchmark = LocatorBenchmark(driver, **options)
+    for path in paths:
+        benchmark.open('file://' + os.path.abspath(path))
+        pending = [entry for entry in entries if not entry.matches]
+        if pending:
+            benchmark.measure_page(path, pending)
+
+
+def check_measured(entry: LocatorEntry, slow_ms: float):
+    """Flag locators based on measurements."""
+    if entry.error:
+        entry.flags.append('error')
+    elif not entry.matches:
+        entry.flags.append('not-found')
+    elif entry.matches > 1 and entry.name not in MULTI_MATCH_NAMES:
+        entry.flags.append('ambiguous')
+    if entry.query_ms is not None and entry.query_ms > slow_ms:
+        entry.flags.append('slow')
+    if entry.suggestion and 'query_ms' in entry.suggestion:
+        entry.flags.append('faster-alternative')
+
+
+def check_baseline(entries: List[LocatorEntry], baseline_path: str, factor: float):
+    """Flag locators whose lookup time grew by more than factor against a previous report."""
+    with open(baseline_path, 'r') as file:
+        baseline = {item['key']: item for item in json.load(file).get('locators', [])}
+    for entry in entries:
+        previous = baseline.get(entry.key)
+        if not previous or previous.get('query_ms') is None or entry.query_ms is None:
+            continue
+        if entry.query_ms > max(previous['query_ms'] * factor,
+                                previous['query_ms'] + NOISE_FLOOR_MS):
+            entry.flags.append('regressed')
+            entry.notes.append(f"lookup {previous['query_ms']:.4f}ms -> {entry.query_ms:.4f}ms")
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def build_report(entries: List[LocatorEntry], mode: str, settings: Dict) -> Dict:
+    """Assemble the machine-readable report."""
+    by_flag: Dict[str, int] = {}
+    for entry in entries:
+        for flag in entry.flags:
+            by_flag[flag] = by_flag.get(flag, 0) + 1
+    return {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'mode': mode,
+        'settings': settings,
+        'summary': {
+            'locators': len(entries),
+            'flagged': sum(1 for entry in entries if entry.flags),
+            'by_flag': by_flag,
+        },
+        'locators': [dict(asdict(entry), key=entry.key) for entry in entries],
+    }
+
+
+def format_entry(entry: LocatorEntry) -> str:
+    """One console line for a flagged locator."""
+    timing = f" {entry.query_ms:.4f}ms" if entry.query_ms is not None else ''
+    line = (f"{entry.owner}.{entry.name} ({entry.by}={entry.value!r}){timing} "
+            f"[{', '.join(entry.flags)}]")
+    if entry.suggestion:
+        line += f"\n    suggest: ({entry.suggestion['by']!r}, {entry.suggestion['value']!r})"
+    for note in entry.notes:
+        line += f"\n    note: {note}"
+    return line
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point. Returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        description='Audit and benchmark Selenium locators of the portfolio projects.')
+    parser.add_argument('--static', action='store_true',
+                        help='Only apply rule checks (no browser)')
+    parser.add_argument('--saved-page', action='append', default=[],
+                        help='Saved HTML page to resolve locators against (repeatable)')
+    parser.add_argument('--browser', default='chrome')
+    parser.add_argument('--headed', action='store_true', help='Show the browser')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument('--slow-ms', type=float, default=0.5,
+                        help='In-page lookup time that flags a locator as slow')
+    parser.add_argument('--baseline', help='Previous report to detect regressions against')
+    parser.add_argument('--regression-factor', type=float, default=1.5)
+    parser.add_argument('--fail-on', nargs='*', default=[],
+                        help='Exit with 1 if any locator has one of these flags')
+    parser.add_argument('--output', default=DEFAULT_REPORT)
+    args = parser.parse_args(argv)
+
+    entries = collect_locators()
+    for entry in entries:
+        check_static(entry)
+
+    mode = 'static'
+    if not args.static:
+        from driver_setup import DriverFactory
+        factory = DriverFactory()
+        driver = factory.create_driver(browser_name=args.browser, headless=not args.headed)
+        try:
+            if args.saved_page:
+                mode = 'saved'
+                run_saved(driver, entries, args.saved_page, iterations=args.iterations)
+            else:
+                mode = 'live'
+                run_live(driver, entries, factory.get_base_url(), iterations=args.iterations)
+        finally:
+            factory.quit_driver()
+        for entry in entries:
+            check_measured(entry, args.slow_ms)
+        if args.baseline:
+            check_baseline(entries, args.baseline, args.regression_factor)
+
+    settings = {'iterations': args.iterations, 'slow_ms': args.slow_ms,
+                'saved_pages': args.saved_page, 'baseline': args.baseline}
+    report = build_report(entries, mode, settings)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    for entry in entries:
+        if entry.flags:
+            print(format_entry(entry))
+    summary = report['summary']
+    print(f"\n{summary['locators']} locators, {summary['flagged']} flagged "
+          f"{summary['by_flag']} ({mode}) -> {args.output}")
+
+    failing = [entry for entry in entries if set(entry.flags) & set(args.fail_on)]
+    if failing:
+        print(f"{len(failing)} locators with {', '.join(args.fail_on)} flags")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,11 +10,12 @@ Portfolio: QA Engineer Portfolio
 
 import os
 import logging
-import yaml
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from typing import Optional
 
+from config_loader import LoggingConfig, get_config
+
 
 class TestLogger:
     """
@@ -29,49 +30,30 @@ class TestLogger:
     
     _instances = {}
     
-    def __new__(cls, name: str = 'TestLogger', config_path: str = 'config.yaml'):
+    def __new__(cls, name: str = 'TestLogger', config_path: Optional[str] = None):
         """Singleton pattern - one logger per name."""
         if name not in cls._instances:
             instance = super().__new__(cls)
             cls._instances[name] = instance
         return cls._instances[name]
     
-    def __init__(self, name: str = 'TestLogger', config_path: str = 'config.yaml'):
+    def __init__(self, name: str = 'TestLogger', config_path: Optional[str] = None):
         """
         Initialize the logger with configuration.
         
         Args:
             name: Logger name
             config_path: Path to YAML configuration file
+                         (defaults to the repository config.yaml)
         """
         if hasattr(self, '_initialized'):
             return
             
         self._initialized = True
         self.name = name
-        self.config = self._load_config(config_path)
+        self.config: LoggingConfig = get_config(config_path).logging
         self.logger = self._setup_logger()
         
-    def _load_config(self, config_path: str) -> dict:
-        """Load logging configuration from YAML file."""
-        try:
-            with open(config_path, 'r') as file:
-                config = yaml.safe_load(file)
-                return config.get('logging', self._get_default_config())
-        except FileNotFoundError:
-            return self._get_default_config()
-    
-    def _get_default_config(self) -> dict:
-        """Return default logging configuration."""
-        return {
-            'level': 'INFO',
-            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            'file_name': 'test_execution.log',
-            'log_dir': 'logs',
-            'max_bytes': 10485760,  # 10MB
-            'backup_count': 5
-        }
-    
     def _setup_logger(self) -> logging.Logger:
         """Configure and return logger instance."""
         logger = logging.getLogger(self.name)
@@ -80,15 +62,11 @@ class TestLogger:
         logger.handlers = []
         
         # Set log level
-        level = getattr(logging, self.config.get('level', 'INFO').upper())
+        level = getattr(logging, self.config.level.upper())
         logger.setLevel(level)
         
         # Create formatters
-        log_format = self.config.get(
-            'format', 
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        formatter = logging.Formatter(log_format)
+        formatter = logging.Formatter(self.config.format)
         
         # Console handler
         console_handler = logging.StreamHandler()
@@ -97,16 +75,16 @@ class TestLogger:
         logger.addHandler(console_handler)
         
         # File handler with rotation
-        log_dir = self.config.get('log_dir', 'logs')
+        log_dir = self.config.log_dir
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
             
-        log_file = os.path.join(log_dir, self.config.get('file_name', 'test_execution.log'))
+        log_file = os.path.join(log_dir, self.config.file_name)
         
         file_handler = RotatingFileHandler(
             log_file,
-            maxBytes=self.config.get('max_bytes', 10485760),
-            backupCount=self.config.get('backup_count', 5)
+            maxBytes=self.config.max_bytes,
+            backupCount=self.config.backup_count
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
@@ -0,0 +1,151 @@
+"""
+Resource Blocking Module
+========================
+Network resource blocking profile for Chrome sessions.
+Uses CDP URL-pattern blocking (Network.setBlockedURLs) to skip images,
+fonts and third-party scripts that functional tests never assert on.
+
+Blocked requests are counted per test from Chrome's performance log.
+Blocked bytes are an estimate based on sizes measured for the same URLs
+when they were loaded unblocked (opted-out tests), kept in a size table
+that is saved between runs. Requests whose size was never measured are
+counted as unknown instead of as 0 bytes.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+from selenium import webdriver
+
+from config_loader import BlockResourcesConfig
+
+
+class ResourceBlocker:
+    """
+    Applies the browser.block_resources profile from config.yaml.
+
+    Features:
+    - CDP URL-pattern blocking per session
+    - Per-test opt-out (blocking switched off and back on)
+    - Requests and estimated bytes avoided per test
+    - Measured resource sizes persisted between runs
+    """
+
+    BLOCKED_REASON = 'inspector'
+
+    def __init__(self, settings: Optional[BlockResourcesConfig] = None):
+        """
+        Initialize ResourceBlocker.
+
+        Args:
+            settings: browser.block_resources section of config.yaml
+        """
+        settings = settings or BlockResourcesConfig()
+        self.enabled = settings.enabled
+        self.patterns: List[str] = list(settings.patterns)
+        self.report = settings.report
+        self.totals = {'tests': 0, 'requests': 0, 'bytes': 0, 'unknown_size': 0}
+
+        self._known_sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def configure_options(self, options):
+        """Enable the performance log needed for reporting."""
+        if self.enabled and self.report:
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    def apply(self, driver: webdriver.Remote, enabled: bool = True):
+        """
+        Switch blocking on or off for a session.
+
+        Args:
+            driver: Chrome WebDriver instance
+            enabled: False clears the blocked patterns
+        """
+        if not self.enabled or not hasattr(driver, 'execute_cdp_cmd'):
+            return
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs',
+                               {'urls': self.patterns if enabled else []})
+
+    def collect(self, driver: webdriver.Remote) -> Dict:
+        """
+        Drain the performance log and count blocked requests.
+
+        Args:
+            driver: Chrome WebDriver instance
+
+        Returns:
+            Dictionary with requests, estimated bytes avoided (None when no
+            blocked request has a measured size) and requests of unknown size
+        """
+        result = {'requests': 0, 'bytes': None, 'unknown_size': 0}
+        if not (self.enabled and self.report and hasattr(driver, 'execute_cdp_cmd')):
+            return result
+
+        urls: Dict[str, str] = {}
+        for entry in driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.requestWillBeSent':
+                urls[params.get('requestId')] = params.get('request', {}).get('url', '')
+            elif method == 'Network.loadingFinished':
+                url = urls.get(params.get('requestId'))
+                if url:
+                    with self._lock:
+                        self._known_sizes[url] = int(params.get('encodedDataLength', 0))
+            elif (method == 'Network.loadingFailed'
+                  and params.get('blockedReason') == self.BLOCKED_REASON):
+                result['requests'] += 1
+                size = self._known_sizes.get(urls.get(params.get('requestId'), ''))
+                if size is None:
+                    result['unknown_size'] += 1
+                else:
+                    result['bytes'] = (result['bytes'] or 0) + size
+
+        with self._lock:
+            self.totals['tests'] += 1
+            self.totals['requests'] += result['requests']
+            self.totals['bytes'] += result['bytes'] or 0
+            self.totals['unknown_size'] += result['unknown_size']
+        return result
+
+    def write_json(self, path: str):
+        """Write the measured resource sizes to a JSON file."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._lock:
+            sizes = dict(sorted(self._known_sizes.items()))
+        with open(path, 'w') as file:
+            json.dump({'sizes': sizes}, file, indent=2)
+
+    def load_json(self, path: str):
+        """Start from resource sizes measured in an earlier run (missing file is ignored)."""
+        try:
+            with open(path, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            for url, size in data.get('sizes', {}).items():
+                self._known_sizes.setdefault(url, int(size))
+
+    def format_summary(self) -> str:
+        """Return a one-line human readable summary."""
+        totals = self.totals
+        sized = totals['requests'] - totals['unknown_size']
+        estimate = str(totals['bytes']) if sized or not totals['requests'] else 'unknown'
+        line = (f"tests={totals['tests']} "
+                f"requests avoided={totals['requests']} "
+                f"bytes avoided (est.)={estimate}")
+        if sized and totals['unknown_size']:
+            line += f" (+{totals['unknown_size']} requests of unknown size)"
+        return line
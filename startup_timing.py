@@ -0,0 +1,148 @@
+"""
+Startup Timing Module
+=====================
+Phase-level timing of WebDriver startup.
+
+DriverFactory.create_driver records how long each startup phase took
+(driver resolution, driver process spawn, session negotiation and each
+configuration step). Timings are aggregated across the run with p50/p95
+per browser and written next to the test report.
+
+Author: Muhammad Yasin Asif
+Portfolio: QA Engineer Portfolio
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List
+
+
+@dataclass
+class StartupTiming:
+    """Per-phase durations (seconds) of one driver startup."""
+    browser: str
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total(self) -> float:
+        """Total startup time across all phases."""
+        return sum(self.phases.values())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block of code as a named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def to_dict(self) -> Dict:
+        """Serialize to a plain dictionary."""
+        return {'browser': self.browser, 'phases': dict(self.phases)}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Percentile value (0.0 for no samples)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class StartupTimingCollector:
+    """
+    Aggregates StartupTiming samples across a run.
+
+    Features:
+    - Thread-safe recording
+    - p50/p95 per browser and phase
+    - JSON export and merge (parallel workers)
+    """
+
+    def __init__(self):
+        """Initialize empty collector."""
+        self.samples: List[StartupTiming] = []
+        self._lock = threading.Lock()
+
+    def record(self, timing: StartupTiming):
+        """Add one startup sample."""
+        with self._lock:
+            self.samples.append(timing)
+
+    def summary(self) -> Dict:
+        """
+        Aggregate samples per browser.
+
+        Returns:
+            {browser: {'count': n, 'phases': {phase: {'p50': s, 'p95': s}}}}
+        """
+        with self._lock:
+            samples = list(self.samples)
+
+        by_browser: Dict[str, List[StartupTiming]] = {}
+        for sample in samples:
+            by_browser.setdefault(sample.browser, []).append(sample)
+
+        result = {}
+        for browser, timings in by_browser.items():
+            phase_names = list(dict.fromkeys(name for t in timings for name in t.phases))
+            phases = {}
+            for name in phase_names + ['total']:
+                values = [t.total if name == 'total' else t.phases.get(name, 0.0)
+                          for t in timings]
+                phases[name] = {'p50': percentile(values, 50), 'p95': percentile(values, 95)}
+            result[browser] = {'count': len(timings), 'phases': phases}
+        return result
+
+    def format_summary(self) -> List[str]:
+        """Return one human readable line per browser."""
+        lines = []
+        for browser, data in self.summary().items():
+            parts = [f"{name} p50={stats['p50']:.3f}s p95={stats['p95']:.3f}s"
+                     for name, stats in data['phases'].items()]
+            lines.append(f"{browser} (n={data['count']}): " + ' | '.join(parts))
+        return lines
+
+    def write_json(self, path: str):
+        """Write raw samples and the summary to a JSON file."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._lock:
+            samples = [sample.to_dict() for sample in self.samples]
+        with open(path, 'w') as file:
+            json.dump({'samples': samples, 'summary': self.summary()}, file, indent=2)
+
+    def merge_json(self, path: str):
+        """Add samples from a file written by write_json (e.g. a worker)."""
+        with open(path, 'r') as file:
+            data = json.load(file)
+        for sample in data.get('samples', []):
+            self.record(StartupTiming(sample['browser'], sample['phases']))
+
+
+_collector = StartupTimingCollector()
+
+
+def get_collector() -> StartupTimingCollector:
+    """
+    Get the process-wide StartupTimingCollector.
+
+    Returns:
+        Shared collector instance
+    """
+    return _collector